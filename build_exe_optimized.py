@@ -76,7 +76,6 @@ def build_exe():
         '--exclude-module=xml',
         '--exclude-module=logging.handlers',
         '--exclude-module=multiprocessing',
-        '--exclude-module=concurrent',
         '--exclude-module=asyncio',
         '--exclude-module=lib2to3',
         '--exclude-module=distutils',
@@ -12,6 +12,11 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson  # 可选依赖：更快的JSON解析
+except ImportError:
+    orjson = None
+
 
 class GUICacheManager:
     """界面缓存管理器，用于保存和恢复界面状态"""
@@ -84,10 +89,14 @@ class GUICacheManager:
         try:
             if os.path.exists(self.cache_file):
                 print(f"[缓存管理器] 正在加载缓存: {self.cache_file}")
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    print(f"[缓存管理器] 缓存加载成功")
-                    return data
+                if orjson is not None:
+                    with open(self.cache_file, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                print(f"[缓存管理器] 缓存加载成功")
+                return data
             else:
                 print(f"[缓存管理器] 缓存文件不存在，使用默认配置")
                 print(f"[缓存管理器] 缓存文件路径: {self.cache_file}")
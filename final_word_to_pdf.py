@@ -14,6 +14,8 @@
 import os
 import sys
 import json
+import queue
+import threading
 from pathlib import Path
 import win32com.client
 import pythoncom
@@ -423,18 +425,45 @@ class FinalWordToPDFConverter:
             print(f"[ERROR] 图片转换失败: {e}")
             return False
 
-def find_word_files(directory, use_template=False):
-    """递归查找所有Word文件，可选择使用模板筛选"""
+def iter_word_files(directory):
+    """递归查找Word文件，逐个产出文件路径"""
     word_extensions = {'.doc', '.docx'}
-    word_files = []
 
     for root, dirs, files in os.walk(directory):
         for file in files:
-            file_path = os.path.join(root, file)
             if Path(file).suffix.lower() in word_extensions:
-                word_files.append(file_path)
+                yield os.path.join(root, file)
+
+def find_word_files(directory, use_template=False):
+    """递归查找所有Word文件，可选择使用模板筛选"""
+    return list(iter_word_files(directory))
+
+_SCAN_DONE = object()  # 后台扫描结束标记
 
-    return word_files
+def scan_in_background(paths):
+    """在后台线程中遍历paths，返回按原顺序逐个取出结果的迭代器
+
+    用于让目录扫描与Office应用程序的启动重叠进行。
+    """
+    file_queue = queue.Queue()
+
+    def producer():
+        try:
+            for path in paths:
+                file_queue.put(path)
+        finally:
+            file_queue.put(_SCAN_DONE)
+
+    threading.Thread(target=producer, daemon=True).start()
+
+    def consumer():
+        while True:
+            path = file_queue.get()
+            if path is _SCAN_DONE:
+                return
+            yield path
+
+    return consumer()
 
 def find_image_files(directory, use_template=False):
     """递归查找所有图片文件，可选择使用模板筛选"""
@@ -468,14 +497,16 @@ def batch_convert_data_folder(gui_mode=False, confirmation_callback=None, templa
         return False
     
     print("[SEARCH] 正在搜索Word文件...")
-    word_files = find_word_files(data_folder)
+    # 目录扫描在后台线程中进行，找到第一个文件后即开始启动Office，
+    # Office启动期间扫描继续进行
+    scanned_files = scan_in_background(iter_word_files(data_folder))
+    first_file = next(scanned_files, None)
 
-    if not word_files:
+    if first_file is None:
         print("[ERROR] 在data文件夹中没有找到任何Word文件")
         return True
     
     # 根据是否使用模板决定处理方式
-    files_to_process = word_files  # 默认处理所有文件
     converter = None
 
     if template_path:
@@ -498,12 +529,21 @@ def batch_convert_data_folder(gui_mode=False, confirmation_callback=None, templa
         else:
             rules_count = len(converter.template_data.get('rules', {}))
             print(f"[OK] 模板加载成功！包含 {rules_count} 条规则\n")
-        
-        if not converter.initialize_word_app():
-            print("[ERROR] 无法启动Office应用程序")
-            print("[TIP] 请确保已安装WPS Office或Microsoft Office")
-            return False
+    else:
+        # 无模板模式，处理所有文件
+        converter = FinalWordToPDFConverter()
 
+    if not converter.initialize_word_app():
+        print("[ERROR] 无法启动Office应用程序")
+        print("[TIP] 请确保已安装WPS Office或Microsoft Office")
+        return False
+
+    # Office启动完成后收集剩余的扫描结果
+    word_files = [first_file]
+    word_files.extend(scanned_files)
+    files_to_process = word_files  # 默认处理所有文件
+
+    if template_path:
         # 筛选符合模板的文件
         filtered_files = []
         print(f"[FILTER] 🔍 开始根据模板筛选文件（共 {len(word_files)} 个文件）...")
@@ -524,13 +564,6 @@ def batch_convert_data_folder(gui_mode=False, confirmation_callback=None, templa
 
         print(f"[INFO] 根据模板筛选后，实际处理 {len(filtered_files)} 个文件\n")
         files_to_process = filtered_files
-    else:
-        # 无模板模式，处理所有文件
-        converter = FinalWordToPDFConverter()
-        if not converter.initialize_word_app():
-            print("[ERROR] 无法启动Office应用程序")
-            print("[TIP] 请确保已安装WPS Office或Microsoft Office")
-            return False
 
     # 显示将要处理的文件列表
     if gui_mode and template_path:
@@ -9,6 +9,7 @@
 
 依赖模块：
 - 标准库: tkinter, threading, queue, sys, os, subprocess, json, fnmatch, pathlib, traceback
+- 可选依赖: orjson（更快的JSON解析，缺失时使用标准库json）、pyperclip（剪贴板，缺失时使用tkinter剪贴板）
 - 项目模块:
   * template_validator.py - 模板验证器
   * cache_manager.py - 缓存管理器
@@ -31,10 +32,28 @@ import queue
 import sys
 import os
 import subprocess
+import shutil
+import builtins
 import json
+import re
 import fnmatch
 from pathlib import Path
 import traceback
+import time
+import copy
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple, OrderedDict
+
+try:
+    import orjson  # 可选依赖：更快的JSON解析
+except ImportError:
+    orjson = None
+
+try:
+    import pyperclip  # 可选依赖：系统剪贴板
+except ImportError:
+    pyperclip = None
 
 # 导入模板验证器
 try:
@@ -52,6 +71,8 @@ except ImportError:
             return False, [f"JSON格式错误: {e}"]
 
 # 获取资源文件的正确路径（支持打包后的exe）
+# 结果只取决于参数和程序基准目录，运行期间不变，因此缓存以免每次加载都重新拼接
+@functools.lru_cache(maxsize=64)
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径，支持开发环境和打包后的exe环境"""
     try:
@@ -63,6 +84,36 @@ def get_resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+def _json_loads(text):
+    """解析JSON文本，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps_pretty(data):
+    """将数据格式化为缩进2格的JSON文本，优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _json_dumps_pretty_bytes(data):
+    """同_json_dumps_pretty，但直接返回UTF-8字节，写文件时省去一次编码"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# 缓存中的模板键名 -> 主界面模板类别
+TEMPLATE_CACHE_KEYS = {
+    "selected_rename_template": "rename",
+    "selected_extract_template": "extract",
+    "selected_word_template": "word",
+    "selected_clean_template": "clean",
+    "selected_material_package_template": "material_package",
+}
+
 # 导入缓存管理器
 try:
     from cache_manager import GUICacheManager
@@ -207,6 +258,9 @@ class MedicalDocProcessor:
         # 当前工作线程
         self.current_thread = None
 
+        # 调试模式（设置环境变量 APP_DEBUG=1 开启），开启后异常日志包含完整堆栈
+        self.debug = os.environ.get('APP_DEBUG') == '1'
+
         # 后台任务状态标志
         self.word_to_pdf_running = False
         self.rename_running = False
@@ -214,21 +268,12 @@ class MedicalDocProcessor:
         self.extract_running = False
         self.unzip_running = False
 
-        # 从缓存中恢复模板选择
+        # 从缓存中恢复模板选择（键为模板类别，值为模板名称）
         templates_cache = self.cache_data.get("templates", {})
-        self.selected_rename_template = templates_cache.get("selected_rename_template")
-        self.selected_extract_template = templates_cache.get("selected_extract_template")
-        self.selected_word_template = templates_cache.get("selected_word_template")
-        self.selected_clean_template = templates_cache.get("selected_clean_template")
-        self.selected_material_package_template = templates_cache.get("selected_material_package_template")
-
-        # 调试信息：打印加载的模板设置（可选）
-        # print(f"[启动] 加载的模板设置:")
-        # print(f"  重命名模板: {self.selected_rename_template}")
-        # print(f"  提取模板: {self.selected_extract_template}")
-        # print(f"  Word转PDF模板: {self.selected_word_template}")
-        # print(f"  清理模板: {self.selected_clean_template}")
-        # print(f"  材料包查找模板: {self.selected_material_package_template}")
+        self.selected = {
+            kind: templates_cache.get(cache_key)
+            for cache_key, kind in TEMPLATE_CACHE_KEYS.items()
+        }
 
         # 当前选择的公司材料包路径
         self.current_package_path = self.cache_data.get("paths", {}).get("current_package_path")
@@ -284,11 +329,8 @@ class MedicalDocProcessor:
         try:
             # 准备模板数据
             templates = {
-                "selected_rename_template": self.selected_rename_template,
-                "selected_extract_template": self.selected_extract_template,
-                "selected_word_template": self.selected_word_template,
-                "selected_clean_template": self.selected_clean_template,
-                "selected_material_package_template": self.selected_material_package_template
+                cache_key: self.selected.get(kind)
+                for cache_key, kind in TEMPLATE_CACHE_KEYS.items()
             }
 
             # 准备路径数据
@@ -345,7 +387,6 @@ class MedicalDocProcessor:
     def load_all_rules(self):
         """加载所有规则模板"""
         try:
-            from pathlib import Path
             
             # 加载重命名规则
             rename_dir = Path(get_resource_path("template/rename_templates"))
@@ -546,14 +587,11 @@ class MedicalDocProcessor:
         self.log_message("开始检查公司材料包结构...")
 
         try:
-            # 导入功能检查器
-            from function_checker import FunctionChecker
-
             # 创建检查器实例，传入日志回调函数
             checker = FunctionChecker(log_callback=self.log_message)
 
             # 获取用户选择的材料包查找规则
-            selected_template = self.selected_material_package_template
+            selected_template = self.selected['material_package']
             if selected_template:
                 self.log_message(f"使用材料包查找规则: {selected_template}")
                 # 运行公司材料包结构检查，使用用户选择的规则
@@ -574,8 +612,8 @@ class MedicalDocProcessor:
 
         except Exception as e:
             self.log_message(f"公司材料包检查失败: {e}")
-            import traceback
-            self.log_message(f"详细错误: {traceback.format_exc()}")
+            if self.debug:
+                self.log_message(f"详细错误: {traceback.format_exc()}")
 
     def select_company_package(self, use_template_rules=None, template_name=None):
         """选择公司材料包目录
@@ -603,11 +641,11 @@ class MedicalDocProcessor:
 
         # 自动判断是否使用模板规则
         if use_template_rules is None:
-            use_template_rules = bool(self.selected_material_package_template)
+            use_template_rules = bool(self.selected['material_package'])
 
         # 如果没有指定模板名称，使用用户选择的模板
         if use_template_rules and not template_name:
-            template_name = self.selected_material_package_template
+            template_name = self.selected['material_package']
 
         # 获取文件夹匹配模式
         folder_patterns = self._get_folder_patterns(use_template_rules, template_name)
@@ -796,7 +834,6 @@ class MedicalDocProcessor:
             message = ' '.join(str(arg) for arg in args)
             self.log_message(message)
 
-        import builtins
         builtins.print = log_print
 
         try:
@@ -825,7 +862,6 @@ class MedicalDocProcessor:
             message = ' '.join(str(arg) for arg in args)
             self.log_message(message)
 
-        import builtins
         builtins.print = log_print
 
         try:
@@ -838,14 +874,14 @@ class MedicalDocProcessor:
     def run_extract(self):
         """运行文件夹提取功能（使用选择的模板）"""
         # 检查是否已选择提取模板
-        if not self.selected_extract_template:
+        if not self.selected['extract']:
             self.log_message("请先在规则管理中选择提取模板")
             # 打开规则管理对话框让用户选择
             rule_dialog = RuleManagerDialog(self.root, self.log_message)
             self.root.wait_window(rule_dialog.dialog)
             return
 
-        self.run_in_thread(self._extract_worker, self.selected_extract_template)
+        self.run_in_thread(self._extract_worker, self.selected['extract'])
     
     def _extract_worker(self, selected_template):
         self.extract_running = True  # 设置提取状态为运行中
@@ -856,7 +892,7 @@ class MedicalDocProcessor:
         self.log_message(f"使用模板: {selected_template}")
 
         # 扫描材料包（使用用户选择的材料包查找规则）
-        selected_package_template = self.selected_material_package_template
+        selected_package_template = self.selected['material_package']
         if selected_package_template:
             self.log_message(f"使用材料包查找规则: {selected_package_template}")
             material_packages = scan_material_packages(selected_package_template)
@@ -874,7 +910,6 @@ class MedicalDocProcessor:
         
         # 清空output文件夹
         if os.path.exists(extractor.output_folder):
-            import shutil
             shutil.rmtree(extractor.output_folder)
             self.log_message("已清空输出文件夹")
         
@@ -889,7 +924,6 @@ class MedicalDocProcessor:
                 message = ' '.join(str(arg) for arg in args)
                 self.log_message(message)
             
-            import builtins
             builtins.print = log_print
             
             try:
@@ -920,27 +954,19 @@ class MedicalDocProcessor:
             message = ' '.join(str(arg) for arg in args)
             self.log_message(message)
 
-        import builtins
         builtins.print = log_print
 
         try:
             # 获取选择的Word转PDF模板路径
             template_path = None
             
-            # 添加调试信息
-            self.log_message(f"检查Word转PDF模板选择...")
-            self.log_message(f"hasattr(self, 'selected_word_template'): {hasattr(self, 'selected_word_template')}")
-            if hasattr(self, 'selected_word_template'):
-                self.log_message(f"self.selected_word_template = {self.selected_word_template}")
-            
-            if hasattr(self, 'selected_word_template') and self.selected_word_template:
+            template_name = self.selected.get('word')
+            if template_name:
                 # 从模板键名构建完整路径（使用get_resource_path支持打包后的exe）
-                template_name = self.selected_word_template
                 relative_path = f"template/word_to_pdf_templates/{template_name}.json"
                 template_path = get_resource_path(relative_path)
                 self.log_message(f"使用Word转PDF规则: {template_name}")
                 self.log_message(f"模板文件路径: {template_path}")
-                self.log_message(f"模板文件是否存在: {os.path.exists(template_path)}")
             else:
                 self.log_message("未选择Word转PDF规则，将处理所有Word文件")
 
@@ -953,8 +979,8 @@ class MedicalDocProcessor:
                 self.log_message("Word转PDF过程中出现问题")
         except Exception as e:
             self.log_message(f"Word转PDF异常: {str(e)}")
-            import traceback
-            self.log_message(f"错误堆栈: {traceback.format_exc()}")
+            if self.debug:
+                self.log_message(f"错误堆栈: {traceback.format_exc()}")
         finally:
             self.word_to_pdf_running = False  # 清除转换状态标志
             builtins.print = original_print
@@ -962,14 +988,14 @@ class MedicalDocProcessor:
     def run_rename(self):
         """运行文件重命名功能（使用选择的模板）"""
         # 检查是否已选择重命名模板
-        if not self.selected_rename_template:
+        if not self.selected['rename']:
             self.log_message("请先在规则管理中选择重命名模板")
             # 打开规则管理对话框让用户选择
             rule_dialog = RuleManagerDialog(self.root, self.log_message)
             self.root.wait_window(rule_dialog.dialog)
             return
 
-        self.run_in_thread(self._rename_worker, self.selected_rename_template)
+        self.run_in_thread(self._rename_worker, self.selected['rename'])
     
     def run_pdf_merge(self):
         """运行PDF合并功能"""
@@ -995,12 +1021,11 @@ class MedicalDocProcessor:
             message = ' '.join(str(arg) for arg in args)
             self.log_message(message)
 
-        import builtins
         builtins.print = log_print
 
         try:
             # 获取用户选择的材料包查找规则
-            selected_package_template = self.selected_material_package_template
+            selected_package_template = self.selected['material_package']
             result = batch_process_all_data(selected_template, gui_mode=True, confirmation_callback=confirmation_callback, material_package_template=selected_package_template)
             if result:
                 self.log_message("文件重命名完成！")
@@ -1051,29 +1076,7 @@ class MedicalDocProcessor:
             ("提取文件夹", lambda: self._extract_worker(default_extract_template)),
         ]
         
-        for i, (step_name, step_func) in enumerate(steps, 1):
-            self.log_message(f"\n{'='*50}")
-            self.log_message(f"步骤 {i}/5: {step_name}")
-            self.log_message(f"{'='*50}")
-
-            try:
-                step_func()
-                self.log_message(f"{step_name} 完成")
-            except Exception as e:
-                self.log_message(f"{step_name} 失败: {e}")
-                # 检查是否是关键步骤失败
-                critical_steps = ["解压ZIP文件", "清理文件夹"]
-                if step_name in critical_steps:
-                    self.log_message(f"关键步骤失败，流程可能无法正常继续")
-                    # 询问用户是否继续
-                    if messagebox.askyesno("警告", f"步骤 '{step_name}' 失败，这是一个关键步骤。\n是否继续执行后续步骤？"):
-                        continue
-                    else:
-                        self.log_message("用户选择停止流程执行")
-                        break
-                else:
-                    # 非关键步骤失败，继续执行
-                    continue
+        self._run_flow_steps(steps)
         
         self.log_message(f"\n完整自动化流程执行完成！")
     
@@ -1110,35 +1113,77 @@ class MedicalDocProcessor:
             "提取文件夹": lambda: self._extract_worker(default_extract_template),
         }
         
-        for i, step_name in enumerate(selected_steps, 1):
+        steps = [(step_name, step_functions.get(step_name)) for step_name in selected_steps]
+        self._run_flow_steps(steps)
+        
+        self.log_message(f"\n自定义自动化流程执行完成！")
+
+    def _run_flow_steps(self, steps):
+        """依次执行流程步骤
+
+        关键步骤失败时每次流程只询问一次是否继续：用户确认继续后，
+        后续关键步骤的失败只记录日志，并在流程结束时汇总。
+        """
+        critical_steps = ("解压ZIP文件", "清理文件夹")
+        failed_critical = []
+        continue_confirmed = False
+
+        for i, (step_name, step_func) in enumerate(steps, 1):
             self.log_message(f"\n{'='*50}")
-            self.log_message(f"步骤 {i}/{len(selected_steps)}: {step_name}")
+            self.log_message(f"步骤 {i}/{len(steps)}: {step_name}")
             self.log_message(f"{'='*50}")
 
+            if step_func is None:
+                self.log_message(f" 未知的步骤: {step_name}")
+                continue
+
             try:
-                if step_name in step_functions:
-                    step_functions[step_name]()
-                    self.log_message(f"{step_name} 完成")
-                else:
-                    self.log_message(f" 未知的步骤: {step_name}")
-                    continue
+                step_func()
+                self.log_message(f"{step_name} 完成")
             except Exception as e:
                 self.log_message(f"{step_name} 失败: {e}")
-                # 检查是否是关键步骤失败
-                critical_steps = ["解压ZIP文件", "清理文件夹"]
-                if step_name in critical_steps:
-                    self.log_message(f"关键步骤失败，流程可能无法正常继续")
-                    # 询问用户是否继续
-                    if messagebox.askyesno("警告", f"步骤 '{step_name}' 失败，这是一个关键步骤。\n是否继续执行后续步骤？"):
-                        continue
-                    else:
-                        self.log_message("用户选择停止流程执行")
-                        break
-                else:
-                    # 非关键步骤失败，继续执行
+                # 非关键步骤失败，继续执行
+                if step_name not in critical_steps:
                     continue
-        
-        self.log_message(f"\n自定义自动化流程执行完成！")
+
+                failed_critical.append(step_name)
+                self.log_message(f"关键步骤失败，流程可能无法正常继续")
+                if continue_confirmed:
+                    continue
+
+                # 询问用户是否继续（整个流程只询问一次）
+                if self._ask_yes_no("警告", f"步骤 '{step_name}' 失败，这是一个关键步骤。\n"
+                                          f"是否继续执行后续步骤？\n\n"
+                                          f"选择继续后，本次流程中其他关键步骤失败将不再询问。"):
+                    continue_confirmed = True
+                else:
+                    self.log_message("用户选择停止流程执行")
+                    break
+
+        if failed_critical:
+            self.log_message(f"共 {len(failed_critical)} 个关键步骤失败: {', '.join(failed_critical)}")
+
+    def _ask_yes_no(self, title, message):
+        """弹出确认对话框并返回结果
+
+        工作线程中调用时，通过root.after把对话框交给Tk主线程显示，
+        并阻塞等待用户的选择。
+        """
+        if threading.current_thread() is threading.main_thread():
+            return messagebox.askyesno(title, message)
+
+        answer = queue.Queue(maxsize=1)
+
+        def ask():
+            # 无论对话框是否成功弹出都要放入结果，否则工作线程会一直阻塞
+            result = False
+            try:
+                result = messagebox.askyesno(title, message)
+            finally:
+                answer.put(result)
+
+        self.root.after(0, ask)
+        return answer.get()
     
     
     def show_check_menu(self):
@@ -1175,9 +1220,6 @@ class MedicalDocProcessor:
         self.log_message(f"开始选择性功能检查（{len(selected_checks)}个项目）...")
         
         try:
-            # 导入功能检查器
-            from function_checker import FunctionChecker
-            
             # 创建检查器实例，传入日志回调函数
             checker = FunctionChecker(log_callback=self.log_message)
             
@@ -1197,8 +1239,8 @@ class MedicalDocProcessor:
                 
         except Exception as e:
             self.log_message(f"选择性检查失败: {e}")
-            import traceback
-            self.log_message(f"详细错误: {traceback.format_exc()}")
+            if self.debug:
+                self.log_message(f"详细错误: {traceback.format_exc()}")
     
     def show_check_help(self):
         """显示检查功能帮助信息"""
@@ -1233,9 +1275,6 @@ Word转PDF功能、文件重命名功能、GUI功能
         self.log_message("开始功能检查...")
         
         try:
-            # 导入功能检查器
-            from function_checker import FunctionChecker
-            
             # 创建检查器实例，传入日志回调函数
             checker = FunctionChecker(log_callback=self.log_message)
             
@@ -1255,15 +1294,12 @@ Word转PDF功能、文件重命名功能、GUI功能
             
             # 退回到基础检查
             try:
-                from environmenst_test import run_full_test
-                
                 # 重定向输出到日志
                 original_print = print
                 def log_print(*args, **kwargs):
                     message = ' '.join(str(arg) for arg in args)
                     self.log_message(message)
                 
-                import builtins
                 builtins.print = log_print
                 
                 try:
@@ -1280,8 +1316,8 @@ Word转PDF功能、文件重命名功能、GUI功能
                 
         except Exception as e:
             self.log_message(f"功能检查失败: {e}")
-            import traceback
-            self.log_message(f"详细错误: {traceback.format_exc()}")
+            if self.debug:
+                self.log_message(f"详细错误: {traceback.format_exc()}")
     
 
     def show_rule_manager(self):
@@ -1323,10 +1359,9 @@ Word转PDF功能、文件重命名功能、GUI功能
                 export_data = {
                     "window": self.cache_manager.get_window_geometry(self.root),
                     "templates": {
-                        "selected_rename_template": self.selected_rename_template,
-                        "selected_extract_template": self.selected_extract_template,
-                        "selected_word_template": self.selected_word_template,
-                        "selected_clean_template": self.selected_clean_template
+                        cache_key: self.selected.get(kind)
+                        for cache_key, kind in TEMPLATE_CACHE_KEYS.items()
+                        if kind != 'material_package'
                     },
                     "paths": {
                         "current_package_path": self.current_package_path
@@ -1396,8 +1431,9 @@ Word转PDF功能、文件重命名功能、GUI功能
                 # 恢复模板设置
                 templates_applied = 0
                 for key, value in templates_info.items():
-                    if value:
-                        setattr(self, key, value)
+                    kind = TEMPLATE_CACHE_KEYS.get(key)
+                    if value and kind:
+                        self.selected[kind] = value
                         templates_applied += 1
 
                 if templates_applied > 0:
@@ -1428,8 +1464,8 @@ Word转PDF功能、文件重命名功能、GUI功能
 
     def run(self):
         """运行主程序"""
-        # 启动时自动恢复缓存设置
-        self._auto_restore_cache_on_startup()
+        # 启动时自动恢复缓存设置（延迟到主窗口绘制之后，避免读取缓存阻塞界面显示）
+        self.root.after(0, self._auto_restore_cache_on_startup)
         self.root.mainloop()
 
     def _auto_restore_cache_on_startup(self):
@@ -1448,16 +1484,19 @@ Word转PDF功能、文件重命名功能、GUI功能
             # 恢复模板设置
             templates_restored = 0
             for key, value in templates.items():
-                if value and hasattr(self, key):
-                    setattr(self, key, value)
+                kind = TEMPLATE_CACHE_KEYS.get(key)
+                # 与当前设置相同的条目无需重复恢复
+                if value and kind and self.selected.get(kind) != value:
+                    self.selected[kind] = value
                     templates_restored += 1
 
             if templates_restored > 0:
                 restored_items.append(f"模板设置 ({templates_restored}项)")
 
             # 恢复路径设置
-            if paths.get("current_package_path") and hasattr(self, "current_package_path"):
-                self.current_package_path = paths["current_package_path"]
+            package_path = paths.get("current_package_path")
+            if package_path and self.current_package_path != package_path:
+                self.current_package_path = package_path
                 restored_items.append("材料包路径")
 
             # 恢复窗口设置
@@ -1522,8 +1561,6 @@ class TemplateSelectionDialog:
     
     def load_templates(self):
         """加载模板文件"""
-        import json
-        from pathlib import Path
         
         template_dir = Path(self.template_folder)
         if not template_dir.exists():
@@ -1618,58 +1655,34 @@ class TemplateSelectionDialog:
         templates_frame = ttk.LabelFrame(self.dialog, text="可用模板", padding=10)
         templates_frame.pack(fill='both', expand=True, padx=20, pady=(0, 10))
         
-        # 创建滚动区域
-        canvas = tk.Canvas(templates_frame)
-        scrollbar = ttk.Scrollbar(templates_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # 单选按钮变量
+        # 模板列表：单个Treeview，每个模板一行（名称/描述/规则数）
+        self.template_tree = ttk.Treeview(templates_frame, columns=('name', 'desc', 'rules'),
+                                          show='headings', selectmode='browse')
+        self.template_tree.heading('name', text='模板名称')
+        self.template_tree.heading('desc', text='描述')
+        self.template_tree.heading('rules', text='规则数')
+        self.template_tree.column('name', width=120, anchor='w')
+        self.template_tree.column('desc', width=190, anchor='w')
+        self.template_tree.column('rules', width=50, anchor='center')
+
+        scrollbar = ttk.Scrollbar(templates_frame, orient="vertical", command=self.template_tree.yview)
+        self.template_tree.configure(yscrollcommand=scrollbar.set)
+
+        # 选中模板变量
         self.template_var = tk.StringVar()
-        
-        # 显示模板选项
-        for template_key, template_info in self.templates.items():
-            # 创建模板选项框架
-            template_frame = ttk.Frame(scrollable_frame)
-            template_frame.pack(fill='x', pady=5)
-
-            # 单选按钮和模板名称
-            rb = ttk.Radiobutton(
-                template_frame,
-                text=template_info.get('name', template_key),
-                variable=self.template_var,
-                value=template_key
-            )
-            rb.pack(anchor='w')
 
-            # 模板描述
-            desc_text = template_info.get('description', '无描述')
-            desc_label = ttk.Label(
-                template_frame,
-                text=f"    {desc_text}",
-                font=('Microsoft YaHei', 9),
-                foreground='gray'
-            )
-            desc_label.pack(anchor='w', padx=(20, 0))
+        # 显示模板选项（以模板键作为行ID）
+        for template_key, template_info in self.templates.items():
+            rules = template_info.get('rules')
+            rule_count = len(rules) if rules is not None else ''
+            self.template_tree.insert('', 'end', iid=template_key, values=(
+                template_info.get('name', template_key),
+                template_info.get('description', '无描述'),
+                rule_count
+            ))
 
-            # 模板统计信息
-            if 'rules' in template_info:
-                rule_count = len(template_info['rules'])
-                stats_text = f"    包含{rule_count}个规则"
-                stats_label = ttk.Label(
-                    template_frame,
-                    text=stats_text,
-                    font=('Microsoft YaHei', 8),
-                    foreground='blue'
-                )
-                stats_label.pack(anchor='w', padx=(20, 0))
+        self.template_tree.bind('<<TreeviewSelect>>', self.on_template_select)
+        self.template_tree.bind('<Double-1>', lambda e: self.ok_clicked())
 
         # 默认选择逻辑：优先选择当前已在主界面中选择的模板，如果没有则选择第一个
         if self.current_selected_template and self.current_selected_template in self.templates:
@@ -1683,8 +1696,13 @@ class TemplateSelectionDialog:
         else:
             # 没有模板的情况已经在上面处理了，这里不应该到达
             print("警告: 没有可用模板")
-        
-        canvas.pack(side="left", fill="both", expand=True)
+
+        current_key = self.template_var.get()
+        if current_key:
+            self.template_tree.selection_set(current_key)
+            self.template_tree.see(current_key)
+
+        self.template_tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # 按钮区域
@@ -1694,6 +1712,12 @@ class TemplateSelectionDialog:
         ttk.Button(button_frame, text="确定", command=self.ok_clicked).pack(side='right')
         ttk.Button(button_frame, text="取消", command=self.cancel_clicked).pack(side='right', padx=(0, 10))
     
+    def on_template_select(self, event=None):
+        """列表选中行变化时同步模板变量"""
+        selection = self.template_tree.selection()
+        if selection:
+            self.template_var.set(selection[0])
+
     def ok_clicked(self):
         """确定按钮点击"""
         selected_key = self.template_var.get()
@@ -1721,7 +1745,9 @@ class CheckSelectionDialog:
         self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 30))
         
         self.selected_checks = []
-        self.check_vars = {}
+        self.check_keys = []  # 检查项目键，顺序与位掩码的位一致
+        self.check_buttons = []  # 与check_keys一一对应的复选框
+        self._mask = 0  # 选中状态位掩码，第i位对应第i个检查项目
         
         self.create_widgets()
     
@@ -1775,9 +1801,8 @@ class CheckSelectionDialog:
             ("GUI功能", "GUI功能", "检查图形界面组件和功能")
         ]
         
-        for display_name, key, description in check_options:
-            var = tk.BooleanVar(value=True)  # 默认全选
-            self.check_vars[key] = var
+        for i, (display_name, key, description) in enumerate(check_options):
+            self.check_keys.append(key)
             
             # 创建每个检查项目的框架
             item_frame = ttk.Frame(scrollable_frame)
@@ -1787,8 +1812,12 @@ class CheckSelectionDialog:
             main_frame = ttk.Frame(item_frame)
             main_frame.pack(fill='x')
             
-            cb = ttk.Checkbutton(main_frame, text=display_name, variable=var)
+            # 不绑定Tcl变量，选中状态由位掩码记录
+            cb = ttk.Checkbutton(main_frame, text=display_name, variable='',
+                                 command=lambda i=i: self._toggle_bit(i))
+            cb.state(['!alternate', 'selected'])  # 默认全选
             cb.pack(anchor='w')
+            self.check_buttons.append(cb)
             
             # 描述文本
             desc_label = ttk.Label(item_frame, text=f"    {description}", 
@@ -1820,33 +1849,53 @@ class CheckSelectionDialog:
         self.stats_label = ttk.Label(button_frame, text="", foreground='blue')
         self.stats_label.pack(side='left')
         
-        # 初始更新统计
+        # 初始更新统计（默认全选）
+        self._stats_pending = False
+        self._mask = self._full_mask()
         self.update_stats()
-        
-        # 绑定事件来更新统计
-        for var in self.check_vars.values():
-            var.trace('w', lambda *args: self.update_stats())
     
+    def _full_mask(self):
+        """全部选中时的位掩码"""
+        return (1 << len(self.check_keys)) - 1
+
+    def _toggle_bit(self, index):
+        """单个复选框点击后翻转对应位"""
+        self._mask ^= 1 << index
+        self._schedule_stats()
+
+    def _apply_mask(self, mask):
+        """设置位掩码并同步复选框显示"""
+        self._mask = mask
+        for i, cb in enumerate(self.check_buttons):
+            cb.state(['selected'] if mask >> i & 1 else ['!selected'])
+        self._schedule_stats()
+    
+    def _schedule_stats(self):
+        """在空闲时更新统计，同一轮事件循环中的多次修改只刷新一次标签"""
+        if not self._stats_pending:
+            self._stats_pending = True
+            self.dialog.after_idle(self.update_stats)
+
     def update_stats(self):
         """更新选中统计"""
-        selected_count = sum(1 for var in self.check_vars.values() if var.get())
-        total_count = len(self.check_vars)
+        self._stats_pending = False
+        if not self.dialog.winfo_exists():
+            return
+        selected_count = bin(self._mask).count('1')
+        total_count = len(self.check_keys)
         self.stats_label.config(text=f"已选择: {selected_count}/{total_count} 项")
     
     def select_all(self):
         """全选"""
-        for var in self.check_vars.values():
-            var.set(True)
+        self._apply_mask(self._full_mask())
     
     def select_none(self):
         """全不选"""
-        for var in self.check_vars.values():
-            var.set(False)
+        self._apply_mask(0)
     
     def invert_selection(self):
         """反选"""
-        for var in self.check_vars.values():
-            var.set(not var.get())
+        self._apply_mask(self._full_mask() ^ self._mask)
     
     def select_recommended(self):
         """选择推荐项目（常用的检查项目）"""
@@ -1855,12 +1904,16 @@ class CheckSelectionDialog:
             "目录结构", "模板文件", "GUI功能"
         }
         
-        for key, var in self.check_vars.items():
-            var.set(key in recommended)
+        mask = 0
+        for i, key in enumerate(self.check_keys):
+            if key in recommended:
+                mask |= 1 << i
+        self._apply_mask(mask)
     
     def ok_clicked(self):
         """确定按钮点击"""
-        self.selected_checks = [key for key, var in self.check_vars.items() if var.get()]
+        self.selected_checks = [key for i, key in enumerate(self.check_keys)
+                                if self._mask >> i & 1]
         if not self.selected_checks:
             messagebox.showwarning("警告", "请至少选择一个检查项目！")
             return
@@ -1886,6 +1939,7 @@ class CustomFlowDialog:
         self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
         
         self.selected_steps = []
+        self.step_vars = {}  # 步骤键 -> 勾选状态变量
         
         self.create_widgets()
     
@@ -1901,7 +1955,6 @@ class CustomFlowDialog:
         steps_frame = ttk.Frame(self.dialog)
         steps_frame.pack(fill='both', expand=True, padx=20)
         
-        self.step_vars = {}
         steps = [
             ("解压ZIP文件", "解压ZIP文件"),
             ("清理文件夹", "清理文件夹"),
@@ -1912,7 +1965,7 @@ class CustomFlowDialog:
         
         for display_name, key in steps:
             var = tk.BooleanVar(value=True)
-            self.step_vars= var
+            self.step_vars[key] = var
             ttk.Checkbutton(steps_frame, text=display_name, variable=var).pack(anchor='w', pady=5)
         
         # 按钮区域
@@ -1948,13 +2001,15 @@ class CustomFlowDialog:
         self.selected_steps = []
         self.dialog.destroy()
 
+# PDF合并列表中的单个文件条目（显示列依次为 name、pages、size）
+PDFFileEntry = namedtuple('PDFFileEntry', ['path', 'name', 'pages', 'size'])
+
+
 class PDFMergeDialog:
     """专用的PDF合并管理对话框"""
     
     def __init__(self, parent, main_window=None, log_callback=None):
-        # 导入需要的模块
-        import os
-        self.os = os  # 保存引用以便在方法中使用
+        self._basename = os.path.basename  # 常用函数的本地引用
 
         self.main_window = main_window  # 保存主窗口引用
         self.dialog = tk.Toplevel(parent)
@@ -1969,14 +2024,33 @@ class PDFMergeDialog:
 
         self.log_callback = log_callback
         self.pdf_files = []  # 保存PDF文件列表
-        self.selected_files = set()  # 保存选中的文件索引
+        self.selected_files = set()  # 保存选中文件的路径（路径唯一，增删移动后无需重映射）
+        self._total_pages = 0  # 列表中所有文件的总页数
+        self._selected_pages = 0  # 选中文件的总页数，随选择变化增量维护
+        self._paths_set = set()  # 已添加文件的路径，用于快速查重
         self.processor = None  # PDF处理器实例
+        self._item_ids = []  # 与pdf_files一一对应的列表行ID
+        self._rendered_rows = []  # 各行当前显示的值，用于增量刷新
+        self._item_index = {}  # 列表行ID到行索引的映射
+        self._tree_dirty = False  # 列表是否有待执行的刷新
+        self._pending_info = []  # 待写入信息区域的消息
+        self._info_flush_scheduled = False  # 是否已安排写入信息区域
+        self._status_after_id = None  # 状态提示自动清除的定时器
+
+        # PDF页数缓存：路径 -> [修改时间(ns), 文件大小, 页数, 格式化大小]，文件未变化时无需重新打开
+        self._info_cache_manager = GUICacheManager("pdf_info_cache.json")
+        self._page_cache = self._info_cache_manager.load_cache().get("pdf_info", {})
+        self._page_cache_dirty = False
+
+        # PyMuPDF不支持多线程并发访问，因此整个对话框只使用一个后台线程依次读取PDF信息，
+        # 多次点击添加时任务排队执行，避免在Tk主线程中打开PDF导致界面卡顿
+        self._load_executor = ThreadPoolExecutor(max_workers=1)
 
         self.create_widgets()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close_dialog)
 
         # 检查PyMuPDF支持
         try:
-            from pdf_merger import PDFProcessor
             self.processor = PDFProcessor()
             if not self.processor.supported:
                 self.show_error("PDF处理功能不可用\n原因: PyMuPDF库未正确加载\n\n解决方案:\n1. 检查PyMuPDF安装: pip install PyMuPDF\n2. 如果是exe版本，请重新构建并确保包含相关依赖")
@@ -1984,9 +2058,6 @@ class PDFMergeDialog:
                 self.add_info("请检查PyMuPDF库安装")
             else:
                 self.add_info("PDF处理功能已准备就绪")
-        except ImportError as e:
-            self.show_error(f"无法导入PDF处理模块\n错误: {str(e)}\n\n请确保所有相关文件都在程序目录中")
-            self.processor = None
         except Exception as e:
             self.show_error(f"PDF处理功能初始化异常\n错误: {str(e)}")
             self.processor = None
@@ -2105,21 +2176,71 @@ class PDFMergeDialog:
         bottom_frame.pack(fill='x', padx=10, pady=5)
         
         ttk.Button(bottom_frame, text="关闭", command=self.close_dialog).pack(side='right')
+
+        # 状态提示（非阻塞的操作提示，代替提示弹窗）
+        self.status_label = ttk.Label(bottom_frame, text="")
+        self.status_label.pack(side='left')
         
         # 初始化信息
         self.add_info("欢迎使用PDF处理工具")
         self.add_info("点击'➕ 添加文件'开始添加PDF文件")
     
     def add_info(self, message):
-        """添加信息到信息显示区域"""
-        self.info_text.insert(tk.END, message + "\n")
-        self.info_text.see(tk.END)
-        self.dialog.update_idletasks()
+        """添加信息到信息显示区域
+
+        消息先放入缓冲区，在空闲时一次性写入文本框，避免逐条插入并强制重绘。
+        """
+        self._pending_info.append(message)
+        if not self._info_flush_scheduled:
+            self._info_flush_scheduled = True
+            self.dialog.after_idle(self._flush_info)
         
         # 同时记录到主程序日志
         if self.log_callback:
             self.log_callback(message)
     
+    def _flush_info(self):
+        """将缓冲的信息一次性写入信息显示区域"""
+        self._info_flush_scheduled = False
+        if not self._pending_info or not self.dialog.winfo_exists():
+            self._pending_info.clear()
+            return
+        self.info_text.insert(tk.END, "\n".join(self._pending_info) + "\n")
+        self.info_text.see(tk.END)
+        self._pending_info.clear()
+
+    def _make_throttled_info(self, interval=0.1):
+        """创建合并进度回调：消息照常缓冲，但至多每interval秒刷新一次界面
+
+        合并在界面线程中同步执行，空闲回调要等合并结束才会运行，
+        因此按时间间隔主动刷新，既能看到进度又不会每条消息都重绘。
+        """
+        last_flush = [time.monotonic()]
+
+        def callback(message):
+            self.add_info(message)
+            now = time.monotonic()
+            if now - last_flush[0] >= interval:
+                last_flush[0] = now
+                self._flush_info()
+                self.dialog.update_idletasks()
+
+        return callback
+
+    def _flash_status(self, message, level='warn'):
+        """在底部状态栏短暂显示提示信息，2秒后自动清除"""
+        colors = {'warn': 'orange', 'info': 'blue'}
+        if self._status_after_id:
+            self.dialog.after_cancel(self._status_after_id)
+        self.status_label.config(text=message, foreground=colors.get(level, 'black'))
+        self._status_after_id = self.dialog.after(2000, self._clear_status)
+
+    def _clear_status(self):
+        """清除状态栏提示"""
+        self._status_after_id = None
+        if self.dialog.winfo_exists():
+            self.status_label.config(text="")
+
     def show_error(self, message):
         """显示错误信息"""
         messagebox.showerror("错误", message)
@@ -2139,96 +2260,197 @@ class PDFMergeDialog:
         if not files:
             return
         
-        self.add_info(f"正在添加 {len(files)} 个文件...")
-        
-        added_count = 0
+        # 跳过已存在的文件，其余文件的PDF信息交给后台线程读取
+        paths = []
         for file_path in files:
-            if self.add_single_file(file_path):
-                added_count += 1
-        
-        if added_count > 0:
-            self.add_info(f"成功添加 {added_count} 个文件")
+            if file_path in self._paths_set:
+                self.add_info(f"文件已存在: {self._basename(file_path)}")
+            else:
+                paths.append(file_path)
+                self._paths_set.add(file_path)  # 先占位，防止读取期间被重复添加
+
+        if not paths:
+            self.add_info("没有添加任何文件")
+            return
+
+        self.add_info(f"正在添加 {len(paths)} 个文件...")
+
+        # 提交到对话框共用的单线程执行器，与之前尚未完成的读取任务串行执行
+        futures = [self._load_executor.submit(self._load_pdf_info, file_path) for file_path in paths]
+        self._collect_pdf_info(paths, futures)
+
+    def _load_pdf_info(self, file_path):
+        """读取PDF信息（在后台线程中执行），文件未变化时直接使用页数缓存
+
+        后台线程只读取页数缓存，新的缓存条目随结果返回，由Tk主线程写入，
+        避免关闭对话框保存缓存时与后台线程同时修改缓存
+
+        Returns:
+            (PDF信息, 新的缓存条目或None)
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self.processor.get_pdf_info(file_path), None
+
+        cached = self._page_cache.get(file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return {
+                'file_name': self._basename(file_path),
+                'page_count': cached[2],
+                'file_size_formatted': cached[3]
+            }, None
+
+        pdf_info = self.processor.get_pdf_info(file_path)
+        cache_entry = None
+        if pdf_info and 'error' not in pdf_info:
+            cache_entry = [stat.st_mtime_ns, stat.st_size,
+                           pdf_info['page_count'], pdf_info['file_size_formatted']]
+        return pdf_info, cache_entry
+
+    def _collect_pdf_info(self, paths, futures):
+        """等待后台读取完成后，在Tk主线程中一次性添加所有文件"""
+        if not all(future.done() for future in futures):
+            self.dialog.after(50, self._collect_pdf_info, paths, futures)
+            return
+
+        try:
+            if not self.dialog.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        new_records = []
+        for file_path, future in zip(paths, futures):
+            try:
+                pdf_info, cache_entry = future.result()
+            except Exception as e:
+                pdf_info, cache_entry = {'error': str(e)}, None
+            if cache_entry is not None:
+                # 在Tk主线程中更新页数缓存
+                self._page_cache[file_path] = cache_entry
+                self._page_cache_dirty = True
+            file_data = self._build_file_entry(file_path, pdf_info)
+            if file_data is None:
+                self._paths_set.discard(file_path)  # 读取失败，释放占位
+            else:
+                new_records.append(file_data)
+
+        # 一次性加入列表并默认选中（占位路径即为正式登记）
+        self.pdf_files.extend(new_records)
+        self.selected_files.update(file_data.path for file_data in new_records)
+        added_pages = sum(file_data.pages for file_data in new_records)
+        self._total_pages += added_pages
+        self._selected_pages += added_pages
+
+        if new_records:
+            self.add_info(f"成功添加 {len(new_records)} 个文件")
             self.update_file_tree()
             self.update_selection_status()
         else:
             self.add_info("没有添加任何文件")
     
-    def add_single_file(self, file_path):
-        """添加单个文件"""
+    def _build_file_entry(self, file_path, pdf_info):
+        """根据读取到的PDF信息生成文件条目
+
+        Args:
+            file_path: PDF文件路径
+            pdf_info: processor.get_pdf_info 的返回结果
+
+        Returns:
+            PDFFileEntry，文件无效时返回None
+        """
         try:
-            # 检查文件是否已经存在
-            for existing_file in self.pdf_files:
-                if existing_file['path'] == file_path:
-                    self.add_info(f"文件已存在: {self.os.path.basename(file_path)}")
-                    return False
-            
-            # 获取PDF文件信息
-            if self.processor:
-                pdf_info = self.processor.get_pdf_info(file_path)
-                if pdf_info and 'error' not in pdf_info:
-                    file_data = {
-                        'path': file_path,
-                        'name': pdf_info['file_name'],
-                        'pages': pdf_info['page_count'],
-                        'size': pdf_info['file_size_formatted']
-                    }
-                    # 添加文件并默认选中
-                    file_index = len(self.pdf_files)
-                    self.pdf_files.append(file_data)
-                    self.selected_files.add(file_index)
-                    return True
-                else:
-                    error_msg = pdf_info.get('error', '未知错误') if pdf_info else '无法读取文件'
-                    self.add_info(f"无效文件: {os.path.basename(file_path)} - {error_msg}")
-                    return False
-            else:
-                self.add_info("PDF处理功能不可用")
-                return False
-                
+            if pdf_info and 'error' not in pdf_info:
+                return PDFFileEntry(
+                    file_path,
+                    pdf_info['file_name'],
+                    pdf_info['page_count'],
+                    pdf_info['file_size_formatted']
+                )
+            error_msg = pdf_info.get('error', '未知错误') if pdf_info else '无法读取文件'
+            self.add_info(f"无效文件: {self._basename(file_path)} - {error_msg}")
         except Exception as e:
-            self.add_info(f"处理文件错误: {os.path.basename(file_path)} - {str(e)}")
-            return False
+            self.add_info(f"处理文件错误: {self._basename(file_path)} - {str(e)}")
+        return None
     
     def update_file_tree(self):
-        """更新文件列表显示"""
-        # 清空列表
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
-        
-        # 添加文件
+        """更新文件列表显示
+
+        保留已有的列表行，只更新内容发生变化的行，并增删数量差异部分，
+        避免每次刷新都清空后重建整个列表。
+        """
+        item_ids = self._item_ids
+        rendered_rows = self._rendered_rows
+        file_count = len(self.pdf_files)
+
+        # 删除多余的行
+        if len(item_ids) > file_count:
+            self.file_tree.delete(*item_ids[file_count:])
+            for item_id in item_ids[file_count:]:
+                del self._item_index[item_id]
+            del item_ids[file_count:]
+            del rendered_rows[file_count:]
+
         for i, file_data in enumerate(self.pdf_files):
             # 选中状态显示
-            selected_mark = "☑️" if i in self.selected_files else "☐️"
-            
-            self.file_tree.insert('', 'end', values=(
-                selected_mark,
-                i + 1,
-                file_data['name'],
-                file_data['pages'],
-                file_data['size']
-            ))
+            selected_mark = "☑️" if file_data.path in self.selected_files else "☐️"
+            row = (selected_mark, i + 1) + file_data[1:]
+
+            if i < len(item_ids):
+                if rendered_rows[i] != row:
+                    self.file_tree.item(item_ids[i], values=row)
+                    rendered_rows[i] = row
+            else:
+                item_id = self.file_tree.insert('', 'end', values=row)
+                item_ids.append(item_id)
+                self._item_index[item_id] = i
+                rendered_rows.append(row)
+
+    def _schedule_refresh(self):
+        """标记列表需要刷新，同一轮事件循环中的多次修改只刷新一次"""
+        if not self._tree_dirty:
+            self._tree_dirty = True
+            self.dialog.after_idle(self._flush_tree)
+
+    def _flush_tree(self):
+        """执行待处理的列表刷新"""
+        if self._tree_dirty:
+            self._tree_dirty = False
+            self.update_file_tree()
+
+    def _update_selected_mark(self, index):
+        """只刷新指定行的选中标记"""
+        selected_mark = "☑️" if self.pdf_files[index].path in self.selected_files else "☐️"
+        self.file_tree.set(self._item_ids[index], 'selected', selected_mark)
+        self._rendered_rows[index] = (selected_mark,) + self._rendered_rows[index][1:]
     
     def remove_selected(self):
         """删除选中的文件"""
         selected_items = self.file_tree.selection()
         if not selected_items:
-            messagebox.showwarning("警告", "请先选择要删除的文件")
+            self._flash_status("请先选择要删除的文件")
             return
         
         # 获取选中的索引
         indices_to_remove = []
         for item in selected_items:
-            index = self.file_tree.index(item)
+            index = self._item_index[item]
             indices_to_remove.append(index)
         
         # 从后往前删除，避免索引错位
         for index in sorted(indices_to_remove, reverse=True):
-            file_name = self.pdf_files[index]['name']
+            file_data = self.pdf_files[index]
+            self._paths_set.discard(file_data.path)
+            if file_data.path in self.selected_files:
+                self.selected_files.remove(file_data.path)
+                self._selected_pages -= file_data.pages
+            self._total_pages -= file_data.pages
             del self.pdf_files[index]
-            self.add_info(f"已删除: {file_name}")
+            self.add_info(f"已删除: {file_data.name}")
         
-        # 更新选中状态（重新映射索引）
-        self.rebuild_selection_indices()
+        # 列表行按位置复用，删除后原选中行会显示其他文件，需先清除选中
+        self.file_tree.selection_remove(*selected_items)
         self.update_file_tree()
         self.update_selection_status()
     
@@ -2240,85 +2462,88 @@ class PDFMergeDialog:
         result = messagebox.askyesno("确认", f"确定要清空所有 {len(self.pdf_files)} 个文件吗？")
         if result:
             self.pdf_files.clear()
+            self._paths_set.clear()
             self.selected_files.clear()
-            self.update_file_tree()
+            self._total_pages = 0
+            self._selected_pages = 0
+            self._schedule_refresh()
             self.update_selection_status()
             self.add_info("已清空所有文件")
     
+    def _swap_rows(self, upper):
+        """交换第upper行与下一行，只移动这一行并更新两行的顺序号"""
+        lower = upper + 1
+        pdf_files = self.pdf_files
+        item_ids = self._item_ids
+        rendered_rows = self._rendered_rows
+
+        pdf_files[upper], pdf_files[lower] = pdf_files[lower], pdf_files[upper]
+        item_ids[upper], item_ids[lower] = item_ids[lower], item_ids[upper]
+        rendered_rows[upper], rendered_rows[lower] = rendered_rows[lower], rendered_rows[upper]
+
+        self.file_tree.move(item_ids[upper], '', upper)
+        for i in (upper, lower):
+            self._item_index[item_ids[i]] = i
+            self.file_tree.set(item_ids[i], 'sequence', i + 1)
+            row = rendered_rows[i]
+            rendered_rows[i] = (row[0], i + 1) + row[2:]
+
     def move_up(self):
         """上移选中的文件"""
         selected_items = self.file_tree.selection()
         if not selected_items or len(selected_items) != 1:
-            messagebox.showwarning("警告", "请选择一个文件进行移动")
+            self._flash_status("请选择一个文件进行移动")
             return
         
-        index = self.file_tree.index(selected_items[0])
+        index = self._item_index[selected_items[0]]
         if index == 0:
-            messagebox.showinfo("提示", "已经在最顶部")
+            self._flash_status("已经在最顶部", 'info')
             return
         
         # 交换位置
-        self.pdf_files[index], self.pdf_files[index-1] = self.pdf_files[index-1], self.pdf_files[index]
+        self._swap_rows(index - 1)
         
-        # 更新选中状态
-        if index in self.selected_files:
-            self.selected_files.remove(index)
-            self.selected_files.add(index-1)
-        elif index-1 in self.selected_files:
-            self.selected_files.remove(index-1)
-            self.selected_files.add(index)
-        
-        self.update_file_tree()
-        
-        # 重新选中移动后的文件
-        new_item = self.file_tree.get_children()[index-1]
+        # 重新选中移动后的文件并保持可见
+        new_item = self._item_ids[index-1]
         self.file_tree.selection_set(new_item)
+        self.file_tree.see(new_item)
         
-        self.add_info(f"⬆️ 已上移: {self.pdf_files[index-1]['name']}")
+        self.add_info(f"⬆️ 已上移: {self.pdf_files[index-1].name}")
     
     def move_down(self):
         """下移选中的文件"""
         selected_items = self.file_tree.selection()
         if not selected_items or len(selected_items) != 1:
-            messagebox.showwarning("警告", "请选择一个文件进行移动")
+            self._flash_status("请选择一个文件进行移动")
             return
         
-        index = self.file_tree.index(selected_items[0])
+        index = self._item_index[selected_items[0]]
         if index == len(self.pdf_files) - 1:
-            messagebox.showinfo("提示", "已经在最底部")
+            self._flash_status("已经在最底部", 'info')
             return
         
         # 交换位置
-        self.pdf_files[index], self.pdf_files[index+1] = self.pdf_files[index+1], self.pdf_files[index]
-        
-        # 更新选中状态
-        if index in self.selected_files:
-            self.selected_files.remove(index)
-            self.selected_files.add(index+1)
-        elif index+1 in self.selected_files:
-            self.selected_files.remove(index+1)
-            self.selected_files.add(index)
+        self._swap_rows(index)
         
-        self.update_file_tree()
-        
-        # 重新选中移动后的文件
-        new_item = self.file_tree.get_children()[index+1]
+        # 重新选中移动后的文件并保持可见
+        new_item = self._item_ids[index+1]
         self.file_tree.selection_set(new_item)
+        self.file_tree.see(new_item)
         
-        self.add_info(f"⬇️ 已下移: {self.pdf_files[index+1]['name']}")
+        self.add_info(f"⬇️ 已下移: {self.pdf_files[index+1].name}")
     
     def start_merge(self):
         """开始合并PDF文件"""
         if not self.pdf_files:
-            messagebox.showwarning("警告", "请先添加PDF文件")
+            self._flash_status("请先添加PDF文件")
             return
         
         if not self.selected_files:
-            messagebox.showwarning("警告", "请先选中要合并的PDF文件")
+            self._flash_status("请先选中要合并的PDF文件")
             return
         
         if len(self.selected_files) < 2:
-            messagebox.showwarning("警告", "至少需要选中两个PDF文件才能合并")
+            self._flash_status("至少需要选中两个PDF文件才能合并")
             return
         
         # 选择输出文件
@@ -2331,18 +2556,18 @@ class PDFMergeDialog:
         if not output_file:
             return
         
-        # 获取选中的文件列表（按索引顺序排列）
-        selected_indices = sorted(self.selected_files)
-        selected_files_info = [self.pdf_files[i] for i in selected_indices]
+        # 获取选中的文件列表（按列表顺序排列）
+        selected_files_info = [file_data for file_data in self.pdf_files
+                               if file_data.path in self.selected_files]
         
         # 确认对话框
-        file_list = "\n".join([f"{idx+1}. {file_data['name']} ({file_data['pages']}页)" 
+        file_list = "\n".join([f"{idx+1}. {file_data.name} ({file_data.pages}页)" 
                              for idx, file_data in enumerate(selected_files_info)])
         
-        total_pages = sum(file_data['pages'] for file_data in selected_files_info)
+        total_pages = sum(file_data.pages for file_data in selected_files_info)
         
         # 获取文件名用于显示
-        output_filename = self.os.path.basename(output_file)
+        output_filename = self._basename(output_file)
         
         result = messagebox.askyesno("确认合并", 
                                    f"即将合并以下 {len(selected_files_info)} 个选中的PDF文件：\n\n{file_list}\n\n合并后总页数: {total_pages} 页\n输出文件: {output_filename}\n\n是否继续？")
@@ -2355,11 +2580,12 @@ class PDFMergeDialog:
         
         try:
             # 提取选中文件的路径列表
-            file_paths = [file_data['path'] for file_data in selected_files_info]
+            file_paths = [file_data.path for file_data in selected_files_info]
             
             # 执行合并
             if self.processor:
-                success = self.processor.merge_pdfs(file_paths, output_file, self.add_info)
+                success = self.processor.merge_pdfs(file_paths, output_file,
+                                                    self._make_throttled_info())
             else:
                 success = False
                 self.add_info("PDF处理器不可用")
@@ -2369,8 +2595,8 @@ class PDFMergeDialog:
                 
                 # 显示完成信息
                 messagebox.showinfo("完成",
-                                   f"PDF合并完成！\n\n输出文件: {self.os.path.basename(output_file)}\n合并了 {len(selected_files_info)} 个文件，共 {total_pages} 页\n\n文件保存位置:\n{self.os.path.dirname(output_file)}")
-                self.add_info(f"文件保存位置: {self.os.path.dirname(output_file)}")
+                                   f"PDF合并完成！\n\n输出文件: {self._basename(output_file)}\n合并了 {len(selected_files_info)} 个文件，共 {total_pages} 页\n\n文件保存位置:\n{os.path.dirname(output_file)}")
+                self.add_info(f"文件保存位置: {os.path.dirname(output_file)}")
             else:
                 self.add_info("PDF合并失败")
 
@@ -2393,24 +2619,25 @@ class PDFMergeDialog:
             
             # 如果点击的是第一列（选中列）
             if column == '#1' and item_id:  # '#1' 表示第一列
-                # 获取行索引
-                try:
-                    row_index = self.file_tree.index(item_id)
+                # 获取行索引（查映射表，无需再调用Tcl）
+                row_index = self._item_index.get(item_id)
+                if row_index is not None:
                     self.toggle_file_selection(row_index)
-                except tk.TclError:
-                    pass  # 忽略错误
     
     def toggle_file_selection(self, index):
         """切换文件选中状态"""
         if index < len(self.pdf_files):
-            if index in self.selected_files:
-                self.selected_files.remove(index)
-                self.add_info(f"☐️ 取消选中: {self.pdf_files[index]['name']}")
+            file_path = self.pdf_files[index].path
+            if file_path in self.selected_files:
+                self.selected_files.remove(file_path)
+                self._selected_pages -= self.pdf_files[index].pages
+                self.add_info(f"☐️ 取消选中: {self.pdf_files[index].name}")
             else:
-                self.selected_files.add(index)
-                self.add_info(f"☑️ 已选中: {self.pdf_files[index]['name']}")
+                self.selected_files.add(file_path)
+                self._selected_pages += self.pdf_files[index].pages
+                self.add_info(f"☑️ 已选中: {self.pdf_files[index].name}")
             
-            self.update_file_tree()
+            self._update_selected_mark(index)
             self.update_selection_status()
     
     def select_all(self):
@@ -2418,8 +2645,9 @@ class PDFMergeDialog:
         if not self.pdf_files:
             return
         
-        self.selected_files = set(range(len(self.pdf_files)))
-        self.update_file_tree()
+        self.selected_files = {file_data.path for file_data in self.pdf_files}
+        self._selected_pages = self._total_pages
+        self._schedule_refresh()
         self.update_selection_status()
         self.add_info(f"☑️ 已全选 {len(self.pdf_files)} 个文件")
     
@@ -2430,7 +2658,8 @@ class PDFMergeDialog:
         
         count = len(self.selected_files)
         self.selected_files.clear()
-        self.update_file_tree()
+        self._selected_pages = 0
+        self._schedule_refresh()
         self.update_selection_status()
         self.add_info(f"☐️ 已取消选中 {count} 个文件")
     
@@ -2439,9 +2668,10 @@ class PDFMergeDialog:
         if not self.pdf_files:
             return
         
-        all_indices = set(range(len(self.pdf_files)))
-        self.selected_files = all_indices - self.selected_files
-        self.update_file_tree()
+        all_paths = {file_data.path for file_data in self.pdf_files}
+        self.selected_files = all_paths - self.selected_files
+        self._selected_pages = self._total_pages - self._selected_pages
+        self._schedule_refresh()
         self.update_selection_status()
         self.add_info(f"反选完成，当前选中 {len(self.selected_files)} 个文件")
     
@@ -2453,23 +2683,56 @@ class PDFMergeDialog:
         if total_files > 0:
             status_msg = f"当前选中: {selected_count}/{total_files} 个文件"
             if selected_count > 0:
-                total_pages = sum(self.pdf_files[i]['pages'] for i in self.selected_files)
-                status_msg += f" (共{total_pages}页)"
+                status_msg += f" (共{self._selected_pages}页)"
             self.add_info(status_msg)
     
-    def rebuild_selection_indices(self):
-        """重新构建选中索引（在删除文件后使用）"""
-        # 在删除文件后，需要重新映射选中的索引
-        # 简化处理：直接清空选中状态，由用户重新选择
-        self.selected_files.clear()
-    
     def close_dialog(self):
         """关闭对话框"""
+        # 取消尚未开始的读取任务，正在执行的任务结束后线程自行退出
+        self._load_executor.shutdown(wait=False, cancel_futures=True)
+        if self._page_cache_dirty:
+            self._info_cache_manager.save_cache({"pdf_info": self._page_cache})
+            self._page_cache_dirty = False
         self.dialog.destroy()
 
+class _LazyRule:
+    """延迟解析的规则模板，首次访问内容时才读取并解析JSON文件"""
+
+    __slots__ = ('path', '_data')
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+
+    def load(self):
+        """返回模板内容（dict），首次调用时解析文件"""
+        if self._data is None:
+            # 以二进制读取整个文件后一次性解析（json.loads可直接处理UTF-8字节）
+            with open(self.path, 'rb') as f:
+                self._data = json.loads(f.read())
+        return self._data
+
+
+# 规则管理中心的模板文件缓存：目录路径 -> {文件名: (修改时间ns, _LazyRule)}
+# 模板文件可能被原地修改而目录修改时间不变，因此逐个文件比较修改时间
+_TEMPLATE_FILE_CACHE = {}
+
+# 模板文件名匹配（不区分大小写的 .json 后缀）
+_TEMPLATE_NAME_MATCH = re.compile(r'\.json\Z', re.IGNORECASE).search
+
+
 class RuleManagerDialog:
     """统一的规则管理对话框"""
 
+    # 规则类型及其模板目录（顺序即列表中的显示顺序）
+    _RULE_DIRS = (
+        ("重命名规则", "template/rename_templates"),
+        ("文件夹提取规则", "template/folder_templates"),
+        ("Word转PDF规则", "template/word_to_pdf_templates"),
+        ("清理规则", "template/clean_templates"),
+        ("材料包查找规则", "template/data_read_templates"),
+    )
+
     def __init__(self, master_gui, log_callback=None):
         # master_gui 是主界面对象，从中获取根窗口
         self.master_gui = master_gui
@@ -2486,112 +2749,93 @@ class RuleManagerDialog:
         self.dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 30))
 
         self.log_callback = log_callback
+        self._log = log_callback if log_callback else (lambda *args, **kwargs: None)
 
         # 当前选择的模板（用于规则管理对话框内部）
         self.selected_material_package_template = None
 
         # 规则数据
-        self.all_rules = {
-            "重命名规则": {},
-            "文件夹提取规则": {},
-            "Word转PDF规则": {},
-            "清理规则": {},
-            "材料包查找规则": {}
-        }
+        self.all_rules = {category: {} for category, _ in self._RULE_DIRS}
+        self._content_cache = {}  # 规则类型 -> 已生成的详情文本
 
         self.load_all_rules()
         self.create_widgets()
 
-    def load_all_rules(self):
-        """加载所有规则"""
-        import json
-        from pathlib import Path
-
-        # 加载重命名规则
-        rename_dir = Path(get_resource_path("template/rename_templates"))
-        if rename_dir.exists():
-            json_files = list(rename_dir.glob("*.json"))
-            if self.log_callback:
-                self.log_callback(f"发现 {len(json_files)} 个重命名规则文件")
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    self.all_rules["重命名规则"][json_file.stem] = rule_data
-                    if self.log_callback:
-                        self.log_callback(f"加载重命名规则: {json_file.stem}")
-                except Exception as e:
-                    if self.log_callback:
-                        self.log_callback(f"加载重命名规则失败 {json_file.name}: {e}")
+    def load_all_rules(self, force=False):
+        """加载所有规则
 
-        # 加载文件夹提取规则
-        folder_dir = Path(get_resource_path("template/folder_templates"))
-        if folder_dir.exists():
-            json_files = list(folder_dir.glob("*.json"))
-            if self.log_callback:
-                self.log_callback(f"发现 {len(json_files)} 个文件夹提取规则文件")
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    self.all_rules["文件夹提取规则"][json_file.stem] = rule_data
-                    if self.log_callback:
-                        self.log_callback(f"加载文件夹提取规则: {json_file.stem}")
-                except Exception as e:
-                    if self.log_callback:
-                        self.log_callback(f"加载文件夹提取规则失败 {json_file.name}: {e}")
+        各类规则的模板目录互不相关，使用线程池并行扫描，完成后在当前线程中汇总并输出日志。
 
-        # 加载Word转PDF规则
-        word_dir = Path(get_resource_path("template/word_to_pdf_templates"))
-        if word_dir.exists():
-            json_files = list(word_dir.glob("*.json"))
-            if self.log_callback:
-                self.log_callback(f"发现 {len(json_files)} 个Word转PDF规则文件")
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    self.all_rules["Word转PDF规则"][json_file.stem] = rule_data
-                    if self.log_callback:
-                        self.log_callback(f"加载Word转PDF规则: {json_file.stem}")
-                except Exception as e:
-                    if self.log_callback:
-                        self.log_callback(f"加载Word转PDF规则失败 {json_file.name}: {e}")
+        Args:
+            force: 为True时忽略缓存，重新解析所有模板文件
+        """
+        def scan(item):
+            category, sub_dir = item
+            return self._scan_rule_dir(category, get_resource_path(sub_dir), force)
 
-        # 加载清理规则
-        clean_dir = Path(get_resource_path("template/clean_templates"))
-        if clean_dir.exists():
-            json_files = list(clean_dir.glob("*.json"))
-            if self.log_callback:
-                self.log_callback(f"发现 {len(json_files)} 个清理规则文件")
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    self.all_rules["清理规则"][json_file.stem] = rule_data
-                    if self.log_callback:
-                        self.log_callback(f"加载清理规则: {json_file.stem}")
-                except Exception as e:
-                    if self.log_callback:
-                        self.log_callback(f"加载清理规则失败 {json_file.name}: {e}")
+        with ThreadPoolExecutor(max_workers=len(self._RULE_DIRS)) as executor:
+            results = list(executor.map(scan, self._RULE_DIRS))
 
-        # 加载材料包查找规则
-        material_package_search_dir = Path(get_resource_path("template/data_read_templates"))
-        if material_package_search_dir.exists():
-            json_files = list(material_package_search_dir.glob("*.json"))
-            if self.log_callback:
-                self.log_callback(f"发现 {len(json_files)} 个材料包查找规则文件")
-            for json_file in json_files:
+        for (category, _), (rules, messages) in zip(self._RULE_DIRS, results):
+            # 只有模板文件有增删或修改的类别才需要重新生成详情文本
+            old_rules = self.all_rules[category]
+            if rules.keys() != old_rules.keys() or any(rules[name] is not old_rules[name] for name in rules):
+                self._content_cache.pop(category, None)
+            self.all_rules[category] = rules
+            for message in messages:
+                self._log(message)
+
+    def _scan_rule_dir(self, category, dir_path, force=False):
+        """扫描单个模板目录中的规则（可在后台线程中执行，不修改对话框状态）
+
+        只登记模板文件，内容在首次显示时才解析；修改时间未变的文件沿用缓存中的条目。
+
+        Args:
+            category: 规则类型名称（用于日志）
+            dir_path: 模板目录路径
+            force: 为True时忽略缓存
+
+        Returns:
+            tuple: (规则字典 {模板名: _LazyRule}, 日志消息列表)
+        """
+        rules = {}
+        messages = []
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            # 目录不存在（或不是目录），跳过该类规则
+            return rules, messages
+
+        old_cache = {} if force else _TEMPLATE_FILE_CACHE.get(dir_path, {})
+        new_cache = {}
+        file_count = 0
+        log_enabled = self.log_callback is not None  # 未设置日志时不格式化消息
+        is_template_name = _TEMPLATE_NAME_MATCH
+        with entries:
+            for entry in entries:
+                if not is_template_name(entry.name) or not entry.is_file(follow_symlinks=False):
+                    continue
+                file_count += 1
+                stem = entry.name[:-5]
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    self.all_rules["材料包查找规则"][json_file.stem] = rule_data
-                    if self.log_callback:
-                        self.log_callback(f"加载材料包查找规则: {json_file.stem}")
+                    mtime = entry.stat().st_mtime_ns
+                    cached = old_cache.get(entry.name)
+                    if cached and cached[0] == mtime:
+                        rule_data = cached[1]
+                    else:
+                        rule_data = _LazyRule(entry.path)
+                    new_cache[entry.name] = (mtime, rule_data)
+                    rules[stem] = rule_data
+                    if log_enabled:
+                        messages.append(f"加载{category}: {stem}")
                 except Exception as e:
-                    if self.log_callback:
-                        self.log_callback(f"加载材料包查找规则失败 {json_file.name}: {e}")
+                    messages.append(f"加载{category}失败 {entry.name}: {e}")
 
+        messages.append(f"发现 {file_count} 个{category}文件")
+
+        # 只保留仍存在的文件，已删除的模板随之移出缓存（每个线程只写自己的目录键）
+        _TEMPLATE_FILE_CACHE[dir_path] = new_cache
+        return rules, messages
 
     def create_widgets(self):
         """创建对话框组件"""
@@ -2635,29 +2879,11 @@ class RuleManagerDialog:
                                            bg='white', selectbackground='#0078D4', selectforeground='white')
         self.rule_type_listbox.pack(fill='both', expand=True)
 
-        # 添加规则类型（带emoji图标）
-        rule_types = list(self.all_rules.keys())
-        rule_type_icons = {
-            "重命名规则": "",
-            "文件夹提取规则": "",
-            "Word转PDF规则": "",
-            "清理规则": "",
-            "材料包查找规则": ""
-        }
-
-        for i, rule_type in enumerate(rule_types):
-            rule_count = len(self.all_rules[rule_type])
-            icon = rule_type_icons.get(rule_type, "")
-            if i == 0:  # 第一个项目默认选中
-                display_text = f"▶ {rule_type} ({rule_count}个规则)"
-            else:
-                display_text = f"{rule_type} ({rule_count}个规则)"
-            self.rule_type_listbox.insert(tk.END, display_text)
+        # 添加规则类型
+        self._populate_rule_type_list()
 
         # 绑定选择事件
         self.rule_type_listbox.bind('<<ListboxSelect>>', self.on_rule_type_selected)
-        self.rule_type_listbox.selection_set(0)  # 默认选择第一个
-        self.current_rule_type = rule_types[0]
 
         # 底部选中模板显示区域
         self.selected_templates_frame = ttk.LabelFrame(left_frame, text="已选择模板", padding=5)
@@ -2674,6 +2900,7 @@ class RuleManagerDialog:
 
         self.templates_canvas.create_window((0, 0), window=self.templates_frame, anchor="nw")
         self.templates_canvas.pack(side="left", fill="both", expand=True)
+        self._create_template_slots()
 
         # 右侧规则内容显示
         right_frame = ttk.LabelFrame(main_frame, text="规则内容详情", padding=10)
@@ -2701,10 +2928,20 @@ class RuleManagerDialog:
         # 更新选中模板显示
         self.update_selected_template_display()
 
+    def _populate_rule_type_list(self):
+        """按当前规则数据重建规则类型列表，所有项目一次性插入，默认选中第一项"""
+        self._display_texts = [f"{rule_type} ({len(rules)}个规则)"
+                               for rule_type, rules in self.all_rules.items()]
+
+        self.rule_type_listbox.delete(0, tk.END)
+        self.rule_type_listbox.insert(tk.END, "▶ " + self._display_texts[0], *self._display_texts[1:])
+        self.rule_type_listbox.selection_set(0)
+        self._selected_index = 0  # 当前带选中标记的行
+        self.current_rule_type = next(iter(self.all_rules))
+
     def check_current_templates(self):
         """检查当前选中的模板"""
-        if self.log_callback:
-            self.log_callback("开始检查当前模板配置...")
+        self._log("开始检查当前模板配置...")
 
         # 检查当前选中的模板 - 从主界面缓存获取模板信息
         try:
@@ -2713,127 +2950,58 @@ class RuleManagerDialog:
 
             selected_rename = templates_cache.get("selected_rename_template")
             if selected_rename:
-                if self.log_callback:
-                    self.log_callback(f"重命名规则: {selected_rename}")
+                self._log(f"重命名规则: {selected_rename}")
             else:
-                if self.log_callback:
-                    self.log_callback("未选择重命名规则")
+                self._log("未选择重命名规则")
 
             selected_extract = templates_cache.get("selected_extract_template")
             if selected_extract:
-                if self.log_callback:
-                    self.log_callback(f"提取规则: {selected_extract}")
+                self._log(f"提取规则: {selected_extract}")
             else:
-                if self.log_callback:
-                    self.log_callback("未选择提取规则")
+                self._log("未选择提取规则")
 
             selected_word = templates_cache.get("selected_word_template")
             if selected_word:
-                if self.log_callback:
-                    self.log_callback(f"Word转PDF规则: {selected_word}")
+                self._log(f"Word转PDF规则: {selected_word}")
             else:
-                if self.log_callback:
-                    self.log_callback("未选择Word转PDF规则")
+                self._log("未选择Word转PDF规则")
 
             selected_clean = templates_cache.get("selected_clean_template")
             if selected_clean:
-                if self.log_callback:
-                    self.log_callback(f"清理规则: {selected_clean}")
+                self._log(f"清理规则: {selected_clean}")
             else:
-                if self.log_callback:
-                    self.log_callback("未选择清理规则")
+                self._log("未选择清理规则")
         except Exception as e:
-            if self.log_callback:
-                self.log_callback(f"检查模板配置时出错: {e}")
+            self._log(f"检查模板配置时出错: {e}")
 
         # 检查材料包查找规则（显示可用规则）
         try:
             if "材料包查找规则" in self.all_rules and self.all_rules["材料包查找规则"]:
                 rule_count = len(self.all_rules["材料包查找规则"])
-                if self.log_callback:
-                    self.log_callback(f"材料包查找规则: {rule_count}个可用规则")
+                self._log(f"材料包查找规则: {rule_count}个可用规则")
             else:
-                if self.log_callback:
-                    self.log_callback("未找到材料包查找规则")
+                self._log("未找到材料包查找规则")
         except Exception as e:
-            if self.log_callback:
-                self.log_callback(f"检查材料包规则时出错: {e}")
+            self._log(f"检查材料包规则时出错: {e}")
 
-        if self.log_callback:
-            self.log_callback("\n可用规则模板统计:")
+        self._log("\n可用规则模板统计:")
 
-        # 显示统计信息
-        all_rules = {
-            "重命名规则": {},
-            "文件夹提取规则": {},
-            "Word转PDF规则": {},
-            "清理规则": {}
-        }
+        # 显示统计（直接使用已加载的规则；材料包查找规则已在上方单独统计）
+        for rule_type, rules in self.all_rules.items():
+            if rule_type == "材料包查找规则":
+                continue
+            self._log(f"  {rule_type}: {len(rules)}个可用规则")
 
-        # 加载规则统计
-        import json
-        from pathlib import Path
+        self._log("规则检查完成")
 
-        # 重命名规则
-        rename_dir = Path(get_resource_path("template/rename_templates"))
-        if rename_dir.exists():
-            for json_file in rename_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    all_rules["重命名规则"][json_file.stem] = rule_data
-                except:
-                    pass
+    def select_template(self):
+        """选择模板并应用到全局"""
+        current_type = self.current_rule_type
+        rules = self.all_rules.get(current_type, {})
 
-        # 文件夹提取规则
-        folder_dir = Path(get_resource_path("template/folder_templates"))
-        if folder_dir.exists():
-            for json_file in folder_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    all_rules["文件夹提取规则"][json_file.stem] = rule_data
-                except:
-                    pass
-
-        # Word转PDF规则
-        word_dir = Path(get_resource_path("template/word_to_pdf_templates"))
-        if word_dir.exists():
-            for json_file in word_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    all_rules["Word转PDF规则"][json_file.stem] = rule_data
-                except:
-                    pass
-
-        # 清理规则
-        clean_dir = Path(get_resource_path("template/clean_templates"))
-        if clean_dir.exists():
-            for json_file in clean_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-                    all_rules["清理规则"][json_file.stem] = rule_data
-                except:
-                    pass
-
-        # 显示统计
-        for rule_type, rules in all_rules.items():
-            if self.log_callback:
-                self.log_callback(f"  {rule_type}: {len(rules)}个可用规则")
-
-        if self.log_callback:
-            self.log_callback("规则检查完成")
-
-    def select_template(self):
-        """选择模板并应用到全局"""
-        current_type = self.current_rule_type
-        rules = self.all_rules.get(current_type, {})
-
-        if not rules:
-            messagebox.showinfo("提示", f"当前规则类型 {current_type} 没有可用规则")
-            return
+        if not rules:
+            messagebox.showinfo("提示", f"当前规则类型 {current_type} 没有可用规则")
+            return
 
         # 如果只有一个规则，直接选择
         if len(rules) == 1:
@@ -2852,20 +3020,20 @@ class RuleManagerDialog:
 
                 if current_type == "重命名规则":
                     templates_cache["selected_rename_template"] = selected_template
-                    self.master_gui.selected_rename_template = selected_template  # 同步更新主界面属性
+                    self.master_gui.selected['rename'] = selected_template  # 同步更新主界面属性
                 elif current_type == "文件夹提取规则":
                     templates_cache["selected_extract_template"] = selected_template
-                    self.master_gui.selected_extract_template = selected_template  # 同步更新主界面属性
+                    self.master_gui.selected['extract'] = selected_template  # 同步更新主界面属性
                 elif current_type == "Word转PDF规则":
                     templates_cache["selected_word_template"] = selected_template
-                    self.master_gui.selected_word_template = selected_template  # 同步更新主界面属性
+                    self.master_gui.selected['word'] = selected_template  # 同步更新主界面属性
                 elif current_type == "清理规则":
                     templates_cache["selected_clean_template"] = selected_template
-                    self.master_gui.selected_clean_template = selected_template  # 同步更新主界面属性
+                    self.master_gui.selected['clean'] = selected_template  # 同步更新主界面属性
                 elif current_type == "材料包查找规则":
                     # 保存材料包查找规则到主界面缓存和变量
                     templates_cache["selected_material_package_template"] = selected_template
-                    self.master_gui.selected_material_package_template = selected_template  # 同步更新主界面属性
+                    self.master_gui.selected['material_package'] = selected_template  # 同步更新主界面属性
                     self.selected_material_package_template = selected_template
 
                 # 更新显示
@@ -2875,17 +3043,12 @@ class RuleManagerDialog:
                 if hasattr(self.master_gui, 'save_cache_data'):
                     self.master_gui.save_cache_data()
 
-                if self.log_callback:
-                    self.log_callback(f"已选择模板: {selected_template} (类型: {current_type})")
+                self._log(f"已选择模板: {selected_template} (类型: {current_type})")
             except Exception as e:
-                if self.log_callback:
-                    self.log_callback(f"保存模板选择时出错: {e}")
+                self._log(f"保存模板选择时出错: {e}")
 
     def update_selected_template_display(self):
-        """更新选中模板显示"""
-        # 清空现有的模板显示
-        for widget in self.templates_frame.winfo_children():
-            widget.destroy()
+        """更新选中模板显示（复用预先创建的显示槽位，只更新文字和显隐）"""
 
         # 从主界面的缓存中获取模板信息
         try:
@@ -2907,75 +3070,100 @@ class RuleManagerDialog:
             material_package_template = getattr(self, 'selected_material_package_template', None)
 
         # 显示选中的模板
-        row = 0
-        if rename_template:
-            self._add_template_item(row, "重命名规则", rename_template)
-            row += 1
-        if extract_template:
-            self._add_template_item(row, "文件夹提取规则", extract_template)
-            row += 1
-        if word_template:
-            self._add_template_item(row, "Word转PDF规则", word_template)
-            row += 1
-        if clean_template:
-            self._add_template_item(row, "清理规则", clean_template)
-            row += 1
-        if material_package_template:
-            self._add_template_item(row, "材料包查找规则", material_package_template)
-            row += 1
+        selected_items = [(rule_type, template_name) for rule_type, template_name in (
+            ("重命名规则", rename_template),
+            ("文件夹提取规则", extract_template),
+            ("Word转PDF规则", word_template),
+            ("清理规则", clean_template),
+            ("材料包查找规则", material_package_template),
+        ) if template_name]
+
+        for index, (type_frame, type_label, name_label) in enumerate(self._template_slots):
+            if index < len(selected_items):
+                rule_type, template_name = selected_items[index]
+                self._slot_items[index] = (rule_type, template_name)
+                type_label.configure(text=f"{rule_type}:")
+                name_label.configure(text=self._truncate_template_name(template_name))
+                type_frame.grid()
+            else:
+                self._slot_items[index] = None
+                type_frame.grid_remove()
 
         # 如果没有选择任何模板，显示提示信息
-        if row == 0:
-            no_selection_label = ttk.Label(
-                self.templates_frame,
-                text="暂未选择任何模板",
-                font=('Microsoft YaHei', 9, 'italic'),
-                foreground='gray'
-            )
-            no_selection_label.pack(pady=5)
-
-    def _add_template_item(self, row, rule_type, template_name):
-        """添加模板显示项"""
-        # 规则类型标签
-        type_frame = ttk.Frame(self.templates_frame)
-        type_frame.grid(row=row, column=0, sticky='w', pady=2)
-
-        type_label = ttk.Label(
-            type_frame,
-            text=f"{rule_type}:",
-            font=('Microsoft YaHei', 9, 'bold'),
-            width=15,
-            anchor='w'
-        )
-        type_label.pack(side='left')
+        if selected_items:
+            self._no_selection_label.grid_remove()
+        else:
+            self._no_selection_label.grid()
 
-        # 截断过长的模板名称
-        max_name_length = 20
-        display_name = template_name
-        if len(template_name) > max_name_length:
-            display_name = template_name[:max_name_length-3] + "..."
-
-        # 模板名称标签
-        name_label = ttk.Label(
-            type_frame,
-            text=display_name,
-            font=('Microsoft YaHei', 9),
-            foreground='blue',
-            cursor="hand2"
-        )
-        # 添加提示文本，显示完整模板名称
+    # 已选择模板区域中模板名称的最大显示长度
+    _MAX_TEMPLATE_NAME_LENGTH = 20
+
+    def _truncate_template_name(self, template_name):
+        """截断过长的模板名称"""
+        max_name_length = self._MAX_TEMPLATE_NAME_LENGTH
         if len(template_name) > max_name_length:
-            name_label.bind("<Enter>", lambda e: self._show_tooltip(e, template_name))
+            return template_name[:max_name_length-3] + "..."
+        return template_name
+
+    def _create_template_slots(self):
+        """创建已选择模板区域的显示槽位（每种规则类型一个），初始全部隐藏"""
+        self._template_slots = []
+        self._slot_items = []
+        for row in range(len(self._RULE_DIRS)):
+            # 规则类型标签
+            type_frame = ttk.Frame(self.templates_frame)
+            type_frame.grid(row=row, column=0, sticky='w', pady=2)
+
+            type_label = ttk.Label(
+                type_frame,
+                font=('Microsoft YaHei', 9, 'bold'),
+                width=15,
+                anchor='w'
+            )
+            type_label.pack(side='left')
+
+            # 模板名称标签
+            name_label = ttk.Label(
+                type_frame,
+                font=('Microsoft YaHei', 9),
+                foreground='blue',
+                cursor="hand2"
+            )
+            name_label.pack(side='left', padx=(5, 0))
+
+            # 事件处理时读取槽位当前显示的模板，因此只需绑定一次
+            name_label.bind("<Enter>", lambda e, i=row: self._on_template_slot_enter(e, i))
             name_label.bind("<Leave>", lambda e: self._hide_tooltip())
-        name_label.pack(side='left', padx=(5, 0))
+            name_label.bind("<Button-1>", lambda e, i=row: self._on_template_slot_click(i))
+
+            type_frame.grid_remove()
+            self._template_slots.append((type_frame, type_label, name_label))
+            self._slot_items.append(None)
 
-        # 添加点击事件（暂时只显示信息）
-        name_label.bind("<Button-1>", lambda e: self._show_template_info(rule_type, template_name))
+        self._no_selection_label = ttk.Label(
+            self.templates_frame,
+            text="暂未选择任何模板",
+            font=('Microsoft YaHei', 9, 'italic'),
+            foreground='gray'
+        )
+        self._no_selection_label.grid(row=0, column=0, pady=5)
+        self._no_selection_label.grid_remove()
+
+    def _on_template_slot_enter(self, event, index):
+        """鼠标进入模板名称时，名称被截断则显示完整名称"""
+        item = self._slot_items[index]
+        if item and len(item[1]) > self._MAX_TEMPLATE_NAME_LENGTH:
+            self._show_tooltip(event, item[1])
+
+    def _on_template_slot_click(self, index):
+        """点击模板名称（暂时只显示信息）"""
+        item = self._slot_items[index]
+        if item:
+            self._show_template_info(*item)
 
     def _show_template_info(self, rule_type, template_name):
         """显示模板详细信息"""
-        if self.log_callback:
-            self.log_callback(f"模板详情: {rule_type} -> {template_name}")
+        self._log(f"模板详情: {rule_type} -> {template_name}")
 
     def _show_tooltip(self, event, text):
         """显示提示文本"""
@@ -3005,22 +3193,16 @@ class RuleManagerDialog:
         if index < len(rule_types):
             self.current_rule_type = rule_types[index]
 
-            # 更新规则类型标题（带选中效果）
-            rule_count = len(self.all_rules[self.current_rule_type])
-            display_text = f"▶ {self.current_rule_type} ({rule_count}个规则)"
-
-            # 先清除所有项目的选中标记
-            for i in range(self.rule_type_listbox.size()):
-                current_text = self.rule_type_listbox.get(i)
-                if current_text.startswith("▶ "):
-                    # 移除选中标记，但保留图标
-                    clean_text = current_text[2:]
-                    self.rule_type_listbox.delete(i)
-                    self.rule_type_listbox.insert(i, clean_text)
-
-            # 为当前选中项目添加选中标记
-            self.rule_type_listbox.delete(index)
-            self.rule_type_listbox.insert(index, display_text)
+            # 只更新选中标记发生变化的两行：去掉旧行的标记，给新行加上标记
+            old_index = self._selected_index
+            if old_index != index:
+                listbox = self.rule_type_listbox
+                listbox.delete(old_index)
+                listbox.insert(old_index, self._display_texts[old_index])
+                listbox.delete(index)
+                listbox.insert(index, "▶ " + self._display_texts[index])
+                listbox.selection_set(index)
+                self._selected_index = index
 
             # 显示规则内容
             self.display_rule_content()
@@ -3031,6 +3213,13 @@ class RuleManagerDialog:
         if not hasattr(self, 'current_rule_type'):
             return
 
+        # 内容只取决于规则数据，已生成过的直接复用（规则重新加载时清空）
+        cached = self._content_cache.get(self.current_rule_type)
+        if cached is not None:
+            self.rule_content_text.delete(1.0, tk.END)
+            self.rule_content_text.insert(tk.END, cached)
+            return
+
         rules = self.all_rules[self.current_rule_type]
 
         if not rules:
@@ -3051,45 +3240,55 @@ class RuleManagerDialog:
             total_rules = sum(len(rule_set) for rule_set in self.all_rules.values())
             self.log_callback(f"规则统计 - {self.current_rule_type}: {len(rules)}/{total_rules} 个规则")
 
+        # 所有行都追加到content_parts，最后只做一次join
         for i, (rule_name, rule_data) in enumerate(rules.items(), 1):
-            rule_info = f"{i}. {rule_data.get('name', rule_name)}\n"
+            if isinstance(rule_data, _LazyRule):
+                try:
+                    rule_data = rule_data.load()
+                except Exception as e:
+                    content_parts.extend((f"{i}. {rule_name}", f"   加载失败: {e}", "", "="*50))
+                    continue
+
+            content_parts.append(f"{i}. {rule_data.get('name', rule_name)}")
 
             if 'description' in rule_data:
-                rule_info += f"   描述: {rule_data['description']}\n"
+                content_parts.append(f"   描述: {rule_data['description']}")
             if 'version' in rule_data:
-                rule_info += f"   版本: {rule_data['version']}\n"
+                content_parts.append(f"   版本: {rule_data['version']}")
             if 'author' in rule_data:
-                rule_info += f"   作者: {rule_data['author']}\n"
+                content_parts.append(f"   作者: {rule_data['author']}")
             if 'created_date' in rule_data:
-                rule_info += f"   创建日期: {rule_data['created_date']}\n"
+                content_parts.append(f"   创建日期: {rule_data['created_date']}")
 
             # 显示Word转PDF规则的特殊设置
             if self.current_rule_type == "Word转PDF规则" and 'keep_original_files' in rule_data:
                 keep_files = rule_data['keep_original_files']
-                rule_info += f"   保留原文件: {'是' if keep_files else '否'}\n"
+                content_parts.append(f"   保留原文件: {'是' if keep_files else '否'}")
 
             # 显示规则的具体内容
             if 'rules' in rule_data:
-                rule_info += "   规则内容:\n"
+                content_parts.append("   规则内容:")
                 if self.current_rule_type == "重命名规则":
-                    rule_info += self.get_rename_rules_text(rule_data['rules'])
+                    content_parts.extend(self.get_rename_rules_lines(rule_data['rules']))
                 elif self.current_rule_type == "文件夹提取规则":
-                    rule_info += self.get_folder_rules_text(rule_data['rules'])
+                    content_parts.extend(self.get_folder_rules_lines(rule_data['rules']))
                 elif self.current_rule_type == "Word转PDF规则":
-                    rule_info += self.get_word_pdf_rules_text(rule_data['rules'])
+                    content_parts.extend(self.get_word_pdf_rules_lines(rule_data['rules']))
                 elif self.current_rule_type == "清理规则":
-                    rule_info += self.get_clean_rules_text(rule_data['rules'])
+                    content_parts.extend(self.get_clean_rules_lines(rule_data['rules']))
                 elif self.current_rule_type == "材料包查找规则":
-                    rule_info += self.get_clean_rules_text(rule_data['rules'])
+                    content_parts.extend(self.get_clean_rules_lines(rule_data['rules']))
 
-            content_parts.append(rule_info)
+            content_parts.append("")
             content_parts.append("="*50)
 
-        self.rule_content_text.insert(tk.END, "\n".join(content_parts))
+        content = "\n".join(content_parts)
+        self._content_cache[self.current_rule_type] = content
+        self.rule_content_text.insert(tk.END, content)
         # self.info_label.config(text=f"{self.current_rule_type}: {len(rules)}个规则")
 
-    def get_rename_rules_text(self, rules):
-        """获取重命名规则文本"""
+    def get_rename_rules_lines(self, rules):
+        """获取重命名规则文本（按行返回列表）"""
         text_parts = []
         for rule_name, rule_config in rules.items():
             text_parts.append(f"     - {rule_name}:")
@@ -3116,75 +3315,56 @@ class RuleManagerDialog:
             else:
                 text_parts.append(f"       配置: {rule_config}")
 
-        return "\n".join(text_parts) + "\n"
+        return text_parts
 
-    def get_folder_rules_text(self, rules):
-        """获取文件夹提取规则文本"""
+    def get_folder_rules_lines(self, rules):
+        """获取文件夹提取规则文本（按行返回列表）"""
         text_parts = []
         for rule_name, folders in rules.items():
             text_parts.append(f"     - {rule_name}:")
             for folder in folders:
                 text_parts.append(f"       - {folder}")
-        return "\n".join(text_parts) + "\n"
+        return text_parts
 
-    def get_word_pdf_rules_text(self, rules):
-        """获取Word转PDF规则文本"""
+    def get_word_pdf_rules_lines(self, rules):
+        """获取Word转PDF规则文本（按行返回列表）"""
         text_parts = []
         for doc_type, folders in rules.items():
             text_parts.append(f"     - {doc_type}:")
             for folder in folders:
                 text_parts.append(f"       - {folder}")
-        return "\n".join(text_parts) + "\n"
+        return text_parts
 
-    def get_clean_rules_text(self, rules):
-        """获取清理规则文本"""
+    def get_clean_rules_lines(self, rules):
+        """获取清理规则文本（按行返回列表）"""
         text_parts = []
         for i, rule in enumerate(rules, 1):
             text_parts.append(f"     {i}. 模式: {rule.get('pattern', '未知')}")
             text_parts.append(f"        类型: {rule.get('type', '未知')}")
             if 'description' in rule:
                 text_parts.append(f"        描述: {rule['description']}")
-        return "\n".join(text_parts) + "\n"
+        return text_parts
 
 
-    def refresh_rules(self):
-        """刷新所有规则"""
-        self.all_rules = {
-            "重命名规则": {},
-            "文件夹提取规则": {},
-            "Word转PDF规则": {},
-            "清理规则": {},
-            "材料包查找规则": {}
-        }
-        self.load_all_rules()
+    def refresh_rules(self, force=False):
+        """刷新所有规则
 
-        # 规则类型图标
-        rule_type_icons = {
-            "重命名规则": "",
-            "文件夹提取规则": "",
-            "Word转PDF规则": "",
-            "清理规则": "",
-            "材料包查找规则": ""
-        }
+        未修改的模板文件沿用缓存；各类规则数量不变时保留列表和当前选择，只刷新内容显示。
 
-        # 更新列表显示
-        self.rule_type_listbox.delete(0, tk.END)
-        rule_types = list(self.all_rules.keys())
-        for i, rule_type in enumerate(rule_types):
-            rule_count = len(self.all_rules[rule_type])
-            icon = rule_type_icons.get(rule_type, "")
-            if i == 0:
-                display_text = f"▶ {rule_type} ({rule_count}个规则)"
-            else:
-                display_text = f"{rule_type} ({rule_count}个规则)"
-            self.rule_type_listbox.insert(tk.END, display_text)
+        Args:
+            force: 为True时忽略缓存，重新解析所有模板文件
+        """
+        old_counts = [len(rules) for rules in self.all_rules.values()]
+        self.load_all_rules(force)
 
-        self.rule_type_listbox.selection_set(0)
-        self.current_rule_type = rule_types[0]
-        self.on_rule_type_selected(None)
+        if [len(rules) for rules in self.all_rules.values()] != old_counts:
+            # 更新列表显示
+            self._populate_rule_type_list()
+            self.on_rule_type_selected(None)
+        else:
+            self.display_rule_content()
 
-        if self.log_callback:
-            self.log_callback("规则刷新完成")
+        self._log("规则刷新完成")
 
     def open_rule_editor(self):
         """打开规则编辑器"""
@@ -3204,33 +3384,178 @@ class RuleManagerDialog:
         """关闭对话框"""
         self.dialog.destroy()
 
-class RuleEditorDialog:
-    """规则编辑对话框"""
 
-    def __init__(self, parent, rule_type, rules, log_callback=None):
+# 新建规则文件时使用的基础结构（规则类型 -> 模板），导入时构建一次
+_BASE_STRUCTURES = {
+    "重命名规则": {
+        "name": "新重命名规则",
+        "description": "请输入规则描述",
+        "version": "1.0.0",
+        "author": "用户",
+        "rules": {
+            "示例规则": "示例模式"
+        }
+    },
+    "文件夹提取规则": {
+        "name": "新文件夹提取规则",
+        "description": "请输入规则描述",
+        "version": "1.0.0",
+        "author": "用户",
+        "rules": [
+            {
+                "pattern": "*示例*",
+                "type": "folder",
+                "description": "示例规则"
+            }
+        ]
+    },
+    "Word转PDF规则": {
+        "name": "新Word转PDF规则",
+        "description": "请输入规则描述",
+        "version": "1.0.0",
+        "author": "用户",
+        "rules": {
+            "示例文档类型": ["示例文件夹路径"]
+        },
+        "keep_original_files": True
+    },
+    "清理规则": {
+        "name": "新清理规则",
+        "description": "请输入规则描述",
+        "version": "1.0.0",
+        "author": "用户",
+        "rules": [
+            {
+                "pattern": "示例模式",
+                "type": "folder",
+                "description": "示例规则"
+            }
+        ]
+    },
+    "材料包查找规则": {
+        "name": "新材料包查找规则",
+        "description": "请输入规则描述",
+        "version": "1.0.0",
+        "author": "用户",
+        "rules": {
+            "示例规则": "示例模式"
+        }
+    },
+}
+
+_DEFAULT_STRUCTURE = {
+    "name": "新规则",
+    "description": "请输入规则描述",
+    "version": "1.0.0",
+    "author": "用户"
+}
+
+
+# 基础验证（无模板验证器时）建议包含的字段
+_BASIC_RECOMMENDED_FIELDS = ('name', 'description')
+
+# JSON错误对话框中的常见解决方案
+_JSON_ERROR_TIPS = (
+    "常见解决方案：\n"
+    "• 检查引号是否正确配对\n"
+    "• 检查逗号是否正确放置\n"
+    "• 检查括号是否正确闭合\n"
+    "• 确认所有字符串都用双引号包围\n"
+)
+
+# 验证报告段落标记 -> 文本标签（段落内的"•"条目沿用所属段落的标签）
+_REPORT_SECTION_TAGS = (
+    ("🚨", "error"),
+    ("❌", "error"),
+    ("⚠️", "warning"),
+    ("✅", "success"),
+)
+
+
+def _tokenize_validation_report(report_text):
+    """将验证报告拆分为[文本, 标签, 文本, 标签, ...]，可直接一次性传给Text.insert
+
+    只逐行扫描一遍，相邻且标签相同的行合并为一个片段
+    """
+    tokens = []
+    buffer = []
+    current_tag = section_tag = ""
+    for line in report_text.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if not stripped.startswith("•"):
+            section_tag = ""
+            for mark, tag in _REPORT_SECTION_TAGS:
+                if stripped.startswith(mark):
+                    section_tag = tag
+                    break
+        if section_tag != current_tag and buffer:
+            tokens.extend(("".join(buffer), current_tag))
+            buffer = []
+        current_tag = section_tag
+        buffer.append(line)
+    if buffer:
+        tokens.extend(("".join(buffer), current_tag))
+    return tokens
+
+
+class _BaseRuleEditorDialog:
+    """规则文件编辑对话框基类，子类只需调整窗口尺寸和按钮文字"""
+
+    _GEOMETRY = "1000x700"
+    _FILE_BUTTON_TEXTS = ("刷新", "新建", "删除")
+    _SELECT_DELAY_MS = 120  # 选择文件后延迟加载的毫秒数
+    _SYNTAX_CHECK_DELAY_MS = 300  # 停止输入后延迟检查JSON语法的毫秒数
+    _CONTENT_CACHE_SIZE = 32  # 文件内容缓存的最大条目数
+
+    # 界面字体
+    _FONT_TITLE = ('Microsoft YaHei', 14, 'bold')
+    _FONT_UI = ('Microsoft YaHei', 10)
+    _FONT_SMALL = ('Microsoft YaHei', 9)
+    _FONT_CODE = ('Consolas', 9)
+
+    def __init__(self, parent, rule_type, log_callback=None):
         self.dialog = tk.Toplevel(parent)
-        self.dialog.title(f"编辑{ rule_type }")
-        self.dialog.geometry("900x700")
+        self._title = f"编辑{rule_type}"
+        self.dialog.title(self._title)
+        self.dialog.geometry(self._GEOMETRY)
         self.dialog.resizable(True, True)
         self.dialog.transient(parent)
         self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close_dialog)
 
         # 居中显示
         self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 30))
 
         self.rule_type = rule_type
-        self.rules = rules
         self.log_callback = log_callback
         self.rule_modified = False
 
-        # 获取模板文件夹路径（使用get_resource_path支持打包后的exe）
-        self.template_dirs = {
-            "重命名规则": get_resource_path("template/rename_templates"),
-            "文件夹提取规则": get_resource_path("template/folder_templates"),
-            "Word转PDF规则": get_resource_path("template/word_to_pdf_templates"),
-            "清理规则": get_resource_path("template/clean_templates"),
-            "材料包查找规则": get_resource_path("template/data_read_templates")
-        }
+        # 获取模板文件夹路径（使用get_resource_path支持打包后的exe），只解析当前规则类型
+        subdir = dict(RuleManagerDialog._RULE_DIRS).get(rule_type)
+        self.template_dir = get_resource_path(subdir) if subdir else None
+
+        # 当前列表框中的规则文件名（不含扩展名）
+        self._file_names = []
+        # 编辑器内容缓存：由程序写入时记录，用户修改后失效
+        self._current_content = None
+        # 编辑器内容是否与磁盘文件不一致
+        self._dirty = False
+        # 最近一次解析结果：(文本, 解析后的对象)
+        self._last_parsed = None
+        # 最近一次验证报告：(文本, 报告)
+        self._last_report = None
+        # 尚未执行的延迟加载任务
+        self._pending_load = None
+        # 尚未执行的语法检查任务
+        self._pending_syntax_check = None
+        # 文件内容LRU缓存（文件名 -> (修改时间, 大小, 内容)），后台预读线程也会写入，访问时需加锁
+        self._file_cache = OrderedDict()
+        self._file_cache_lock = threading.Lock()
+        # 验证报告/错误窗口只创建一次，关闭时隐藏以便复用
+        self._report_window = None
+        self._report_text = ""
+        self._error_window = None
+        self._error_msg = ""
 
         self.create_widgets()
         self.load_rule_files()
@@ -3245,12 +3570,12 @@ class RuleEditorDialog:
         title_frame = ttk.Frame(main_frame)
         title_frame.pack(fill='x', pady=(0, 10))
 
-        title_label = ttk.Label(title_frame, text=f"编辑{self.rule_type}",
-                               font=('Microsoft YaHei', 14, 'bold'))
+        title_label = ttk.Label(title_frame, text=self._title,
+                               font=self._FONT_TITLE)
         title_label.pack()
 
         subtitle_label = ttk.Label(title_frame, text="选择规则文件进行编辑，修改后点击保存",
-                                  font=('Microsoft YaHei', 10))
+                                  font=self._FONT_UI)
         subtitle_label.pack()
 
         # 左侧文件选择区域
@@ -3267,7 +3592,7 @@ class RuleEditorDialog:
 
         # 文件列表
         self.file_listbox = tk.Listbox(top_frame, width=30, height=8,
-                                      font=('Microsoft YaHei', 10))
+                                      font=self._FONT_UI)
         self.file_listbox.pack(fill='both', expand=True)
 
         # 绑定选择事件
@@ -3277,12 +3602,13 @@ class RuleEditorDialog:
         file_btn_frame = ttk.Frame(top_frame)
         file_btn_frame.pack(fill='x', pady=(5, 0))
 
-        ttk.Button(file_btn_frame, text="刷新列表",
+        refresh_text, create_text, delete_text = self._FILE_BUTTON_TEXTS
+        ttk.Button(file_btn_frame, text=refresh_text,
                   command=self.refresh_file_list).pack(side='left', padx=(0, 5))
-        ttk.Button(file_btn_frame, text="新建规则",
-                  command=self.create_new_rule).pack(side='left', padx=(0, 5))
-        ttk.Button(file_btn_frame, text="删除规则",
-                  command=self.delete_rule).pack(side='left')
+        ttk.Button(file_btn_frame, text=create_text,
+                  command=self.create_new_file).pack(side='left', padx=(0, 5))
+        ttk.Button(file_btn_frame, text=delete_text,
+                  command=self.delete_file).pack(side='left')
 
         # 下半部分：状态信息区域
         bottom_frame = ttk.Frame(left_paned)
@@ -3293,7 +3619,7 @@ class RuleEditorDialog:
         status_container.pack(fill='both', expand=True)
 
         self.status_label = ttk.Label(status_container, text="就绪",
-                                     font=('Microsoft YaHei', 9), width=30)
+                                     font=self._FONT_SMALL, width=30)
         self.status_label.pack(side='left', anchor='w', fill='x')
 
         # 右侧编辑区域
@@ -3305,7 +3631,7 @@ class RuleEditorDialog:
         toolbar_frame.pack(fill='x', pady=(0, 10))
 
         self.current_file_label = ttk.Label(toolbar_frame, text="未选择文件",
-                                           font=('Microsoft YaHei', 9))
+                                           font=self._FONT_SMALL)
         self.current_file_label.pack(side='left')
 
         ttk.Button(toolbar_frame, text="保存",
@@ -3318,8 +3644,10 @@ class RuleEditorDialog:
         # JSON编辑器
         self.json_text = scrolledtext.ScrolledText(right_frame,
                                                   wrap=tk.WORD,
-                                                  font=('Consolas', 9))
+                                                  font=self._FONT_CODE)
         self.json_text.pack(fill='both', expand=True)
+        self.json_text.bind('<<Modified>>', self._on_text_modified)
+        self._json_text_path = str(self.json_text)
 
         # 关闭按钮（移动到右侧底部）
         close_frame = ttk.Frame(right_frame)
@@ -3331,59 +3659,174 @@ class RuleEditorDialog:
     def load_rule_files(self):
         """加载规则文件列表"""
         self.file_listbox.delete(0, tk.END)
+        self._file_names = []
 
-        template_dir = self.template_dirs.get(self.rule_type)
+        template_dir = self.template_dir
         if not template_dir:
             self.status_label.config(text="错误：未找到规则类型目录")
             return
 
-        from pathlib import Path
-        rule_path = Path(template_dir)
-
-        if not rule_path.exists():
+        # 查找所有JSON文件（scandir直接给出文件名，无需为每个文件构造Path）
+        try:
+            with os.scandir(template_dir) as entries:
+                names = [entry.name[:-5] for entry in entries
+                         if entry.name.endswith('.json') and entry.is_file()]
+        except OSError:
             self.status_label.config(text=f"目录不存在：{template_dir}")
             return
 
-        # 查找所有JSON文件
-        json_files = list(rule_path.glob("*.json"))
-        if not json_files:
+        if not names:
             self.status_label.config(text="未找到规则文件")
             return
 
-        for json_file in json_files:
-            display_name = f"{json_file.stem}"
-            self.file_listbox.insert(tk.END, display_name)
+        # 文件名列表与列表框行一一对应，选择/保存/删除时直接按索引取用
+        # 按名称排序后一次插入全部行，只触发一次列表框重绘
+        names.sort()
+        self._file_names = names
+        self.file_listbox.insert(tk.END, *names)
 
-        self.status_label.config(text=f"找到 {len(json_files)} 个规则文件")
+        self.status_label.config(text=f"找到 {len(names)} 个规则文件")
 
     def refresh_file_list(self):
         """刷新文件列表"""
         self.load_rule_files()
 
     def on_file_selected(self, event):
-        """文件选择事件"""
+        """文件选择事件（延迟加载，按住方向键连续切换时只加载最终停留的文件）"""
+        if self._pending_load is not None:
+            self.dialog.after_cancel(self._pending_load)
+        self._pending_load = self.dialog.after(self._SELECT_DELAY_MS, self._load_selected_file)
+
+    def _load_selected_file(self):
+        """加载列表框当前选中的文件"""
+        self._pending_load = None
         selection = self.file_listbox.curselection()
         if not selection:
             return
 
         file_index = selection[0]
-        file_names = [self.file_listbox.get(i) for i in range(self.file_listbox.size())]
-
-        if file_index < len(file_names):
-            selected_name = file_names[file_index]
+        if file_index < len(self._file_names):
+            selected_name = self._file_names[file_index]
             self.load_file_content(selected_name)
+            self._prefetch_neighbors(file_index)
 
-    def load_file_content(self, file_name):
-        """加载文件内容"""
-        template_dir = self.template_dirs.get(self.rule_type)
-        file_path = Path(template_dir) / f"{file_name}.json"
+    def _rule_file_path(self, file_name):
+        """规则文件的完整路径"""
+        return os.path.join(self.template_dir, f"{file_name}.json")
+
+    def _read_rule_file(self, file_name):
+        """从磁盘读取规则文件内容，返回(stat结果, 内容)
+
+        先stat再读取：若读取期间文件被修改，下次比对stat时会自然失效
+        """
+        file_path = self._rule_file_path(file_name)
+        st = os.stat(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return st, f.read()
+
+    def _cache_get(self, file_name):
+        """从内容缓存中取出文件内容，文件修改时间或大小变化时视为未命中，返回None"""
+        with self._file_cache_lock:
+            entry = self._file_cache.get(file_name)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(self._rule_file_path(file_name))
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != entry[:2]:
+            return None
+        with self._file_cache_lock:
+            if file_name in self._file_cache:
+                self._file_cache.move_to_end(file_name)
+        return entry[2]
+
+    def _cache_put(self, file_name, st, content):
+        """写入内容缓存，超出容量时淘汰最久未使用的条目"""
+        with self._file_cache_lock:
+            self._file_cache[file_name] = (st.st_mtime_ns, st.st_size, content)
+            self._file_cache.move_to_end(file_name)
+            while len(self._file_cache) > self._CONTENT_CACHE_SIZE:
+                self._file_cache.popitem(last=False)
+
+    def _prefetch_neighbors(self, index):
+        """在后台预读当前文件前后相邻的文件，方向键切换时可直接命中缓存"""
+        with self._file_cache_lock:
+            names = [self._file_names[i] for i in (index - 1, index + 1)
+                     if 0 <= i < len(self._file_names)
+                     and self._file_names[i] not in self._file_cache]
+        if names:
+            threading.Thread(target=self._prefetch_files, args=(names,), daemon=True).start()
+
+    def _prefetch_files(self, names):
+        """后台线程：读取文件并放入缓存（不访问任何Tk组件）"""
+        for name in names:
+            try:
+                self._cache_put(name, *self._read_rule_file(name))
+            except (OSError, UnicodeDecodeError):
+                pass
 
+    def _on_text_modified(self, event=None):
+        """编辑器内容被修改时使缓存失效"""
+        if not self.json_text.edit_modified():
+            return
+        self._current_content = None
+        self._dirty = True
+        self.json_text.edit_modified(False)
+        self._schedule_syntax_check()
+
+    def _schedule_syntax_check(self):
+        """用户输入时推迟语法检查，停止输入一段时间后才解析一次"""
+        if self._pending_syntax_check is not None:
+            self.dialog.after_cancel(self._pending_syntax_check)
+        self._pending_syntax_check = self.dialog.after(self._SYNTAX_CHECK_DELAY_MS,
+                                                       self._check_syntax)
+
+    def _check_syntax(self):
+        """检查编辑器内容的JSON语法，结果显示在状态栏"""
+        self._pending_syntax_check = None
+        current_text = self._get_editor_content()
+        if not current_text:
+            return
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            self._parse_editor_json(current_text)
+            self.status_label.config(text="JSON格式正确")
+        except json.JSONDecodeError as e:
+            self.status_label.config(text=f"JSON格式错误：第{e.lineno}行，{e.msg}")
 
-            self.json_text.delete(1.0, tk.END)
+    def _set_editor_content(self, content):
+        """一次性写入编辑器内容并记录缓存"""
+        self.json_text.delete(1.0, tk.END)
+        if content:
             self.json_text.insert(tk.END, content)
+        self.json_text.edit_modified(False)
+        self._current_content = content
+
+    def _get_editor_content(self):
+        """获取编辑器内容，未修改时直接使用缓存"""
+        if self._current_content is not None:
+            return self._current_content.strip()
+        # 直接调用Tcl命令读取全文，end-1c已排除Text末尾自动追加的换行
+        return self.json_text.tk.call(self._json_text_path, 'get', '1.0', 'end-1c').strip()
+
+    def _parse_editor_json(self, text):
+        """解析编辑器中的JSON，文本未变化时复用上次的解析结果"""
+        if self._last_parsed is not None and self._last_parsed[0] == text:
+            return self._last_parsed[1]
+        parsed = _json_loads(text)
+        self._last_parsed = (text, parsed)
+        return parsed
+
+    def load_file_content(self, file_name):
+        """加载文件内容（优先使用缓存）"""
+        try:
+            content = self._cache_get(file_name)
+            if content is None:
+                st, content = self._read_rule_file(file_name)
+                self._cache_put(file_name, st, content)
+
+            self._set_editor_content(content)
+            self._dirty = False
 
             self.current_file_label.config(text=f"当前编辑：{file_name}.json")
             self.status_label.config(text="文件加载成功")
@@ -3394,7 +3837,7 @@ class RuleEditorDialog:
 
     def save_current_file(self):
         """保存当前文件"""
-        current_text = self.json_text.get(1.0, tk.END).strip()
+        current_text = self._get_editor_content()
         if not current_text:
             messagebox.showwarning("警告", "编辑器为空，无法保存")
             return
@@ -3405,16 +3848,28 @@ class RuleEditorDialog:
             messagebox.showwarning("警告", "请先选择要保存的文件")
             return
 
-        file_index = selection[0]
-        file_names = [self.file_listbox.get(i) for i in range(self.file_listbox.size())]
-        selected_name = file_names[file_index]
+        selected_name = self._file_names[selection[0]]
+
+        # 自上次加载/保存后内容未改动，无需写盘
+        if not self._dirty:
+            self.status_label.config(text="内容未修改，无需保存")
+            return
 
-        template_dir = self.template_dirs.get(self.rule_type)
-        file_path = Path(template_dir) / f"{selected_name}.json"
+        file_path = self._rule_file_path(selected_name)
+        # 先写入临时文件再替换原文件，写入中途出错不会破坏原有规则
+        tmp_path = file_path + '.tmp'
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(current_text)
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(current_text.encode('utf-8'))
+                os.replace(tmp_path, file_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._cache_put(selected_name, os.stat(file_path), current_text)
+            self._dirty = False
 
             self.status_label.config(text="文件保存成功")
             self.rule_modified = True
@@ -3428,17 +3883,17 @@ class RuleEditorDialog:
 
     def format_json(self):
         """格式化JSON"""
-        current_text = self.json_text.get(1.0, tk.END).strip()
+        current_text = self._get_editor_content()
         if not current_text:
             return
 
         try:
-            import json
-            parsed = json.loads(current_text)
-            formatted = json.dumps(parsed, ensure_ascii=False, indent=2)
+            parsed = self._parse_editor_json(current_text)
+            formatted = _json_dumps_pretty(parsed)
 
-            self.json_text.delete(1.0, tk.END)
-            self.json_text.insert(tk.END, formatted)
+            self._set_editor_content(formatted)
+            self._dirty = True
+            self._last_parsed = (formatted, parsed)
 
             self.status_label.config(text="JSON格式化完成")
 
@@ -3450,7 +3905,7 @@ class RuleEditorDialog:
 
     def validate_json(self):
         """验证JSON模板并显示详细报告"""
-        current_text = self.json_text.get(1.0, tk.END).strip()
+        current_text = self._get_editor_content()
         if not current_text:
             messagebox.showwarning("警告", "请先输入JSON内容")
             return
@@ -3458,21 +3913,21 @@ class RuleEditorDialog:
         try:
             # 使用专业验证器进行验证
             if validate_template_content:
-                validation_report = validate_template_content(current_text, "编辑器内容")
+                # 内容与上次验证时相同则直接复用报告
+                if self._last_report is not None and self._last_report[0] == current_text:
+                    validation_report = self._last_report[1]
+                else:
+                    validation_report = validate_template_content(current_text, "编辑器内容")
+                    self._last_report = (current_text, validation_report)
                 self.show_validation_report(validation_report)
             else:
                 # 退回基础验证
-                import json
-                parsed = json.loads(current_text)
+                parsed = self._parse_editor_json(current_text)
 
                 if not isinstance(parsed, dict):
                     raise ValueError("JSON必须是对象类型")
 
-                missing_fields = []
-                if 'name' not in parsed:
-                    missing_fields.append('name')
-                if 'description' not in parsed:
-                    missing_fields.append('description')
+                missing_fields = [field for field in _BASIC_RECOMMENDED_FIELDS if field not in parsed]
 
                 if missing_fields:
                     messagebox.showwarning("验证建议",
@@ -3488,20 +3943,143 @@ class RuleEditorDialog:
             self.status_label.config(text=f"验证失败：{str(e)}")
             messagebox.showerror("错误", f"验证过程中发生错误：\n\n{str(e)}")
 
+    def delete_file(self):
+        """删除文件"""
+        selection = self.file_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("警告", "请先选择要删除的规则文件")
+            return
+
+        selected_name = self._file_names[selection[0]]
+
+        # 确认删除
+        result = messagebox.askyesno("确认删除",
+                                   f"确定要删除规则文件：{selected_name}.json 吗？\n\n此操作不可撤销！")
+
+        if not result:
+            return
+
+        file_path = self._rule_file_path(selected_name)
+
+        try:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+                self.refresh_file_list()
+                self._set_editor_content("")
+                self._dirty = False
+                self.current_file_label.config(text="未选择文件")
+                self.status_label.config(text=f"规则已删除：{selected_name}")
+
+                if self.log_callback:
+                    self.log_callback(f"规则已删除：{selected_name}.json")
+            else:
+                self.status_label.config(text="文件不存在")
+
+        except Exception as e:
+            messagebox.showerror("错误", f"删除失败：{str(e)}")
+
+    def create_new_file(self):
+        """新建规则文件"""
+        # 创建新规则对话框
+        dialog = tk.Toplevel(self.dialog)
+        dialog.title("新建规则")
+        dialog.geometry("400x200")
+        dialog.transient(self.dialog)
+        dialog.grab_set()
+
+        # 居中显示
+        dialog.geometry("+%d+%d" % (self.dialog.winfo_rootx() + 100, self.dialog.winfo_rooty() + 100))
+
+        # 规则名称输入
+        name_frame = ttk.Frame(dialog)
+        name_frame.pack(fill='x', padx=20, pady=10)
+
+        ttk.Label(name_frame, text="规则名称：").pack(side='left')
+        name_var = tk.StringVar()
+        name_entry = ttk.Entry(name_frame, textvariable=name_var, width=30)
+        name_entry.pack(side='left', padx=(10, 0))
+
+        # 按钮
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(fill='x', padx=20, pady=10)
+
+        def create_rule():
+            rule_name = name_var.get().strip()
+            if not rule_name:
+                messagebox.showwarning("警告", "请输入规则名称")
+                return
+
+            # 检查是否已存在
+            file_path = self._rule_file_path(rule_name)
+
+            # 创建基础JSON结构
+            base_structure = self.get_base_rule_structure()
+
+            try:
+                # 先整体序列化为字节；以独占方式创建文件（'xb'），已存在时直接报错，
+                # 检查与创建在同一次系统调用中完成
+                content = _json_dumps_pretty_bytes(base_structure)
+                try:
+                    with open(file_path, 'xb') as f:
+                        f.write(content)
+                except FileExistsError:
+                    messagebox.showwarning("警告", f"规则文件已存在：{rule_name}.json")
+                    return
+
+                self.refresh_file_list()
+
+                # 自动选择新创建的文件
+                if rule_name in self._file_names:
+                    self.file_listbox.selection_set(self._file_names.index(rule_name))
+                    self.load_file_content(rule_name)
+
+                self.status_label.config(text=f"新规则已创建：{rule_name}")
+                dialog.destroy()
+
+                if self.log_callback:
+                    self.log_callback(f"新规则已创建：{rule_name}.json")
+
+            except Exception as e:
+                messagebox.showerror("错误", f"创建失败：{str(e)}")
+
+        ttk.Button(btn_frame, text="创建",
+                  command=create_rule).pack(side='left', padx=(0, 10))
+        ttk.Button(btn_frame, text="取消",
+                  command=dialog.destroy).pack(side='left')
+
+        # 设置焦点
+        name_entry.focus()
+
+    def get_base_rule_structure(self):
+        """获取基础规则结构（返回副本，调用方可随意修改）"""
+        return copy.deepcopy(_BASE_STRUCTURES.get(self.rule_type, _DEFAULT_STRUCTURE))
+
     def show_validation_report(self, report_text):
-        """显示详细的验证报告对话框"""
-        # 创建验证报告对话框
-        report_window = tk.Toplevel(self.master)
+        """显示详细的验证报告对话框（窗口只创建一次，之后隐藏/显示复用）"""
+        if self._report_window is None or not self._report_window.winfo_exists():
+            self._build_report_window()
+        self._report_text = report_text
+
+        # 只替换文本内容（各段落连同标签一次插入）
+        report_text_widget = self._report_text_widget
+        report_text_widget.config(state=tk.NORMAL)
+        report_text_widget.delete(1.0, tk.END)
+        tokens = _tokenize_validation_report(report_text)
+        if tokens:
+            report_text_widget.insert(tk.END, *tokens)
+        report_text_widget.config(state=tk.DISABLED)  # 设置为只读
+
+        self._report_window.deiconify()
+        self._report_window.lift()
+        self._report_window.grab_set()
+
+    def _build_report_window(self):
+        """创建验证报告窗口"""
+        report_window = tk.Toplevel(self.dialog)
         report_window.title("模板验证报告")
         report_window.geometry("800x600")
-        report_window.transient(self.master)
-        report_window.grab_set()
-
-        # 设置窗口图标（如果有的话）
-        try:
-            report_window.iconbitmap(self.icon_path)
-        except:
-            pass
+        report_window.transient(self.dialog)
+        report_window.protocol("WM_DELETE_WINDOW", self._hide_report_window)
 
         # 创建主框架
         main_frame = ttk.Frame(report_window, padding="10")
@@ -3534,56 +4112,22 @@ class RuleEditorDialog:
         # 配置滚动条
         scrollbar.config(command=report_text_widget.yview)
 
-        # 插入验证报告
-        report_text_widget.insert(tk.END, report_text)
-        report_text_widget.config(state=tk.DISABLED)  # 设置为只读
-
         # 为不同类型的内容设置颜色
-        self._colorize_validation_report(report_text_widget, report_text)
+        report_text_widget.tag_configure("error", foreground="#DC143C")
+        report_text_widget.tag_configure("warning", foreground="#FF8C00")
+        report_text_widget.tag_configure("success", foreground="#2E8B57")
 
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
 
-        def copy_report():
-            """复制报告到剪贴板"""
-            try:
-                import pyperclip
-                pyperclip.copy(report_text)
-                messagebox.showinfo("提示", "验证报告已复制到剪贴板")
-            except ImportError:
-                # 如果没有pyperclip，使用tkinter自带的剪贴板
-                report_text_widget.config(state=tk.NORMAL)
-                content = report_text_widget.get(1.0, tk.END)
-                report_text_widget.config(state=tk.DISABLED)
-                self.master.clipboard_clear()
-                self.master.clipboard_append(content.strip())
-                self.master.update()
-                messagebox.showinfo("提示", "验证报告已复制到剪贴板")
-
-        def save_report():
-            """保存报告到文件"""
-            from tkinter import filedialog
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")],
-                title="保存验证报告"
-            )
-            if file_path:
-                try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(report_text)
-                    messagebox.showinfo("成功", f"验证报告已保存到：\n{file_path}")
-                except Exception as e:
-                    messagebox.showerror("错误", f"保存失败：{str(e)}")
-
         # 按钮
         ttk.Button(button_frame, text="复制报告",
-                  command=copy_report).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._copy_report).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="保存报告",
-                  command=save_report).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._save_report).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="关闭",
-                  command=report_window.destroy).pack(side=tk.RIGHT)
+                  command=self._hide_report_window).pack(side=tk.RIGHT)
 
         # 居中显示窗口
         report_window.update_idletasks()
@@ -3591,18 +4135,86 @@ class RuleEditorDialog:
         y = (report_window.winfo_screenheight() - report_window.winfo_height()) // 2
         report_window.geometry(f"+{x}+{y}")
 
-    def _colorize_validation_report(self, text_widget, report_text):
-        """设置验证报告样式（纯黑色文本）"""
-        # 不使用颜色标签，保持纯黑色文本显示
-        pass
+        self._report_window = report_window
+        self._report_text_widget = report_text_widget
+
+    def _hide_report_window(self):
+        """隐藏验证报告窗口（保留以便下次复用）"""
+        self._report_window.grab_release()
+        self._report_window.withdraw()
+
+    def _copy_report(self):
+        """复制报告到剪贴板"""
+        if pyperclip is not None:
+            pyperclip.copy(self._report_text)
+        else:
+            # 如果没有pyperclip，使用tkinter自带的剪贴板
+            self.dialog.clipboard_clear()
+            self.dialog.clipboard_append(self._report_text.strip())
+            self.dialog.update()
+        messagebox.showinfo("提示", "验证报告已复制到剪贴板")
+
+    def _save_report(self):
+        """保存报告到文件"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")],
+            title="保存验证报告"
+        )
+        if file_path:
+            # 在后台线程中写文件，完成后回到Tk主线程提示结果
+            executor = ThreadPoolExecutor(max_workers=1)
+            future = executor.submit(self._write_report_file, file_path, self._report_text)
+            executor.shutdown(wait=False)
+            self._finish_save_report(future, file_path)
+
+    @staticmethod
+    def _write_report_file(file_path, report_text):
+        """写入验证报告文件（在后台线程中执行）"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(report_text)
+
+    def _finish_save_report(self, future, file_path):
+        """等待报告写入完成后提示结果"""
+        try:
+            if not self.dialog.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if not future.done():
+            self.dialog.after(50, self._finish_save_report, future, file_path)
+            return
+
+        error = future.exception()
+        if error is None:
+            messagebox.showinfo("成功", f"验证报告已保存到：\n{file_path}")
+        else:
+            messagebox.showerror("错误", f"保存失败：{str(error)}")
 
     def show_json_error_dialog(self, error_msg, original_error):
-        """显示JSON错误对话框"""
-        error_window = tk.Toplevel(self.master)
+        """显示JSON错误对话框（窗口只创建一次，之后隐藏/显示复用）"""
+        if self._error_window is None or not self._error_window.winfo_exists():
+            self._build_error_window()
+        self._error_msg = error_msg
+
+        error_text = self._error_text_widget
+        error_text.config(state=tk.NORMAL)
+        error_text.delete(1.0, tk.END)
+        error_text.insert(tk.END, f"错误信息：{error_msg}\n\n原始错误：{str(original_error)}\n\n{_JSON_ERROR_TIPS}")
+        error_text.config(state=tk.DISABLED)
+
+        self._error_window.deiconify()
+        self._error_window.lift()
+        self._error_window.grab_set()
+
+    def _build_error_window(self):
+        """创建JSON错误窗口"""
+        error_window = tk.Toplevel(self.dialog)
         error_window.title("JSON格式错误")
         error_window.geometry("600x400")
-        error_window.transient(self.master)
-        error_window.grab_set()
+        error_window.transient(self.dialog)
+        error_window.protocol("WM_DELETE_WINDOW", self._hide_error_window)
 
         # 主框架
         main_frame = ttk.Frame(error_window, padding="20")
@@ -3625,14 +4237,6 @@ class RuleEditorDialog:
         # 创建文本区域显示错误信息
         error_text = tk.Text(details_frame, wrap=tk.WORD, height=8, font=("微软雅黑", 10))
         error_text.pack(fill=tk.BOTH, expand=True)
-        error_text.insert(tk.END, f"错误信息：{error_msg}\n\n")
-        error_text.insert(tk.END, f"原始错误：{str(original_error)}\n\n")
-        error_text.insert(tk.END, "常见解决方案：\n")
-        error_text.insert(tk.END, "• 检查引号是否正确配对\n")
-        error_text.insert(tk.END, "• 检查逗号是否正确放置\n")
-        error_text.insert(tk.END, "• 检查括号是否正确闭合\n")
-        error_text.insert(tk.END, "• 确认所有字符串都用双引号包围\n")
-        error_text.config(state=tk.DISABLED)
 
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
@@ -3641,15 +4245,15 @@ class RuleEditorDialog:
         def go_to_error_line():
             """跳转到错误行"""
             # 这里可以添加跳转到错误行的逻辑
-            error_window.destroy()
+            self._hide_error_window()
             messagebox.showinfo("提示", "请检查JSON编辑器中的对应行")
 
         ttk.Button(button_frame, text="转到错误行",
                   command=go_to_error_line).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="复制错误",
-                  command=lambda: self.copy_to_clipboard(error_msg)).pack(side=tk.LEFT, padx=(0, 5))
+                  command=lambda: self.copy_to_clipboard(self._error_msg)).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="关闭",
-                  command=error_window.destroy).pack(side=tk.RIGHT)
+                  command=self._hide_error_window).pack(side=tk.RIGHT)
 
         # 居中显示
         error_window.update_idletasks()
@@ -3657,828 +4261,55 @@ class RuleEditorDialog:
         y = (error_window.winfo_screenheight() - error_window.winfo_height()) // 2
         error_window.geometry(f"+{x}+{y}")
 
+        self._error_window = error_window
+        self._error_text_widget = error_text
+
+    def _hide_error_window(self):
+        """隐藏JSON错误窗口（保留以便下次复用）"""
+        self._error_window.grab_release()
+        self._error_window.withdraw()
+
     def copy_to_clipboard(self, text):
         """复制文本到剪贴板"""
-        try:
-            import pyperclip
+        if pyperclip is not None:
             pyperclip.copy(text)
-            messagebox.showinfo("提示", "文本已复制到剪贴板")
-        except ImportError:
+        else:
             # 如果没有pyperclip，使用tkinter自带的剪贴板
-            self.master.clipboard_clear()
-            self.master.clipboard_append(text)
-            self.master.update()
-            messagebox.showinfo("提示", "文本已复制到剪贴板")
-
-    def create_new_rule(self):
-        """新建规则"""
-        # 创建新规则对话框
-        dialog = tk.Toplevel(self.dialog)
-        dialog.title("新建规则")
-        dialog.geometry("400x200")
-        dialog.transient(self.dialog)
-        dialog.grab_set()
-
-        # 居中显示
-        dialog.geometry("+%d+%d" % (self.dialog.winfo_rootx() + 100, self.dialog.winfo_rooty() + 100))
-
-        # 规则名称输入
-        name_frame = ttk.Frame(dialog)
-        name_frame.pack(fill='x', padx=20, pady=10)
-
-        ttk.Label(name_frame, text="规则名称：").pack(side='left')
-        name_var = tk.StringVar()
-        name_entry = ttk.Entry(name_frame, textvariable=name_var, width=30)
-        name_entry.pack(side='left', padx=(10, 0))
-
-        # 按钮
-        btn_frame = ttk.Frame(dialog)
-        btn_frame.pack(fill='x', padx=20, pady=10)
-
-        def create_rule():
-            rule_name = name_var.get().strip()
-            if not rule_name:
-                messagebox.showwarning("警告", "请输入规则名称")
-                return
-
-            # 检查是否已存在
-            template_dir = self.template_dirs.get(self.rule_type)
-            file_path = Path(template_dir) / f"{rule_name}.json"
-
-            if file_path.exists():
-                messagebox.showwarning("警告", f"规则文件已存在：{rule_name}.json")
-                return
-
-            # 创建基础JSON结构
-            base_structure = self.get_base_rule_structure()
-
-            try:
-                import json
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(base_structure, f, ensure_ascii=False, indent=2)
-
-                self.refresh_file_list()
-
-                # 自动选择新创建的文件
-                for i in range(self.file_listbox.size()):
-                    if self.file_listbox.get(i) == rule_name:
-                        self.file_listbox.selection_set(i)
-                        self.load_file_content(rule_name)
-                        break
-
-                self.status_label.config(text=f"新规则已创建：{rule_name}")
-                dialog.destroy()
-
-                if self.log_callback:
-                    self.log_callback(f"新规则已创建：{rule_name}.json")
-
-            except Exception as e:
-                messagebox.showerror("错误", f"创建规则失败：{str(e)}")
-
-        ttk.Button(btn_frame, text="创建", command=create_rule).pack(side='right', padx=(0, 5))
-        ttk.Button(btn_frame, text="取消", command=dialog.destroy).pack(side='right')
-
-    def get_base_rule_structure(self):
-        """获取基础规则结构"""
-        if self.rule_type == "重命名规则":
-            return {
-                "name": "新重命名规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": {
-                    "示例规则": "示例模式"
-                }
-            }
-        elif self.rule_type == "文件夹提取规则":
-            return {
-                "name": "新文件夹提取规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": [
-                    {
-                        "pattern": "*示例*",
-                        "type": "folder",
-                        "description": "示例规则"
-                    }
-                ]
-            }
-        elif self.rule_type == "Word转PDF规则":
-            return {
-                "name": "新Word转PDF规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": {
-                    "示例文档类型": ["示例文件夹路径"]
-                },
-                "keep_original_files": True
-            }
-        elif self.rule_type == "清理规则":
-            return {
-                "name": "新清理规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": [
-                    {
-                        "pattern": "示例模式",
-                        "type": "folder",
-                        "description": "示例规则"
-                    }
-                ]
-            }
-        else:
-            return {
-                "name": "新规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户"
-            }
-
-    def delete_rule(self):
-        """删除规则"""
-        selection = self.file_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("警告", "请先选择要删除的规则")
-            return
-
-        file_index = selection[0]
-        file_names = [self.file_listbox.get(i) for i in range(self.file_listbox.size())]
-        selected_name = file_names[file_index]
-
-        # 确认删除
-        result = messagebox.askyesno("确认删除",
-                                   f"确定要删除规则文件：{selected_name}.json 吗？\n\n此操作不可撤销！")
-
-        if not result:
-            return
-
-        template_dir = self.template_dirs.get(self.rule_type)
-        file_path = Path(template_dir) / f"{selected_name}.json"
-
-        try:
-            if file_path.exists():
-                file_path.unlink()
-                self.refresh_file_list()
-                self.json_text.delete(1.0, tk.END)
-                self.current_file_label.config(text="未选择文件")
-                self.status_label.config(text=f"规则已删除：{selected_name}")
-
-                if self.log_callback:
-                    self.log_callback(f"规则已删除：{selected_name}.json")
-            else:
-                self.status_label.config(text="文件不存在")
-
-        except Exception as e:
-            messagebox.showerror("错误", f"删除失败：{str(e)}")
+            self.dialog.clipboard_clear()
+            self.dialog.clipboard_append(text)
+            self.dialog.update()
+        messagebox.showinfo("提示", "文本已复制到剪贴板")
 
     def close_dialog(self):
         """关闭对话框"""
+        for pending in (self._pending_load, self._pending_syntax_check):
+            if pending is not None:
+                self.dialog.after_cancel(pending)
+        self._pending_load = self._pending_syntax_check = None
         self.dialog.destroy()
 
 
-class RuleFileEditorDialog:
-    """规则文件编辑器对话框"""
-
-    def __init__(self, parent, rule_type, log_callback=None):
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title(f"编辑{rule_type}")
-        self.dialog.geometry("1000x700")
-        self.dialog.resizable(True, True)
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-
-        # 居中显示
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 30))
-
-        self.rule_type = rule_type
-        self.log_callback = log_callback
-        self.rule_modified = False
-
-        # 获取模板文件夹路径（使用get_resource_path支持打包后的exe）
-        self.template_dirs = {
-            "重命名规则": get_resource_path("template/rename_templates"),
-            "文件夹提取规则": get_resource_path("template/folder_templates"),
-            "Word转PDF规则": get_resource_path("template/word_to_pdf_templates"),
-            "清理规则": get_resource_path("template/clean_templates"),
-            "材料包查找规则": get_resource_path("template/data_read_templates")
-        }
-
-        self.create_widgets()
-        self.load_rule_files()
-
-    def create_widgets(self):
-        """创建对话框组件"""
-        # 主框架
-        main_frame = ttk.Frame(self.dialog)
-        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
-
-        # 顶部标题区域
-        title_frame = ttk.Frame(main_frame)
-        title_frame.pack(fill='x', pady=(0, 10))
-
-        title_label = ttk.Label(title_frame, text=f"编辑{self.rule_type}",
-                               font=('Microsoft YaHei', 14, 'bold'))
-        title_label.pack()
-
-        subtitle_label = ttk.Label(title_frame, text="选择规则文件进行编辑，修改后点击保存",
-                                  font=('Microsoft YaHei', 10))
-        subtitle_label.pack()
-
-        # 左侧文件选择区域
-        left_frame = ttk.LabelFrame(main_frame, text="规则文件", padding=10)
-        left_frame.pack(side='left', fill='y', padx=(0, 10))
-
-        # 创建上下分隔的布局
-        left_paned = ttk.PanedWindow(left_frame, orient='vertical')
-        left_paned.pack(fill='both', expand=True)
-
-        # 上半部分：规则文件列表区域
-        top_frame = ttk.Frame(left_paned)
-        left_paned.add(top_frame, weight=1)
-
-        # 文件列表
-        self.file_listbox = tk.Listbox(top_frame, width=30, height=8,
-                                      font=('Microsoft YaHei', 10))
-        self.file_listbox.pack(fill='both', expand=True)
-
-        # 绑定选择事件
-        self.file_listbox.bind('<<ListboxSelect>>', self.on_file_selected)
-
-        # 文件操作按钮
-        file_btn_frame = ttk.Frame(top_frame)
-        file_btn_frame.pack(fill='x', pady=(5, 0))
-
-        ttk.Button(file_btn_frame, text="刷新",
-                  command=self.refresh_file_list).pack(side='left', padx=(0, 5))
-        ttk.Button(file_btn_frame, text="新建",
-                  command=self.create_new_file).pack(side='left', padx=(0, 5))
-        ttk.Button(file_btn_frame, text="删除",
-                  command=self.delete_file).pack(side='left')
-
-        # 下半部分：状态信息区域
-        bottom_frame = ttk.Frame(left_paned)
-        left_paned.add(bottom_frame, weight=1)
-
-        # 创建带边框的状态信息区域
-        status_container = ttk.LabelFrame(bottom_frame, text="状态信息", padding=5)
-        status_container.pack(fill='both', expand=True)
-
-        self.status_label = ttk.Label(status_container, text="就绪",
-                                     font=('Microsoft YaHei', 9), width=30)
-        self.status_label.pack(side='left', anchor='w', fill='x')
-
-        # 右侧编辑区域
-        right_frame = ttk.LabelFrame(main_frame, text="规则编辑器", padding=10)
-        right_frame.pack(side='right', fill='both', expand=True)
-
-        # 编辑工具栏
-        toolbar_frame = ttk.Frame(right_frame)
-        toolbar_frame.pack(fill='x', pady=(0, 10))
-
-        self.current_file_label = ttk.Label(toolbar_frame, text="未选择文件",
-                                           font=('Microsoft YaHei', 9))
-        self.current_file_label.pack(side='left')
-
-        ttk.Button(toolbar_frame, text="保存",
-                  command=self.save_current_file).pack(side='right', padx=(0, 5))
-        ttk.Button(toolbar_frame, text="格式化",
-                  command=self.format_json).pack(side='right', padx=(0, 5))
-        ttk.Button(toolbar_frame, text="验证",
-                  command=self.validate_json).pack(side='right')
-
-        # JSON编辑器
-        self.json_text = scrolledtext.ScrolledText(right_frame,
-                                                  wrap=tk.WORD,
-                                                  font=('Consolas', 9))
-        self.json_text.pack(fill='both', expand=True)
-
-        # 关闭按钮（移动到右侧底部）
-        close_frame = ttk.Frame(right_frame)
-        close_frame.pack(fill='x', pady=(10, 0))
-
-        ttk.Button(close_frame, text="关闭",
-                  command=self.close_dialog).pack(side='right')
-
-    def load_rule_files(self):
-        """加载规则文件列表"""
-        self.file_listbox.delete(0, tk.END)
-
-        template_dir = self.template_dirs.get(self.rule_type)
-        if not template_dir:
-            self.status_label.config(text="错误：未找到规则类型目录")
-            return
-
-        from pathlib import Path
-        rule_path = Path(template_dir)
-
-        if not rule_path.exists():
-            self.status_label.config(text=f"目录不存在：{template_dir}")
-            return
-
-        # 查找所有JSON文件
-        json_files = list(rule_path.glob("*.json"))
-        if not json_files:
-            self.status_label.config(text="未找到规则文件")
-            return
-
-        for json_file in json_files:
-            display_name = f"{json_file.stem}"
-            self.file_listbox.insert(tk.END, display_name)
-
-        self.status_label.config(text=f"找到 {len(json_files)} 个规则文件")
-
-    def refresh_file_list(self):
-        """刷新文件列表"""
-        self.load_rule_files()
-
-    def on_file_selected(self, event):
-        """文件选择事件"""
-        selection = self.file_listbox.curselection()
-        if not selection:
-            return
-
-        file_index = selection[0]
-        file_names = [self.file_listbox.get(i) for i in range(self.file_listbox.size())]
-
-        if file_index < len(file_names):
-            selected_name = file_names[file_index]
-            self.load_file_content(selected_name)
-
-    def load_file_content(self, file_name):
-        """加载文件内容"""
-        template_dir = self.template_dirs.get(self.rule_type)
-        file_path = Path(template_dir) / f"{file_name}.json"
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            self.json_text.delete(1.0, tk.END)
-            self.json_text.insert(tk.END, content)
-
-            self.current_file_label.config(text=f"当前编辑：{file_name}.json")
-            self.status_label.config(text="文件加载成功")
+class RuleEditorDialog(_BaseRuleEditorDialog):
+    """规则编辑对话框"""
 
-        except Exception as e:
-            self.status_label.config(text=f"加载失败：{str(e)}")
-            messagebox.showerror("错误", f"无法加载文件：{str(e)}")
+    _GEOMETRY = "900x700"
+    _FILE_BUTTON_TEXTS = ("刷新列表", "新建规则", "删除规则")
 
-    def save_current_file(self):
-        """保存当前文件"""
-        current_text = self.json_text.get(1.0, tk.END).strip()
-        if not current_text:
-            messagebox.showwarning("警告", "编辑器为空，无法保存")
-            return
+    def __init__(self, parent, rule_type, rules, log_callback=None):
+        self.rules = rules
+        super().__init__(parent, rule_type, log_callback)
 
-        # 获取当前选择的文件名
-        selection = self.file_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("警告", "请先选择要保存的文件")
-            return
+    def create_new_rule(self):
+        """新建规则"""
+        self.create_new_file()
 
-        file_index = selection[0]
-        file_names = [self.file_listbox.get(i) for i in range(self.file_listbox.size())]
-        selected_name = file_names[file_index]
+    def delete_rule(self):
+        """删除规则"""
+        self.delete_file()
 
-        template_dir = self.template_dirs.get(self.rule_type)
-        file_path = Path(template_dir) / f"{selected_name}.json"
 
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(current_text)
-
-            self.status_label.config(text="文件保存成功")
-            self.rule_modified = True
-
-            if self.log_callback:
-                self.log_callback(f"规则文件已保存：{selected_name}.json")
-
-        except Exception as e:
-            self.status_label.config(text=f"保存失败：{str(e)}")
-            messagebox.showerror("错误", f"无法保存文件：{str(e)}")
-
-    def format_json(self):
-        """格式化JSON"""
-        current_text = self.json_text.get(1.0, tk.END).strip()
-        if not current_text:
-            return
-
-        try:
-            import json
-            parsed = json.loads(current_text)
-            formatted = json.dumps(parsed, ensure_ascii=False, indent=2)
-
-            self.json_text.delete(1.0, tk.END)
-            self.json_text.insert(tk.END, formatted)
-
-            self.status_label.config(text="JSON格式化完成")
-
-        except json.JSONDecodeError as e:
-            self.status_label.config(text=f"JSON格式错误：{str(e)}")
-            messagebox.showerror("错误", f"JSON格式错误：{str(e)}")
-        except Exception as e:
-            self.status_label.config(text=f"格式化失败：{str(e)}")
-
-    def validate_json(self):
-        """验证JSON模板并显示详细报告"""
-        current_text = self.json_text.get(1.0, tk.END).strip()
-        if not current_text:
-            messagebox.showwarning("警告", "请先输入JSON内容")
-            return
-
-        try:
-            # 使用专业验证器进行验证
-            if validate_template_content:
-                validation_report = validate_template_content(current_text, "编辑器内容")
-                self.show_validation_report(validation_report)
-            else:
-                # 退回基础验证
-                import json
-                parsed = json.loads(current_text)
-
-                if not isinstance(parsed, dict):
-                    raise ValueError("JSON必须是对象类型")
-
-                missing_fields = []
-                if 'name' not in parsed:
-                    missing_fields.append('name')
-                if 'description' not in parsed:
-                    missing_fields.append('description')
-
-                if missing_fields:
-                    messagebox.showwarning("验证建议",
-                        f"建议添加以下字段：\n{', '.join(missing_fields)}")
-
-                self.status_label.config(text="基础验证通过")
-
-        except json.JSONDecodeError as e:
-            error_msg = f"JSON格式错误：第{e.lineno}行，{e.msg}"
-            self.status_label.config(text=error_msg)
-            self.show_json_error_dialog(error_msg, e)
-        except Exception as e:
-            self.status_label.config(text=f"验证失败：{str(e)}")
-            messagebox.showerror("错误", f"验证过程中发生错误：\n\n{str(e)}")
-
-    def delete_file(self):
-        """删除文件"""
-        selection = self.file_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("警告", "请先选择要删除的规则文件")
-            return
-
-        file_index = selection[0]
-        file_names = [self.file_listbox.get(i) for i in range(self.file_listbox.size())]
-        selected_name = file_names[file_index]
-
-        # 确认删除
-        result = messagebox.askyesno("确认删除",
-                                   f"确定要删除规则文件：{selected_name}.json 吗？\n\n此操作不可撤销！")
-
-        if not result:
-            return
-
-        template_dir = self.template_dirs.get(self.rule_type)
-        file_path = Path(template_dir) / f"{selected_name}.json"
-
-        try:
-            if file_path.exists():
-                file_path.unlink()
-                self.refresh_file_list()
-                self.json_text.delete(1.0, tk.END)
-                self.current_file_label.config(text="未选择文件")
-                self.status_label.config(text=f"规则已删除：{selected_name}")
-
-                if self.log_callback:
-                    self.log_callback(f"规则已删除：{selected_name}.json")
-            else:
-                self.status_label.config(text="文件不存在")
-
-        except Exception as e:
-            messagebox.showerror("错误", f"删除失败：{str(e)}")
-
-    def create_new_file(self):
-        """新建规则文件"""
-        # 创建新规则对话框
-        dialog = tk.Toplevel(self.dialog)
-        dialog.title("新建规则")
-        dialog.geometry("400x200")
-        dialog.transient(self.dialog)
-        dialog.grab_set()
-
-        # 居中显示
-        dialog.geometry("+%d+%d" % (self.dialog.winfo_rootx() + 100, self.dialog.winfo_rooty() + 100))
-
-        # 规则名称输入
-        name_frame = ttk.Frame(dialog)
-        name_frame.pack(fill='x', padx=20, pady=10)
-
-        ttk.Label(name_frame, text="规则名称：").pack(side='left')
-        name_var = tk.StringVar()
-        name_entry = ttk.Entry(name_frame, textvariable=name_var, width=30)
-        name_entry.pack(side='left', padx=(10, 0))
-
-        # 按钮
-        btn_frame = ttk.Frame(dialog)
-        btn_frame.pack(fill='x', padx=20, pady=10)
-
-        def create_rule():
-            rule_name = name_var.get().strip()
-            if not rule_name:
-                messagebox.showwarning("警告", "请输入规则名称")
-                return
-
-            # 检查是否已存在
-            template_dir = self.template_dirs.get(self.rule_type)
-            file_path = Path(template_dir) / f"{rule_name}.json"
-
-            if file_path.exists():
-                messagebox.showwarning("警告", f"规则文件已存在：{rule_name}.json")
-                return
-
-            # 创建基础JSON结构
-            base_structure = self.get_base_rule_structure()
-
-            try:
-                import json
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(base_structure, f, ensure_ascii=False, indent=2)
-
-                self.refresh_file_list()
-
-                # 自动选择新创建的文件
-                for i in range(self.file_listbox.size()):
-                    if self.file_listbox.get(i) == rule_name:
-                        self.file_listbox.selection_set(i)
-                        self.load_file_content(rule_name)
-                        break
-
-                dialog.destroy()
-
-                if self.log_callback:
-                    self.log_callback(f"新规则已创建：{rule_name}.json")
-
-            except Exception as e:
-                messagebox.showerror("错误", f"创建失败：{str(e)}")
-
-        ttk.Button(btn_frame, text="创建",
-                  command=create_rule).pack(side='left', padx=(0, 10))
-        ttk.Button(btn_frame, text="取消",
-                  command=dialog.destroy).pack(side='left')
-
-        # 设置焦点
-        name_entry.focus()
-
-    def get_base_rule_structure(self):
-        """获取基础规则结构"""
-        if self.rule_type == "重命名规则":
-            return {
-                "name": "新重命名规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": {
-                    "示例规则": "示例模式"
-                }
-            }
-        elif self.rule_type == "文件夹提取规则":
-            return {
-                "name": "新文件夹提取规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": [
-                    {
-                        "pattern": "*示例*",
-                        "type": "folder",
-                        "description": "示例规则"
-                    }
-                ]
-            }
-        elif self.rule_type == "Word转PDF规则":
-            return {
-                "name": "新Word转PDF规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": {
-                    "示例文档类型": ["示例文件夹路径"]
-                },
-                "keep_original_files": True
-            }
-        elif self.rule_type == "清理规则":
-            return {
-                "name": "新清理规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": [
-                    {
-                        "pattern": "示例模式",
-                        "type": "folder",
-                        "description": "示例规则"
-                    }
-                ]
-            }
-        elif self.rule_type == "材料包查找规则":
-            return {
-                "name": "新材料包查找规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户",
-                "rules": {
-                    "示例规则": "示例模式"
-                }
-            }
-        else:
-            return {
-                "name": "新规则",
-                "description": "请输入规则描述",
-                "version": "1.0.0",
-                "author": "用户"
-            }
-
-    def show_validation_report(self, report_text):
-        """显示详细的验证报告对话框"""
-        # 创建验证报告对话框
-        report_window = tk.Toplevel(self.dialog)
-        report_window.title("模板验证报告")
-        report_window.geometry("800x600")
-        report_window.transient(self.dialog)
-        report_window.grab_set()
-
-        # 创建主框架
-        main_frame = ttk.Frame(report_window, padding="10")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        # 标题标签
-        title_label = ttk.Label(main_frame,
-                               text="企业文档模板验证报告",
-                               font=("微软雅黑", 14, "bold"),
-                               foreground="#2E8B57")
-        title_label.pack(pady=(0, 10))
-
-        # 创建文本区域和滚动条
-        text_frame = ttk.Frame(main_frame)
-        text_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-
-        # 创建滚动条
-        scrollbar = ttk.Scrollbar(text_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # 创建文本区域
-        report_text_widget = tk.Text(text_frame,
-                                   wrap=tk.WORD,
-                                   yscrollcommand=scrollbar.set,
-                                   font=("Consolas", 10),
-                                   padx=10,
-                                   pady=10)
-        report_text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        # 配置滚动条
-        scrollbar.config(command=report_text_widget.yview)
-
-        # 插入验证报告
-        report_text_widget.insert(tk.END, report_text)
-        report_text_widget.config(state=tk.DISABLED)  # 设置为只读
-
-        # 为不同类型的内容设置颜色
-        self._colorize_validation_report(report_text_widget, report_text)
-
-        # 按钮框架
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(10, 0))
-
-        def copy_report():
-            """复制报告到剪贴板"""
-            try:
-                import pyperclip
-                pyperclip.copy(report_text)
-                messagebox.showinfo("提示", "验证报告已复制到剪贴板")
-            except ImportError:
-                # 如果没有pyperclip，使用tkinter自带的剪贴板
-                report_text_widget.config(state=tk.NORMAL)
-                content = report_text_widget.get(1.0, tk.END)
-                report_text_widget.config(state=tk.DISABLED)
-                self.dialog.clipboard_clear()
-                self.dialog.clipboard_append(content.strip())
-                self.dialog.update()
-                messagebox.showinfo("提示", "验证报告已复制到剪贴板")
-
-        def save_report():
-            """保存报告到文件"""
-            from tkinter import filedialog
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")],
-                title="保存验证报告"
-            )
-            if file_path:
-                try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(report_text)
-                    messagebox.showinfo("成功", f"验证报告已保存到：\n{file_path}")
-                except Exception as e:
-                    messagebox.showerror("错误", f"保存失败：{str(e)}")
-
-        # 按钮
-        ttk.Button(button_frame, text="复制报告",
-                  command=copy_report).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="保存报告",
-                  command=save_report).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="关闭",
-                  command=report_window.destroy).pack(side=tk.RIGHT)
-
-        # 居中显示窗口
-        report_window.update_idletasks()
-        x = (report_window.winfo_screenwidth() - report_window.winfo_width()) // 2
-        y = (report_window.winfo_screenheight() - report_window.winfo_height()) // 2
-        report_window.geometry(f"+{x}+{y}")
-
-    def _colorize_validation_report(self, text_widget, report_text):
-        """设置验证报告样式（纯黑色文本）"""
-        # 不使用颜色标签，保持纯黑色文本显示
-        pass
-
-    def show_json_error_dialog(self, error_msg, original_error):
-        """显示JSON错误对话框"""
-        error_window = tk.Toplevel(self.dialog)
-        error_window.title("JSON格式错误")
-        error_window.geometry("600x400")
-        error_window.transient(self.dialog)
-        error_window.grab_set()
-
-        # 主框架
-        main_frame = ttk.Frame(error_window, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        # 错误图标和标题
-        error_title_frame = ttk.Frame(main_frame)
-        error_title_frame.pack(fill=tk.X, pady=(0, 10))
-
-        error_label = ttk.Label(error_title_frame,
-                               text="JSON格式错误",
-                               font=("微软雅黑", 16, "bold"),
-                               foreground="#DC143C")
-        error_label.pack()
-
-        # 错误详情
-        details_frame = ttk.LabelFrame(main_frame, text="错误详情", padding="10")
-        details_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
-
-        # 创建文本区域显示错误信息
-        error_text = tk.Text(details_frame, wrap=tk.WORD, height=8, font=("微软雅黑", 10))
-        error_text.pack(fill=tk.BOTH, expand=True)
-        error_text.insert(tk.END, f"错误信息：{error_msg}\n\n")
-        error_text.insert(tk.END, f"原始错误：{str(original_error)}\n\n")
-        error_text.insert(tk.END, "常见解决方案：\n")
-        error_text.insert(tk.END, "• 检查引号是否正确配对\n")
-        error_text.insert(tk.END, "• 检查逗号是否正确放置\n")
-        error_text.insert(tk.END, "• 检查括号是否正确闭合\n")
-        error_text.insert(tk.END, "• 确认所有字符串都用双引号包围\n")
-        error_text.config(state=tk.DISABLED)
-
-        # 按钮框架
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(10, 0))
-
-        def go_to_error_line():
-            """跳转到错误行"""
-            # 这里可以添加跳转到错误行的逻辑
-            error_window.destroy()
-            messagebox.showinfo("提示", "请检查JSON编辑器中的对应行")
-
-        ttk.Button(button_frame, text="转到错误行",
-                  command=go_to_error_line).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="复制错误",
-                  command=lambda: self.copy_to_clipboard(error_msg)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="关闭",
-                  command=error_window.destroy).pack(side=tk.RIGHT)
-
-        # 居中显示
-        error_window.update_idletasks()
-        x = (error_window.winfo_screenwidth() - error_window.winfo_width()) // 2
-        y = (error_window.winfo_screenheight() - error_window.winfo_height()) // 2
-        error_window.geometry(f"+{x}+{y}")
-
-    def copy_to_clipboard(self, text):
-        """复制文本到剪贴板"""
-        try:
-            import pyperclip
-            pyperclip.copy(text)
-            messagebox.showinfo("提示", "文本已复制到剪贴板")
-        except ImportError:
-            # 如果没有pyperclip，使用tkinter自带的剪贴板
-            self.dialog.clipboard_clear()
-            self.dialog.clipboard_append(text)
-            self.dialog.update()
-            messagebox.showinfo("提示", "文本已复制到剪贴板")
-
-    def close_dialog(self):
-        """关闭对话框"""
-        self.dialog.destroy()
+class RuleFileEditorDialog(_BaseRuleEditorDialog):
+    """规则文件编辑器对话框"""
 
 
 def main():
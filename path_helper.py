@@ -9,8 +9,11 @@
 
 import os
 import sys
+import functools
 
 
+# 两个路径函数的结果只由参数和进程级的基准目录决定，各模块会频繁调用，缓存后只需一次字典查找
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径（用于template等打包资源）
     
@@ -25,6 +28,7 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+@functools.lru_cache(maxsize=None)
 def get_app_path(relative_path=""):
     """获取应用程序运行目录的路径（用于data、output等用户数据目录）
     
@@ -13,6 +13,13 @@ import sys
 import json
 from pathlib import Path
 import traceback
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # 可选依赖：更快的JSON解析
+except ImportError:
+    orjson = None
 
 try:
     import fitz  # PyMuPDF
@@ -28,14 +35,41 @@ except Exception as e:
     fitz = None
     print(f"[ERROR] PyMuPDF加载异常: {e}")
 
+def _iter_pdf_entries(directory):
+    """递归遍历目录，逐个返回PDF文件的DirEntry
+
+    使用os.scandir显式栈遍历，直接使用DirEntry缓存的类型信息，
+    避免rglob为每个条目构造Path并额外stat
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 class PDFProcessor:
     """PDF处理工具类"""
 
+    # 合并时每累积多少页写出一次中间文件，以限制内存占用
+    MERGE_CHECKPOINT_PAGES = 500
+
     def __init__(self, template_file=None):
         self.supported = PyMuPDF is not None
         self.template_file = template_file
         self.template_data = None
         self.template_name = ""
+        # PDF元数据缓存：文件路径 -> (修改时间, 大小, 信息字典)
+        self._pdf_info_cache = {}
 
         if not self.supported:
             print("[WARNING] PDF处理功能需要安装PyMuPDF库")
@@ -50,8 +84,12 @@ class PDFProcessor:
             return False
 
         try:
-            with open(self.template_file, 'r', encoding='utf-8') as f:
-                self.template_data = json.load(f)
+            if orjson is not None:
+                with open(self.template_file, 'rb') as f:
+                    self.template_data = orjson.loads(f.read())
+            else:
+                with open(self.template_file, 'r', encoding='utf-8') as f:
+                    self.template_data = json.load(f)
 
             self.template_name = self.template_data.get('name', Path(self.template_file).stem)
             print(f"已加载模板: {self.template_name}")
@@ -68,12 +106,14 @@ class PDFProcessor:
                 progress_callback(f"❌ 目录不存在: {directory}")
             return []
 
+        # 扫描阶段只取文件系统信息，不打开PDF；页数等元数据在需要时再调用get_pdf_info
         pdf_files = []
-        for file_path in Path(directory).rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() == '.pdf':
-                pdf_info = self.get_pdf_info(str(file_path), directory)
-                if pdf_info:
-                    pdf_files.append(pdf_info)
+        for entry in _iter_pdf_entries(directory):
+            try:
+                file_size = entry.stat().st_size
+            except OSError:
+                continue
+            pdf_files.append(self.get_pdf_info_fast(entry.path, directory, file_size))
 
         if progress_callback:
             progress_callback(f"📄 找到 {len(pdf_files)} 个PDF文件")
@@ -102,6 +142,9 @@ class PDFProcessor:
                 progress_callback("❌ 没有选择PDF文件")
             return False
         
+        merged_doc = None
+        checkpoint_paths = []  # 合并过程中写出的中间文件
+
         try:
             # 创建输出目录
             output_dir = Path(output_path).parent
@@ -112,6 +155,7 @@ class PDFProcessor:
             
             total_files = len(pdf_files)
             total_pages = 0
+            pages_since_checkpoint = 0
             
             for i, pdf_file in enumerate(pdf_files, 1):
                 if progress_callback:
@@ -136,6 +180,7 @@ class PDFProcessor:
                     # 将所有页面插入到合并文档中
                     merged_doc.insert_pdf(doc)
                     total_pages += doc.page_count
+                    pages_since_checkpoint += doc.page_count
                     
                     if progress_callback:
                         progress_callback(f"✅ 已添加 {doc.page_count} 页 - {Path(pdf_file).name}")
@@ -146,6 +191,12 @@ class PDFProcessor:
                     if progress_callback:
                         progress_callback(f"❌ 处理文件出错: {Path(pdf_file).name} - {str(e)}")
                     continue
+
+                # 新增页数达到阈值时写出中间文件并重新打开，已写出的页面不再常驻内存
+                # （写出失败时合并文档已不可用，异常交由外层处理并终止合并）
+                if pages_since_checkpoint >= self.MERGE_CHECKPOINT_PAGES:
+                    merged_doc = self._checkpoint_merged_doc(merged_doc, output_dir, checkpoint_paths)
+                    pages_since_checkpoint = 0
             
             if merged_doc.page_count == 0:
                 merged_doc.close()
@@ -172,6 +223,37 @@ class PDFProcessor:
                 progress_callback(f"❌ PDF合并失败: {str(e)}")
                 progress_callback(f"详细错误: {traceback.format_exc()}")
             return False
+
+        finally:
+            # 清理中间文件（先关闭可能仍打开着中间文件的文档）
+            if merged_doc is not None and not merged_doc.is_closed:
+                merged_doc.close()
+            for checkpoint_path in checkpoint_paths:
+                try:
+                    os.remove(checkpoint_path)
+                except OSError:
+                    pass
+
+    def _checkpoint_merged_doc(self, merged_doc, output_dir, checkpoint_paths):
+        """将合并中的文档写入中间文件并重新打开
+
+        重新打开的文档按需从磁盘读取页面，内存占用只与上次写出后新增的页数有关
+        """
+        fd, checkpoint_path = tempfile.mkstemp(prefix='.merging_', suffix='.pdf', dir=output_dir)
+        os.close(fd)
+        # 创建后立即登记，保存失败时也能由调用方清理
+        checkpoint_paths.append(checkpoint_path)
+        merged_doc.save(checkpoint_path)
+        merged_doc.close()
+
+        # 之前的中间文件已完整包含在新文件中，且对应文档已关闭，可以删除
+        for old_path in checkpoint_paths[:-1]:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+        del checkpoint_paths[:-1]
+        return fitz.open(checkpoint_path)
     
     def _format_file_size(self, size_bytes):
         """格式化文件大小"""
@@ -197,10 +279,14 @@ class PDFProcessor:
             return []
         
         valid_files = []
-        
-        for pdf_file in pdf_files:
+
+        # 文件存在性检查只涉及stat，可并发执行以重叠磁盘/网络延迟
+        with ThreadPoolExecutor(max_workers=min(8, len(pdf_files) or 1)) as executor:
+            exists_flags = list(executor.map(os.path.exists, pdf_files))
+
+        for pdf_file, exists in zip(pdf_files, exists_flags):
             try:
-                if not os.path.exists(pdf_file):
+                if not exists:
                     if progress_callback:
                         progress_callback(f"⚠️ 文件不存在: {Path(pdf_file).name}")
                     continue
@@ -210,11 +296,13 @@ class PDFProcessor:
                         progress_callback(f"⚠️ 不是PDF文件: {Path(pdf_file).name}")
                     continue
                 
-                # 尝试打开PDF文件验证
+                # 尝试打开PDF文件验证（PyMuPDF不支持多线程并发访问，因此逐个打开；
+                # 通过get_pdf_info读取，未修改的文件直接命中元数据缓存）
                 try:
-                    doc = fitz.open(pdf_file)
-                    page_count = doc.page_count
-                    doc.close()
+                    pdf_info = self.get_pdf_info(pdf_file)
+                    if 'error' in pdf_info:
+                        raise RuntimeError(pdf_info['error'])
+                    page_count = pdf_info['page_count']
                     
                     if page_count > 0:
                         valid_files.append(pdf_file)
@@ -234,6 +322,37 @@ class PDFProcessor:
         
         return valid_files
     
+    def _relative_path(self, pdf_file, target_dir):
+        """计算相对于目标目录的路径，文件不在目标目录内时返回完整路径"""
+        if not target_dir:
+            return pdf_file
+        try:
+            return str(Path(pdf_file).relative_to(target_dir))
+        except ValueError:
+            return pdf_file
+
+    def get_pdf_info_fast(self, pdf_file, target_dir=None, file_size=None):
+        """
+        获取PDF文件的基本信息（不打开PDF，只使用文件系统信息）
+
+        Args:
+            pdf_file (str): PDF文件路径
+            target_dir (str): 目标目录，用于计算相对路径
+            file_size (int): 已知的文件大小，省去一次stat
+
+        Returns:
+            dict: 包含文件名、路径、大小和相对路径的信息字典
+        """
+        if file_size is None:
+            file_size = os.path.getsize(pdf_file)
+        return {
+            'file_name': os.path.basename(pdf_file),
+            'file_path': pdf_file,
+            'file_size': file_size,
+            'file_size_formatted': self._format_file_size(file_size),
+            'relative_path': self._relative_path(pdf_file, target_dir),
+        }
+
     def get_pdf_info(self, pdf_file, target_dir=None):
         """
         获取PDF文件信息
@@ -248,31 +367,38 @@ class PDFProcessor:
         if not self.supported or fitz is None:
             return None
 
+        # 文件未修改时直接返回缓存的元数据，避免重复打开PDF
+        cache_key = (pdf_file, target_dir)
+        try:
+            st = os.stat(pdf_file)
+            cached = self._pdf_info_cache.get(cache_key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return dict(cached[2])
+        except OSError:
+            st = None
+
         try:
             doc = fitz.open(pdf_file)
+            # 复用上面的stat结果，只在stat失败时再取一次大小
+            file_size = st.st_size if st is not None else os.path.getsize(pdf_file)
             info = {
                 'file_name': Path(pdf_file).name,
                 'file_path': pdf_file,
                 'page_count': doc.page_count,
-                'file_size': os.path.getsize(pdf_file),
-                'file_size_formatted': self._format_file_size(os.path.getsize(pdf_file)),
+                'file_size': file_size,
+                'file_size_formatted': self._format_file_size(file_size),
                 'title': doc.metadata.get('title', '') if doc.metadata else '',
                 'author': doc.metadata.get('author', '') if doc.metadata else '',
                 'subject': doc.metadata.get('subject', '') if doc.metadata else '',
                 'creator': doc.metadata.get('creator', '') if doc.metadata else '',
             }
 
-            # 添加相对路径
-            if target_dir:
-                try:
-                    info['relative_path'] = str(Path(pdf_file).relative_to(target_dir))
-                except ValueError:
-                    # 如果文件不在目标目录内，使用完整路径
-                    info['relative_path'] = pdf_file
-            else:
-                info['relative_path'] = pdf_file
+            # 添加相对路径（文件不在目标目录内时使用完整路径）
+            info['relative_path'] = self._relative_path(pdf_file, target_dir)
 
             doc.close()
+            if st is not None:
+                self._pdf_info_cache[cache_key] = (st.st_mtime_ns, st.st_size, dict(info))
             return info
         except Exception as e:
             return {
@@ -14,12 +14,99 @@
 更新时间：2025-01-20
 """
 
+import codecs
 import json
 import os
-import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # 可选依赖：更快的JSON解析
+except ImportError:
+    orjson = None
+
+# 模板解析函数：优先使用orjson（其JSONDecodeError是json.JSONDecodeError的子类）
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _loads_file_bytes(content: bytes):
+    """
+    解析模板文件的字节内容
+
+    BOM和非UTF-8内容的处理与所用解析器无关，和按UTF-8文本读取时一致：
+    带BOM时报JSON格式错误，非UTF-8内容抛出UnicodeDecodeError
+    """
+    if content.startswith(codecs.BOM_UTF8):
+        # 标准库json.loads(bytes)会自动跳过BOM，orjson则直接拒绝，这里统一按JSON格式错误处理
+        raise json.JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", "", 0)
+    try:
+        return _loads(content)
+    except json.JSONDecodeError:
+        if orjson is not None:
+            # orjson对非UTF-8内容也抛出JSONDecodeError，此时改为抛出解码时的UnicodeDecodeError
+            content.decode('utf-8')
+        raise
+
+def _is_ascii_digits(s: str) -> bool:
+    """判断字符串是否为非空的ASCII数字串"""
+    return s.isascii() and s.isdigit()
+
+
+def _is_semver(s: str) -> bool:
+    """校验版本号格式：主.次 或 主.次.修订（各段均为数字）"""
+    parts = s.split('.')
+    return 2 <= len(parts) <= 3 and all(_is_ascii_digits(p) for p in parts)
+
+
+def _is_iso_date(s: str) -> bool:
+    """校验日期格式：YYYY-MM-DD"""
+    return (len(s) == 10 and s[4] == '-' and s[7] == '-'
+            and _is_ascii_digits(s[:4]) and _is_ascii_digits(s[5:7]) and _is_ascii_digits(s[8:]))
+
+def _iter_json_entries(directory: str):
+    """递归遍历目录，逐个返回JSON文件的DirEntry
+
+    使用os.scandir显式栈遍历，直接复用DirEntry缓存的类型信息，
+    避免os.walk为每个条目额外stat
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.json') and entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+# 报告分隔线
+_SEP60 = "=" * 60
+_SEP80 = "=" * 80
+
+# 每个线程复用一个验证器实例（验证器带有可变状态，不能跨线程共享）
+_TLS = threading.local()
+
+
+def _get_validator() -> 'TemplateValidator':
+    """获取当前线程复用的验证器实例"""
+    validator = getattr(_TLS, 'validator', None)
+    if validator is None:
+        validator = _TLS.validator = TemplateValidator()
+    return validator
+
+
+def _validate_one(template_path: str) -> Dict[str, Any]:
+    """使用当前线程的验证器实例验证单个模板（供线程池并行调用）"""
+    return _get_validator().validate_template(template_path)
 
 class TemplateType(Enum):
     """模板类型枚举"""
@@ -32,41 +119,58 @@ class TemplateType(Enum):
 class TemplateValidator:
     """医疗器械模板验证器"""
 
+    # 实例只保存验证状态，使用__slots__减少内存并加快属性访问
+    __slots__ = ('errors', 'warnings', 'validation_results', 'detected_template_type')
+
+    # 批量验证时启用并行的最少文件数，文件较少时串行更快
+    PARALLEL_MIN_FILES = 8
+
     # 必需字段（所有模板通用）
-    REQUIRED_FIELDS = {
+    REQUIRED_FIELDS = frozenset({
         'name',           # 模板名称
         'description',    # 模板描述
         'version',        # 版本号
         'created_date',   # 创建日期
         'author',         # 作者
-    }
+    })
 
     # 特定模板类型的必需字段
     TEMPLATE_SPECIFIC_REQUIRED = {
-        TemplateType.FOLDER: {'rules'},
-        TemplateType.RENAME: {'rules'},
-        TemplateType.DATA_READ: {'rules'},
-        TemplateType.CLEAN: {'exclude_patterns'},
-        TemplateType.WORD_TO_PDF: {'conversion_rules'},
+        TemplateType.FOLDER: frozenset({'rules'}),
+        TemplateType.RENAME: frozenset({'rules'}),
+        TemplateType.DATA_READ: frozenset({'rules'}),
+        TemplateType.CLEAN: frozenset({'exclude_patterns'}),
+        TemplateType.WORD_TO_PDF: frozenset({'conversion_rules'}),
     }
 
     # 可选但推荐的字段
-    OPTIONAL_FIELDS = {
+    OPTIONAL_FIELDS = frozenset({
         'keywords',              # 通用关键词（可选）
         'folder_structure',      # 文件夹结构（可选）
         'documentation',         # 文档链接（可选）
         'supported_extensions',  # 支持的文件扩展名（可选）
         'exclude_patterns',      # 排除模式（可选）
         'conversion_rules',      # 转换规则（可选）
-    }
+        'template_type',         # 模板类型声明，如 rename_templates（可选，存在时跳过类型推断）
+    })
 
     # 有效文件扩展名
-    VALID_EXTENSIONS = {
+    VALID_EXTENSIONS = frozenset({
         '.pdf', '.doc', '.docx', '.jpg', '.jpeg', '.png',
         '.bmp', '.gif', '.tiff', '.tif', '.webp', '.xlsx', '.xls', '.pptx'
-    }
+    })
+
+    # 数据读取规则的标准type取值
+    DATA_READ_TYPES = frozenset({'folder', 'file', 'pattern'})
+
+    # Word转PDF规则支持的源格式
+    WORD_SOURCE_FORMATS = frozenset({'.doc', '.docx'})
 
     def __init__(self):
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """重置验证状态（每次验证前调用，使实例可重复使用）"""
         self.errors = []
         self.warnings = []
         self.validation_results = {}
@@ -82,16 +186,23 @@ class TemplateValidator:
         Returns:
             TemplateType: 检测到的模板类型，如果无法确定则返回None
         """
+        # 模板显式声明了类型时直接采用，跳过结构推断
+        hint = template_data.get('template_type') if isinstance(template_data, dict) else None
+        if isinstance(hint, str):
+            try:
+                return TemplateType(hint)
+            except ValueError:
+                pass
+
         # 检查文件夹模板的特征
         if 'rules' in template_data and isinstance(template_data['rules'], dict):
             rules = template_data['rules']
-            # 文件夹模板：规则值为列表
-            if rules and all(isinstance(v, list) for v in rules.values() if isinstance(v, (list, dict))):
-                first_val = next(iter(rules.values()))
-                if isinstance(first_val, list):
-                    return TemplateType.FOLDER
-            # 重命名模板：规则值包含keywords、folders、tag等
-            if rules and any('keywords' in v for v in rules.values() if isinstance(v, dict)):
+            # 文件夹模板：规则值为列表（按第一个规则值判断，避免整表扫描）
+            if isinstance(next(iter(rules.values()), None), list):
+                return TemplateType.FOLDER
+            # 重命名模板：规则值包含keywords、folders、tag等（找到即停止）；
+            # 不要求第一个规则值为对象，以便识别并报告格式错误的规则
+            if any(isinstance(v, dict) and 'keywords' in v for v in rules.values()):
                 return TemplateType.RENAME
 
         # 检查数据读取模板的特征
@@ -118,15 +229,7 @@ class TemplateValidator:
         Returns:
             Dict: 验证结果，包含错误、警告和详细信息
         """
-        self.errors = []
-        self.warnings = []
-        self.validation_results = {}
-        self.detected_template_type = None
-
-        # 检查文件是否存在
-        if not os.path.exists(template_path):
-            self.errors.append(f"模板文件不存在: {template_path}")
-            return self._get_result()
+        self._reset_state()
 
         # 检查文件扩展名
         if not template_path.lower().endswith('.json'):
@@ -134,26 +237,23 @@ class TemplateValidator:
             return self._get_result()
 
         try:
-            # 读取并解析JSON
-            with open(template_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content:
-                    self.errors.append("模板文件为空")
-                    return self._get_result()
-
-                template_data = json.loads(content)
-
-            # 自动检测模板类型
-            self.detected_template_type = self.detect_template_type(template_data)
-
-            # 执行各种验证
-            self._validate_basic_structure(template_data)
-            self._validate_required_fields(template_data)
-            self._validate_field_types(template_data)
-            self._validate_template_specific(template_data)
-
-            if self.detected_template_type:
-                self._validate_by_template_type(template_data)
+            # 以字节读取并直接交给JSON解析器（由解析器在C层完成UTF-8解码）
+            # 直接打开文件，由FileNotFoundError判断文件是否存在，省去单独的exists检查
+            try:
+                with open(template_path, 'rb') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                self.errors.append(f"模板文件不存在: {template_path}")
+                return self._get_result()
+            except OSError as e:
+                # 路径是目录、无读取权限等情况
+                self.errors.append(f"无法读取模板文件: {template_path} ({e.strerror or e})")
+                return self._get_result()
+            if not content or content.isspace():
+                self.errors.append("模板文件为空")
+                return self._get_result()
+
+            self._validate_dict(_loads_file_bytes(content))
 
         except json.JSONDecodeError as e:
             self.errors.append(f"JSON格式错误: {str(e)}")
@@ -164,6 +264,20 @@ class TemplateValidator:
 
         return self._get_result()
 
+    def _validate_dict(self, template_data: Dict) -> None:
+        """对已解析的模板数据执行全部验证（文件验证与内容验证共用）"""
+        # 自动检测模板类型
+        self.detected_template_type = self.detect_template_type(template_data)
+
+        # 执行各种验证
+        self._validate_basic_structure(template_data)
+        self._validate_required_fields(template_data)
+        self._validate_field_types(template_data)
+        self._validate_template_specific(template_data)
+
+        if self.detected_template_type:
+            self._validate_by_template_type(template_data)
+
     def _validate_basic_structure(self, data: Dict) -> None:
         """验证基本结构"""
         if not isinstance(data, dict):
@@ -171,7 +285,7 @@ class TemplateValidator:
             return
 
         # 检查是否包含必需字段
-        missing_fields = self.REQUIRED_FIELDS - set(data.keys())
+        missing_fields = self.REQUIRED_FIELDS.difference(data)
         if missing_fields:
             self.errors.append(f"缺少必需字段: {', '.join(missing_fields)}")
 
@@ -198,7 +312,7 @@ class TemplateValidator:
             version = data['version']
             if not isinstance(version, str):
                 self.errors.append("'version'字段必须是字符串")
-            elif not re.match(r'^\d+\.\d+(\.\d+)?$', version):
+            elif not _is_semver(version):
                 self.warnings.append("'version'字段建议使用语义化版本格式，如: 1.0.0")
 
         # 验证created_date字段
@@ -206,7 +320,7 @@ class TemplateValidator:
             date = data['created_date']
             if not isinstance(date, str):
                 self.errors.append("'created_date'字段必须是字符串")
-            elif not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
+            elif not _is_iso_date(date):
                 self.warnings.append("'created_date'字段建议使用YYYY-MM-DD格式")
 
         # 验证author字段
@@ -245,23 +359,16 @@ class TemplateValidator:
         """验证模板特定字段"""
         # 检查特定模板类型的必需字段
         if self.detected_template_type:
-            required = self.TEMPLATE_SPECIFIC_REQUIRED.get(self.detected_template_type, set())
-            missing = required - set(data.keys())
+            required = self.TEMPLATE_SPECIFIC_REQUIRED.get(self.detected_template_type, frozenset())
+            missing = required.difference(data)
             if missing:
                 self.errors.append(f"缺少{self.detected_template_type.value}模板必需字段: {', '.join(missing)}")
 
     def _validate_by_template_type(self, data: Dict) -> None:
         """根据模板类型进行特定验证"""
-        if self.detected_template_type == TemplateType.FOLDER:
-            self._validate_folder_template(data)
-        elif self.detected_template_type == TemplateType.RENAME:
-            self._validate_rename_template(data)
-        elif self.detected_template_type == TemplateType.DATA_READ:
-            self._validate_data_read_template(data)
-        elif self.detected_template_type == TemplateType.CLEAN:
-            self._validate_clean_template(data)
-        elif self.detected_template_type == TemplateType.WORD_TO_PDF:
-            self._validate_word_to_pdf_template(data)
+        validate = self._TYPE_VALIDATORS.get(self.detected_template_type)
+        if validate:
+            validate(self, data)
 
     def _validate_folder_template(self, data: Dict) -> None:
         """验证文件夹模板"""
@@ -364,7 +471,7 @@ class TemplateValidator:
             # 验证type
             if 'type' not in rule:
                 self.errors.append(f"数据读取规则[{idx}]缺少'type'字段")
-            elif rule['type'] not in ['folder', 'file', 'pattern']:
+            elif not isinstance(rule['type'], str) or rule['type'] not in self.DATA_READ_TYPES:
                 self.warnings.append(f"数据读取规则[{idx}]的'type'为非标准值: {rule['type']}")
 
     def _validate_clean_template(self, data: Dict) -> None:
@@ -398,14 +505,24 @@ class TemplateValidator:
                 else:
                     # 验证source_format
                     if 'source_format' in rule_config:
-                        if rule_config['source_format'] not in ['.doc', '.docx']:
-                            self.warnings.append(f"规则 '{rule_name}' 的'source_format'为: {rule_config['source_format']}")
+                        source_format = rule_config['source_format']
+                        if not isinstance(source_format, str) or source_format not in self.WORD_SOURCE_FORMATS:
+                            self.warnings.append(f"规则 '{rule_name}' 的'source_format'为: {source_format}")
 
                     # 验证target_format
                     if 'target_format' in rule_config:
                         if rule_config['target_format'] != '.pdf':
                             self.warnings.append(f"规则 '{rule_name}' 的'target_format'应为.pdf，实际为: {rule_config['target_format']}")
 
+    # 模板类型 -> 特定验证方法（新增模板类型时在此登记）
+    _TYPE_VALIDATORS = {
+        TemplateType.FOLDER: _validate_folder_template,
+        TemplateType.RENAME: _validate_rename_template,
+        TemplateType.DATA_READ: _validate_data_read_template,
+        TemplateType.CLEAN: _validate_clean_template,
+        TemplateType.WORD_TO_PDF: _validate_word_to_pdf_template,
+    }
+
     def _get_result(self) -> Dict[str, Any]:
         """获取验证结果"""
         result = {
@@ -439,40 +556,33 @@ class TemplateValidator:
 
     def format_validation_report(self, result: Dict[str, Any]) -> str:
         """格式化验证报告"""
-        report_lines = []
-
-        # 添加标题
-        report_lines.append("=" * 60)
-        report_lines.append("医疗器械模板验证报告")
-        report_lines.append("=" * 60)
-
-        # 模板类型信息
-        report_lines.append(f"\n📋 模板类型识别:")
-        report_lines.append(f"  • 模板类型: {result['template_type_name']} ({result['template_type']})")
-
-        # 验证结果
-        if result['is_valid']:
-            report_lines.append("\n✅ 验证状态: 通过")
-        else:
-            report_lines.append("\n❌ 验证状态: 失败")
+        # 标题与模板类型信息
+        report_lines = [
+            _SEP60,
+            "医疗器械模板验证报告",
+            _SEP60,
+            "\n📋 模板类型识别:",
+            f"  • 模板类型: {result['template_type_name']} ({result['template_type']})",
+            "\n✅ 验证状态: 通过" if result['is_valid'] else "\n❌ 验证状态: 失败",
+        ]
 
         # 错误信息
         if result['errors']:
             report_lines.append("\n🚨 错误信息:")
-            for error in result['errors']:
-                report_lines.append(f"  • {error}")
+            report_lines.extend(f"  • {error}" for error in result['errors'])
 
         # 警告信息
         if result['warnings']:
             report_lines.append("\n⚠️  警告信息:")
-            for warning in result['warnings']:
-                report_lines.append(f"  • {warning}")
+            report_lines.extend(f"  • {warning}" for warning in result['warnings'])
 
         # 统计信息
-        report_lines.append(f"\n📊 验证统计:")
-        report_lines.append(f"  • 错误数量: {result['error_count']}")
-        report_lines.append(f"  • 警告数量: {result['warning_count']}")
-        report_lines.append("=" * 60)
+        report_lines.extend((
+            "\n📊 验证统计:",
+            f"  • 错误数量: {result['error_count']}",
+            f"  • 警告数量: {result['warning_count']}",
+            _SEP60,
+        ))
 
         return "\n".join(report_lines)
 
@@ -493,29 +603,35 @@ class TemplateValidator:
             return results
 
         # 查找所有JSON文件
-        for root, dirs, files in os.walk(template_dir):
-            for file in files:
-                if file.endswith('.json'):
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, template_dir)
-                    results[rel_path] = self.validate_template(file_path)
+        abs_paths = [entry.path for entry in _iter_json_entries(template_dir)]
+        rel_paths = [os.path.relpath(path, template_dir) for path in abs_paths]
+
+        if len(abs_paths) < self.PARALLEL_MIN_FILES:
+            for rel_path, file_path in zip(rel_paths, abs_paths):
+                results[rel_path] = self.validate_template(file_path)
+            return results
+
+        # 各模板相互独立，每个文件使用独立的验证器实例并行验证
+        # （打包配置排除了multiprocessing，因此使用线程池重叠文件读取）
+        with ThreadPoolExecutor() as executor:
+            results.update(zip(rel_paths, executor.map(_validate_one, abs_paths)))
 
         return results
 
     def generate_batch_report(self, results: Dict[str, Dict[str, Any]]) -> str:
         """生成批量验证报告"""
-        report_lines = []
-        report_lines.append("\n" + "=" * 80)
-        report_lines.append("批量模板验证报告")
-        report_lines.append("=" * 80)
-
         valid_count = sum(1 for r in results.values() if r['is_valid'])
         invalid_count = len(results) - valid_count
 
-        report_lines.append(f"\n📊 总体统计:")
-        report_lines.append(f"  • 总模板数: {len(results)}")
-        report_lines.append(f"  • 通过验证: {valid_count}")
-        report_lines.append(f"  • 验证失败: {invalid_count}")
+        report_lines = [
+            "\n" + _SEP80,
+            "批量模板验证报告",
+            _SEP80,
+            "\n📊 总体统计:",
+            f"  • 总模板数: {len(results)}",
+            f"  • 通过验证: {valid_count}",
+            f"  • 验证失败: {invalid_count}",
+        ]
 
         # 按模板类型分组
         by_type = {}
@@ -525,19 +641,19 @@ class TemplateValidator:
                 by_type[template_type] = []
             by_type[template_type].append((file_path, result))
 
-        report_lines.append(f"\n📁 按模板类型分类:")
+        report_lines.append("\n📁 按模板类型分类:")
+        append = report_lines.append
         for template_type, items in sorted(by_type.items()):
             valid = sum(1 for _, r in items if r['is_valid'])
-            report_lines.append(f"  • {template_type}: {len(items)}个 (✅ {valid}个通过)")
+            append(f"  • {template_type}: {len(items)}个 (✅ {valid}个通过)")
 
             for file_path, result in items:
                 status = "✅" if result['is_valid'] else "❌"
-                report_lines.append(f"    {status} {file_path}")
-                if result['errors']:
-                    for error in result['errors'][:2]:  # 只显示前两个错误
-                        report_lines.append(f"       • {error}")
+                append(f"    {status} {file_path}")
+                # 只显示前两个错误
+                report_lines.extend(f"       • {error}" for error in result['errors'][:2])
 
-        report_lines.append("\n" + "=" * 80)
+        append("\n" + _SEP80)
         return "\n".join(report_lines)
 
 
@@ -551,7 +667,7 @@ def validate_template_file(file_path: str) -> str:
     Returns:
         str: 格式化的验证报告
     """
-    validator = TemplateValidator()
+    validator = _get_validator()
     result = validator.validate_template(file_path)
     return validator.format_validation_report(result)
 
@@ -567,20 +683,11 @@ def validate_template_content(content: str, filename: str = "模板内容") -> s
     Returns:
         str: 格式化的验证报告
     """
-    validator = TemplateValidator()
+    validator = _get_validator()
+    validator._reset_state()
 
     try:
-        template_data = json.loads(content)
-        # 自动检测模板类型
-        validator.detected_template_type = validator.detect_template_type(template_data)
-        # 执行验证
-        validator._validate_basic_structure(template_data)
-        validator._validate_required_fields(template_data)
-        validator._validate_field_types(template_data)
-        validator._validate_template_specific(template_data)
-
-        if validator.detected_template_type:
-            validator._validate_by_template_type(template_data)
+        validator._validate_dict(_loads(content))
     except json.JSONDecodeError as e:
         validator.errors.append(f"JSON格式错误: {str(e)}")
     except Exception as e:
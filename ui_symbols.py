@@ -7,59 +7,64 @@ UI符号配置
 作者：Lxx
 """
 
+from types import MappingProxyType
+
 # 是否使用emoji（Windows Tkinter不支持彩色emoji，建议设为False）
 USE_EMOJI = False
 
-if USE_EMOJI:
-    # Emoji 符号
-    SYMBOLS = {
-        'package': '📦',
-        'folder': '📁',
-        'file': '📄',
-        'success': '✅',
-        'error': '❌',
-        'warning': '⚠️',
-        'info': 'ℹ️',
-        'search': '🔍',
-        'rocket': '🚀',
-        'chart': '📊',
-        'target': '🎯',
-        'memo': '📝',
-        'skip': '⏭️',
-        'arrow_right': '→',
-        'arrow_down': '↓',
-        'check': '✓',
-        'cross': '✗',
-        'bullet': '•',
-        'tag': '[Tag]',
-        'clean': '[Clean]',
-        'word': '[File]',
-    }
-else:
-    # 文本符号（兼容性更好）
-    SYMBOLS = {
-        'package': '[包]',
-        'folder': '[夹]',
-        'file': '[文]',
-        'success': '[√]',
-        'error': '[×]',
-        'warning': '[!]',
-        'info': '[i]',
-        'search': '[搜]',
-        'rocket': '[>]',
-        'chart': '[图]',
-        'target': '[*]',
-        'memo': '[记]',
-        'skip': '[跳]',
-        'arrow_right': '->',
-        'arrow_down': '|',
-        'check': '√',
-        'cross': '×',
-        'bullet': '·',
-        'tag': '[Tag]',
-        'clean': '[Clean]',
-        'word': '[File]',
-    }
+# Emoji 符号
+_SYMBOLS_EMOJI = {
+    'package': '📦',
+    'folder': '📁',
+    'file': '📄',
+    'success': '✅',
+    'error': '❌',
+    'warning': '⚠️',
+    'info': 'ℹ️',
+    'search': '🔍',
+    'rocket': '🚀',
+    'chart': '📊',
+    'target': '🎯',
+    'memo': '📝',
+    'skip': '⏭️',
+    'arrow_right': '→',
+    'arrow_down': '↓',
+    'check': '✓',
+    'cross': '✗',
+    'bullet': '•',
+    'tag': '[Tag]',
+    'clean': '[Clean]',
+    'word': '[File]',
+}
+
+# 文本符号（兼容性更好）
+_SYMBOLS_TEXT = {
+    'package': '[包]',
+    'folder': '[夹]',
+    'file': '[文]',
+    'success': '[√]',
+    'error': '[×]',
+    'warning': '[!]',
+    'info': '[i]',
+    'search': '[搜]',
+    'rocket': '[>]',
+    'chart': '[图]',
+    'target': '[*]',
+    'memo': '[记]',
+    'skip': '[跳]',
+    'arrow_right': '->',
+    'arrow_down': '|',
+    'check': '√',
+    'cross': '×',
+    'bullet': '·',
+    'tag': '[Tag]',
+    'clean': '[Clean]',
+    'word': '[File]',
+}
+
+
+# 只读符号表（导入时确定一次，防止运行时被意外修改）
+SYMBOLS = MappingProxyType(_SYMBOLS_EMOJI if USE_EMOJI else _SYMBOLS_TEXT)
 
 
 def get_symbol(key):
@@ -67,22 +72,5 @@ def get_symbol(key):
     return SYMBOLS.get(key, '')
 
 
-# 便捷访问
-package = SYMBOLS['package']
-folder = SYMBOLS['folder']
-file = SYMBOLS['file']
-success = SYMBOLS['success']
-error = SYMBOLS['error']
-warning = SYMBOLS['warning']
-info = SYMBOLS['info']
-search = SYMBOLS['search']
-rocket = SYMBOLS['rocket']
-chart = SYMBOLS['chart']
-target = SYMBOLS['target']
-memo = SYMBOLS['memo']
-skip = SYMBOLS['skip']
-arrow_right = SYMBOLS['arrow_right']
-arrow_down = SYMBOLS['arrow_down']
-check = SYMBOLS['check']
-cross = SYMBOLS['cross']
-bullet = SYMBOLS['bullet']
+# 便捷访问：将每个符号导出为模块级名称（如 ui_symbols.package）
+globals().update(SYMBOLS)
@@ -13,11 +13,33 @@ import os
 import re
 import json
 import sys
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
 from pathlib import Path
 
 from path_helper import get_resource_path, get_app_path
 
 
+# 已解析的重命名模板缓存：以目录中各JSON文件的(文件名, mtime_ns, size)为签名，
+# 模板文件未变化时各个实例直接复用，避免每个材料包都重新读取和解析全部模板
+_TEMPLATE_CACHE = {"signature": None, "templates": None}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def _template_dir_signature(templates_dir):
+    """获取模板目录中所有JSON文件的签名（文件被修改、新增或删除时签名改变）"""
+    signature = []
+    with os.scandir(templates_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                st = entry.stat()
+                signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    signature.sort()
+    return tuple(signature)
+
+
 class UniversalFileRenamer:
     def __init__(self, template_name="牙科手机模板"):
         # 从templates目录加载模板文件
@@ -37,7 +59,47 @@ class UniversalFileRenamer:
         default_extensions = [".pdf", ".doc", ".docx", ".xlsx", ".png", ".jpg", ".jpeg"]
         raw_extensions = template_data.get("supported_extensions", default_extensions)
         self.supported_extensions = [ext.lower() for ext in raw_extensions]
+        self._prepare_matchers()
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_substring_regex(words):
+        """将子串元组编译为一个交替正则（任一子串出现即匹配），为空时返回None
+
+        结果按子串元组缓存，同一模板被多个实例使用时无需重复编译
+        """
+        if not words:
+            return None
+        return re.compile("|".join(map(re.escape, words)))
+
+    def _prepare_matchers(self):
+        """为当前模板的每条规则预编译关键词和文件夹匹配正则，并缓存标签"""
+        self._keyword_regex = {}
+        self._folder_regex = {}
+        # 文件名过滤：扩展名受支持且不含'#'（已加标签的文件跳过），纯字符串判断，无需stat
+        if self.supported_extensions:
+            self._file_filter_re = re.compile(
+                "[^#]*(?:" + "|".join(map(re.escape, self.supported_extensions)) + ")",
+                re.IGNORECASE,
+            )
+        else:
+            self._file_filter_re = None
+        # 需要在材料包根目录查找的文件类型（扁平结构）
+        self._root_types = tuple(
+            file_type for file_type, rules in self.file_rules.items()
+            if "" in rules.get("folders", []) or "." in rules.get("folders", [])
+        )
+        self._tags = {
+            file_type: rules["tag"] for file_type, rules in self.file_rules.items() if "tag" in rules
+        }
+        for file_type, rules in self.file_rules.items():
+            self._keyword_regex[file_type] = self._compile_substring_regex(
+                tuple(rules.get("keywords", []))
+            )
+            self._folder_regex[file_type] = self._compile_substring_regex(
+                tuple(f for f in rules.get("folders", []) if f and f != ".")
+            )
+
     def _load_templates(self):
         """从template/rename_templates目录加载所有JSON模板文件"""
         templates = {}
@@ -49,6 +111,16 @@ class UniversalFileRenamer:
             print(f"[DEBUG] 资源基础路径: {get_resource_path('.')}")
             return templates
         
+        try:
+            signature = _template_dir_signature(templates_dir)
+        except OSError:
+            signature = None
+
+        with _TEMPLATE_CACHE_LOCK:
+            if signature is not None and _TEMPLATE_CACHE["signature"] == signature:
+                # 返回浅拷贝，避免调用方增删键影响缓存
+                return dict(_TEMPLATE_CACHE["templates"])
+
         # 遍历template/rename_templates目录中的所有JSON文件
         for json_file in templates_dir.glob("*.json"):
             try:
@@ -65,6 +137,10 @@ class UniversalFileRenamer:
         
         if not templates:
             print("❌ 没有找到有效的模板文件")
+        elif signature is not None:
+            with _TEMPLATE_CACHE_LOCK:
+                _TEMPLATE_CACHE["signature"] = signature
+                _TEMPLATE_CACHE["templates"] = dict(templates)
         
         return templates
     
@@ -89,6 +165,7 @@ class UniversalFileRenamer:
             default_extensions = [".pdf", ".doc", ".docx", ".xlsx", ".png", ".jpg", ".jpeg"]
             raw_extensions = template_data.get("supported_extensions", default_extensions)
             self.supported_extensions = [ext.lower() for ext in raw_extensions]
+            self._prepare_matchers()
             return True
         return False
     
@@ -130,72 +207,84 @@ class UniversalFileRenamer:
         
         for file_type, rules in self.file_rules.items():
             found_files[file_type] = []
+        # 每种文件类型已添加的路径集合，用于O(1)去重
+        # （作为局部变量传递，同一实例可被多个线程同时用于不同材料包）
+        seen = {file_type: set() for file_type in self.file_rules}
         
+        # 根目录的文件条目，供扁平结构查找复用
+        base_entries = None
+
         # 递归遍历所有子文件夹，找到模板指定的文件夹
-        for root, dirs, files in os.walk(base_folder):
-            current_folder_name = os.path.basename(root)
+        # 使用os.scandir显式栈（先序，与os.walk顺序一致），每个文件夹只列举一次，
+        # 并直接复用DirEntry缓存的类型信息，避免逐个文件stat
+        # 栈中保存(路径, 文件夹名)，文件夹名直接取自DirEntry，无需再对路径做basename
+        stack = [(base_folder, os.path.basename(base_folder))]
+        while stack:
+            root, current_folder_name = stack.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                # 忽略文件夹访问错误
+                continue
+
+            file_entries = []
+            sub_dirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dirs.append((entry.path, entry.name))
+                        continue
+                except OSError:
+                    pass
+                file_entries.append(entry)
+            stack.extend(reversed(sub_dirs))
+
+            if root == base_folder:
+                base_entries = file_entries
             
             # 检查当前文件夹是否匹配任何规则中的指定文件夹
             for file_type, rules in self.file_rules.items():
-                target_folders = rules.get("folders", [])
-                
-                # 检查当前文件夹名是否在目标文件夹列表中
-                folder_matched = False
-                for target_folder in target_folders:
-                    if not target_folder or target_folder == ".":
-                        continue
-                    # 支持部分匹配（文件夹名包含目标名称）
-                    if target_folder in current_folder_name or current_folder_name == target_folder:
-                        folder_matched = True
-                        break
-                
-                if folder_matched:
+                # 检查当前文件夹名是否匹配目标文件夹（支持部分匹配：文件夹名包含目标名称）
+                folder_regex = self._folder_regex[file_type]
+                if folder_regex is not None and folder_regex.search(current_folder_name):
                     # 在匹配的文件夹中查找符合关键词的文件
-                    self._search_files_in_folder(
-                        root, current_folder_name, file_type, rules, found_files
+                    self._search_files_in_folder_entries(
+                        file_entries, current_folder_name, file_type, rules, found_files, seen
                     )
         
-        # 同时在根目录查找（扁平结构）
-        for file_type, rules in self.file_rules.items():
-            target_folders = rules.get("folders", [])
-            if "" in target_folders or "." in target_folders:
-                self._search_files_in_folder(
-                    base_folder, "", file_type, rules, found_files
+        # 同时在根目录查找（扁平结构），复用遍历时已列举的根目录条目，无需再次读取目录
+        if base_entries is not None:
+            for file_type in self._root_types:
+                self._search_files_in_folder_entries(
+                    base_entries, "", file_type, self.file_rules[file_type], found_files, seen
                 )
         
         return found_files
     
-    def _search_files_in_folder(self, folder_path, folder_name, file_type, rules, found_files):
+    def _search_files_in_folder_entries(self, entries, folder_name, file_type, rules, found_files, seen):
         """
-        在指定文件夹中搜索符合规则的文件
+        在已列举的文件夹条目中搜索符合规则的文件
         """
+        keyword_regex = self._keyword_regex[file_type]
+        file_filter = self._file_filter_re
+        if keyword_regex is None or file_filter is None:
+            return
+
         try:
-            for file in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, file)
+            for entry in entries:
+                file = entry.name
+                file_path = entry.path
                 
-                # 处理模板中支持的文件类型
-                if (file.lower().endswith(tuple(self.supported_extensions)) and
-                    os.path.isfile(file_path)):
-                    
-                    # 检查是否已经添加了标签（任何标签）
-                    if '#' in file:
-                        continue  # 跳过已经有标签的文件
+                # 处理模板中支持的文件类型，跳过已经有标签（任何标签）的文件
+                if file_filter.fullmatch(file) and entry.is_file():
                     
                     # 检查文件名是否包含关键词
-                    file_matched = False
-                    for keyword in rules["keywords"]:
-                        if keyword in file:
-                            file_matched = True
-                            break
-                    
-                    if file_matched:
+                    if keyword_regex.search(file):
                         # 检查是否已经添加过相同文件（避免重复）
-                        already_added = any(
-                            existing['path'] == file_path 
-                            for existing in found_files[file_type]
-                        )
-                        
-                        if not already_added:
+                        seen_paths = seen[file_type]
+                        if file_path not in seen_paths:
+                            seen_paths.add(file_path)
                             relative_path = os.path.join(folder_name, file) if folder_name else file
                             found_files[file_type].append({
                                 'path': file_path,
@@ -214,12 +303,110 @@ class UniversalFileRenamer:
         original_name = file_info['filename']
         
         # 为所有文件添加标签
-        name_without_ext = Path(original_name).stem
-        extension = Path(original_name).suffix
-        tag = self.file_rules[file_type]["tag"]
+        name_without_ext, extension = os.path.splitext(original_name)
+        tag = self._tags[file_type]
         
         return f"{name_without_ext}{tag}{extension}"
     
+    def _rename_from_found(self, found_files, verbose=True, log=None):
+        """
+        对find_target_files找到的文件执行重命名
+
+        每个目录只列举一次文件名，用名称集合判断目标文件是否已存在，
+        避免对每个文件单独调用os.path.exists；输出通过log回调写出（默认print）
+
+        返回:
+            (成功数, 跳过数, 失败数)
+        """
+        # 在调用时解析print，使GUI对builtins.print的重定向生效
+        log = log or print
+        renamed_count = 0
+        skipped_count = 0
+        failed_count = 0
+        # 目录 -> 该目录下已存在的文件名集合（按系统规则规范化大小写）
+        dir_names = {}
+
+        for file_type, files in found_files.items():
+            if not files:
+                continue
+
+            if verbose:
+                log(f"\n📁 处理 {file_type}:")
+
+            for file_info in files:
+                original_path = file_info['path']
+                dir_path = os.path.dirname(original_path)
+                new_filename = self.generate_new_name(file_info, file_type)
+                new_path = os.path.join(dir_path, new_filename)
+
+                if verbose:
+                    log(f"  📄 {file_info['filename']}")
+                    log(f"     -> {new_filename}")
+
+                existing = dir_names.get(dir_path)
+                if existing is None:
+                    try:
+                        existing = {os.path.normcase(name) for name in os.listdir(dir_path)}
+                    except OSError:
+                        existing = False
+                    dir_names[dir_path] = existing
+
+                # 检查新文件是否已存在
+                if existing is False:
+                    target_exists = os.path.exists(new_path)
+                else:
+                    target_exists = os.path.normcase(new_filename) in existing
+                if target_exists:
+                    if verbose:
+                        log(f"     ⏭️  目标文件已存在，跳过")
+                    else:
+                        log(f"  ⏭️  跳过 {file_type}: 文件已存在标签")
+                    skipped_count += 1
+                    continue
+
+                try:
+                    os.rename(original_path, new_path)
+                    if verbose:
+                        log(f"     ✅ 重命名成功")
+                    else:
+                        log(f"  ✅ 重命名 {file_type}: {new_filename}")
+                    renamed_count += 1
+                    if existing is not False:
+                        existing.discard(os.path.normcase(file_info['filename']))
+                        existing.add(os.path.normcase(new_filename))
+                except Exception as e:
+                    if verbose:
+                        log(f"     ❌ 重命名失败: {e}")
+                    else:
+                        log(f"  ❌ 失败 {file_type}: {e}")
+                    failed_count += 1
+
+        return renamed_count, skipped_count, failed_count
+
+    def rename_files_silent(self, base_folder, log=None):
+        """
+        查找并直接重命名文件（不需要确认，供批量处理使用）
+
+        返回:
+            (成功数, 跳过数, 失败数)
+        """
+        log = log or print
+        found_files = self.find_target_files(base_folder)
+
+        package_file_count = sum(len(files) for files in found_files.values())
+        if package_file_count == 0:
+            log("⚠️  没有找到需要重命名的文件")
+            return 0, 0, 0
+
+        log(f"📊 找到 {package_file_count} 个文件需要重命名")
+
+        # 执行重命名（静默模式）
+        renamed_count, skipped_count, failed_count = self._rename_from_found(
+            found_files, verbose=False, log=log
+        )
+        log(f"  📊 本文件夹结果: 成功{renamed_count} 跳过{skipped_count} 失败{failed_count}")
+        return renamed_count, skipped_count, failed_count
+
     def rename_files(self, base_folder):
         """
         执行文件重命名
@@ -257,37 +444,7 @@ class UniversalFileRenamer:
         print(f"\n🚀 开始重命名操作...")
         print("=" * 80)
         
-        renamed_count = 0
-        failed_count = 0
-        skipped_count = 0
-        
-        for file_type, files in found_files.items():
-            if not files:
-                continue
-                
-            print(f"\n📁 处理 {file_type}:")
-            
-            for file_info in files:
-                original_path = file_info['path']
-                new_filename = self.generate_new_name(file_info, file_type)
-                new_path = os.path.join(os.path.dirname(original_path), new_filename)
-                
-                print(f"  📄 {file_info['filename']}")
-                print(f"     -> {new_filename}")
-                
-                # 检查新文件是否已存在
-                if os.path.exists(new_path):
-                    print(f"     ⏭️  目标文件已存在，跳过")
-                    skipped_count += 1
-                    continue
-                
-                try:
-                    os.rename(original_path, new_path)
-                    print(f"     ✅ 重命名成功")
-                    renamed_count += 1
-                except Exception as e:
-                    print(f"     ❌ 重命名失败: {e}")
-                    failed_count += 1
+        renamed_count, skipped_count, failed_count = self._rename_from_found(found_files)
         
         # 显示统计结果
         print("\n" + "=" * 80)
@@ -314,25 +471,39 @@ def process_material_package(folder_path, template_name="牙科手机模板"):
     renamer = UniversalFileRenamer(template_name)
     return renamer.rename_files(folder_path)
 
+@functools.lru_cache(maxsize=32)
+def _load_folder_patterns(template_path, mtime_ns, size):
+    """读取材料包查找模板中的文件夹模式
+
+    以(路径, mtime_ns, size)为缓存键，模板文件被修改后会自动重新读取
+    """
+    with open(template_path, 'r', encoding='utf-8') as f:
+        template_data = json.load(f)
+    patterns = []
+    # 材料包查找模板的格式是rules数组，每个rule有pattern和type字段
+    rules = template_data.get('rules', [])
+    for rule in rules:
+        if rule.get('type') == 'folder':
+            pattern = rule.get('pattern', '')
+            if pattern:
+                patterns.append(pattern)
+    return tuple(patterns)
+
+
 def _get_folder_patterns_from_template(template_name=None):
     """从模板中获取文件夹匹配模式"""
     if template_name:
         # 尝试从模板获取模式
         template_path = get_resource_path(os.path.join("template", "data_read_templates", f"{template_name}.json"))
-        if os.path.exists(template_path):
+        try:
+            st = os.stat(template_path)
+        except OSError:
+            st = None
+        if st is not None:
             try:
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    template_data = json.load(f)
-                patterns = []
-                # 材料包查找模板的格式是rules数组，每个rule有pattern和type字段
-                rules = template_data.get('rules', [])
-                for rule in rules:
-                    if rule.get('type') == 'folder':
-                        pattern = rule.get('pattern', '')
-                        if pattern:
-                            patterns.append(pattern)
+                patterns = _load_folder_patterns(template_path, st.st_mtime_ns, st.st_size)
                 if patterns:
-                    return patterns
+                    return list(patterns)
             except Exception as e:
                 print(f"⚠️  读取模板失败 {template_name}: {e}")
 
@@ -340,13 +511,16 @@ def _get_folder_patterns_from_template(template_name=None):
     return ["*材料包", "*_*_*", "*0010600*"]
 
 
-def _match_folder_patterns(folder_name, patterns):
-    """检查文件夹名是否匹配任一模式"""
-    import fnmatch
-    for pattern in patterns:
-        if fnmatch.fnmatch(folder_name, pattern):
-            return True
-    return False
+def _compile_folder_patterns(patterns):
+    """将多个通配符模式预编译为一个正则（与fnmatch.fnmatch规则一致，含大小写规范化）"""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{translate(os.path.normcase(p))})" for p in patterns))
+
+
+def _match_folder_patterns(folder_name, folder_regex):
+    """检查文件夹名是否匹配任一模式（folder_regex由_compile_folder_patterns生成）"""
+    return folder_regex is not None and folder_regex.match(os.path.normcase(folder_name)) is not None
 
 
 def scan_data_folder(template_name=None):
@@ -361,83 +535,119 @@ def scan_data_folder(template_name=None):
         template_name: 材料包查找模板名称，如果为None则使用默认规则
     """
     # 获取文件夹匹配模式
-    folder_patterns = _get_folder_patterns_from_template(template_name)
+    folder_patterns = _compile_folder_patterns(_get_folder_patterns_from_template(template_name))
 
     data_folder = get_app_path("data")
-    material_packages = []
 
     if not os.path.exists(data_folder):
         print(f"❌ data文件夹不存在: {data_folder}")
         return []
 
+    return sorted(_iter_material_packages(data_folder, folder_patterns))
+
+
+def _iter_material_packages(data_folder, folder_patterns):
+    """
+    逐个返回data文件夹中的材料包路径
+
+    使用os.scandir遍历，文件夹类型直接取自DirEntry，不再对每个条目单独stat
+    """
+    try:
+        with os.scandir(data_folder) as entries:
+            top_entries = [entry for entry in entries if entry.is_dir()]
+    except OSError as e:
+        print(f"⚠️  无法读取data文件夹 {data_folder}: {e}")
+        return
+
     # 遍历data文件夹中的所有子文件夹
-    for folder_name in os.listdir(data_folder):
-        folder_path = os.path.join(data_folder, folder_name)
+    for entry in top_entries:
+        # 文件夹名匹配规则或具有医疗器械结构时作为材料包
+        if (_match_folder_patterns(entry.name, folder_patterns) or
+                has_medical_device_structure(entry.path)):
+            yield entry.path
 
-        # 检查是否是文件夹
-        if os.path.isdir(folder_path):
-            try:
-                # 使用模板规则或默认规则检查文件夹
-                if _match_folder_patterns(folder_name, folder_patterns):
-                    # 如果文件夹名匹配规则，进一步检查是否包含医疗器械结构
-                    if has_medical_device_structure(folder_path):
-                        material_packages.append(folder_path)
-                    else:
-                        # 如果不检查结构，直接添加（适用于简单的文件夹名匹配）
-                        material_packages.append(folder_path)
+        # 无论是否匹配，都需要检查子文件夹（材料包可能在嵌套目录中；
+        # 扁平规则只作用于所处理材料包的根目录，嵌套材料包根目录下的文件需单独处理）
+        try:
+            with os.scandir(entry.path) as sub_entries:
+                sub_dirs = [sub for sub in sub_entries if sub.is_dir()]
+        except OSError:
+            # 如果无法访问子文件夹，跳过
+            continue
+
+        for sub in sub_dirs:
+            # 检查子文件夹是否是材料包
+            if (_match_folder_patterns(sub.name, folder_patterns) or
+                    has_medical_device_structure(sub.path)):
+                yield sub.path
+
+# 典型的医疗器械申报文件夹（最常出现的放在前面，以便尽早满足判定条件）
+MEDICAL_INDICATORS = (
+    "1.监管信息-1.2申请表",
+    "7.营业执照",
+    "1.监管信息-1.4产品列表",
+    "2.综述资料-2.3产品描述",
+    "3.非临床资料-3.4产品技术要求及检验报告",
+    "5.产品说明书和标签样稿-5.2产品说明书",
+)
 
-                # 无论是否匹配，都需要检查子文件夹（因为材料包可能在嵌套目录中）
-                try:
-                    for sub_folder_name in os.listdir(folder_path):
-                        sub_folder_path = os.path.join(folder_path, sub_folder_name)
-
-                        if os.path.isdir(sub_folder_path):
-                            # 检查子文件夹是否是材料包
-                            if (_match_folder_patterns(sub_folder_name, folder_patterns) or
-                                has_medical_device_structure(sub_folder_path)):
-                                material_packages.append(sub_folder_path)
-                except (PermissionError, OSError):
-                    # 如果无法访问子文件夹，跳过
-                    pass
-                    
-            except PermissionError:
-                # 跳过无权限访问的文件夹
-                print(f"⚠️  跳过无权限访问的文件夹: {folder_path}")
-                continue
-            except Exception as e:
-                # 跳过其他错误的文件夹
-                print(f"⚠️  跳过错误文件夹 {folder_path}: {e}")
-                continue
-    
-    return sorted(material_packages)
 
 def has_medical_device_structure(folder_path):
     """
     检查文件夹是否具有医疗器械材料包的文件夹结构
     """
     try:
-        subfolders = [item for item in os.listdir(folder_path) 
-                     if os.path.isdir(os.path.join(folder_path, item))]
-        
-        # 检查是否包含典型的医疗器械申报文件夹
-        medical_indicators = [
-            "1.监管信息-1.2申请表",
-            "1.监管信息-1.4产品列表", 
-            "2.综述资料-2.3产品描述",
-            "3.非临床资料-3.4产品技术要求及检验报告",
-            "5.产品说明书和标签样稿-5.2产品说明书",
-            "7.营业执照"
-        ]
-        
-        # 如果包含至少2个典型文件夹，认为是医疗器械材料包
-        found_indicators = sum(1 for indicator in medical_indicators 
-                             if indicator in subfolders)
-        
-        return found_indicators >= 2
-        
+        with os.scandir(folder_path) as entries:
+            subfolders = {entry.name for entry in entries if entry.is_dir()}
     except Exception:
         return False
 
+    # 如果包含至少2个典型文件夹，认为是医疗器械材料包（找到2个即返回）
+    found_indicators = 0
+    for indicator in MEDICAL_INDICATORS:
+        if indicator in subfolders:
+            found_indicators += 1
+            if found_indicators >= 2:
+                return True
+    return False
+
+def _group_nested_packages(material_packages):
+    """将互相嵌套的材料包分为同一组（组内保持原顺序），不同组之间可以并行处理"""
+    groups = []
+    group_roots = []
+    for package in material_packages:
+        for root, group in zip(group_roots, groups):
+            if package.startswith(root + os.sep) or root.startswith(package + os.sep):
+                group.append(package)
+                break
+        else:
+            group_roots.append(package)
+            groups.append([package])
+    return groups
+
+
+def _process_one_package(package, renamer):
+    """
+    查找并重命名单个材料包中的文件
+
+    返回:
+        (成功重命名数, 输出行列表)
+    """
+    lines = []
+    try:
+        renamed_count, _, _ = renamer.rename_files_silent(package, log=lines.append)
+        return renamed_count, lines
+
+    except Exception as e:
+        lines.append(f"  ❌ 处理文件夹时出错: {e}")
+        return 0, lines
+
+
+def _process_package_group(group, renamer):
+    """按顺序处理一组材料包（供线程池调用），返回 {材料包路径: (成功重命名数, 输出行列表)}"""
+    return {package: _process_one_package(package, renamer) for package in group}
+
+
 def batch_process_all_data(template_name="牙科手机模板", gui_mode=False, confirmation_callback=None, material_package_template=None):
     """
     批量处理data文件夹中的所有材料包文件夹
@@ -489,7 +699,6 @@ def batch_process_all_data(template_name="牙科手机模板", gui_mode=False, c
         if confirmation_callback:
             message = f"找到 {len(material_packages)} 个材料包文件夹，即将使用模板「{template_info['name']}」进行批量重命名：\n\n"
             for i, package in enumerate(material_packages[:10], 1):  # 最多显示10个
-                relative_path = os.path.relpath(package, "data")
                 package_name = os.path.basename(package)
                 message += f"{i:2d}. {package_name}\n"
             if len(material_packages) > 10:
@@ -508,65 +717,33 @@ def batch_process_all_data(template_name="牙科手机模板", gui_mode=False, c
     print(f"\n🚀 开始批量处理...")
     print("=" * 80)
     
-    # 处理每个材料包文件夹
-    for i, package in enumerate(material_packages, 1):
-        package_name = os.path.basename(package)
-        print(f"\n📁 [{i}/{total_packages}] 处理: {package_name}")
-        print("-" * 60)
-        
-        try:
-            renamer_instance = UniversalFileRenamer(template_name)
-            
-            # 查找目标文件（不执行重命名，只统计）
-            found_files = renamer_instance.find_target_files(package)
-            
-            package_file_count = sum(len(files) for files in found_files.values())
-            if package_file_count == 0:
-                print("⚠️  没有找到需要重命名的文件")
-                continue
-            
-            print(f"📊 找到 {package_file_count} 个文件需要重命名")
-            
-            # 执行重命名（静默模式）
-            renamed_count = 0
-            skipped_count = 0
-            failed_count = 0
-            
-            for file_type, files in found_files.items():
-                if not files:
-                    continue
-                
-                for file_info in files:
-                    original_path = file_info['path']
-                    new_filename = renamer_instance.generate_new_name(file_info, file_type)
-                    new_path = os.path.join(os.path.dirname(original_path), new_filename)
-                    
-                    # 检查新文件是否已存在
-                    if os.path.exists(new_path):
-                        print(f"  ⏭️  跳过 {file_type}: 文件已存在标签")
-                        skipped_count += 1
-                        continue
-                    
-                    try:
-                        os.rename(original_path, new_path)
-                        print(f"  ✅ 重命名 {file_type}: {os.path.basename(new_filename)}")
-                        renamed_count += 1
-                    except Exception as e:
-                        print(f"  ❌ 失败 {file_type}: {e}")
-                        failed_count += 1
-            
+    # 各材料包相互独立且以文件系统I/O为主，使用线程池并行处理；
+    # 互相嵌套的材料包放在同一任务中按顺序处理，避免并发重命名同一文件
+    groups = _group_nested_packages(material_packages)
+    max_workers = min(8, (os.cpu_count() or 1) * 2, len(groups))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for group in groups:
+            future = executor.submit(_process_package_group, group, renamer)
+            for package in group:
+                futures[package] = future
+
+        # 按材料包原顺序输出各自的结果
+        for i, package in enumerate(material_packages, 1):
+            package_name = os.path.basename(package)
+            renamed_count, log_lines = futures[package].result()[package]
+
+            # 每个材料包的输出合并为一次print（GUI模式下print被重定向到日志窗口）
+            block = [f"\n📁 [{i}/{total_packages}] 处理: {package_name}", "-" * 60]
+            block.extend(log_lines)
+            # 添加分隔线
+            if i < total_packages:
+                block.append("")
+            print("\n".join(block))
+
             if renamed_count > 0:
                 success_count += 1
                 processed_files += renamed_count
-            
-            print(f"  📊 本文件夹结果: 成功{renamed_count} 跳过{skipped_count} 失败{failed_count}")
-            
-        except Exception as e:
-            print(f"  ❌ 处理文件夹时出错: {e}")
-        
-        # 添加分隔线
-        if i < total_packages:
-            print()
     
     # 显示最终统计结果
     print("\n" + "=" * 80)
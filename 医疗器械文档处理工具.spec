@@ -10,7 +10,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=['matplotlib', 'numpy', 'pandas', 'scipy', 'sklearn', 'tensorflow', 'torch', 'cv2', 'opencv', 'IPython', 'jupyter', 'notebook', 'pytest', 'unittest', 'setuptools', 'pip', 'wheel', 'openai', 'pytesseract', 'email', 'html', 'http', 'xml', 'logging.handlers', 'multiprocessing', 'concurrent', 'asyncio', 'lib2to3', 'distutils', 'pkg_resources'],
+    excludes=['matplotlib', 'numpy', 'pandas', 'scipy', 'sklearn', 'tensorflow', 'torch', 'cv2', 'opencv', 'IPython', 'jupyter', 'notebook', 'pytest', 'unittest', 'setuptools', 'pip', 'wheel', 'openai', 'pytesseract', 'email', 'html', 'http', 'xml', 'logging.handlers', 'multiprocessing', 'asyncio', 'lib2to3', 'distutils', 'pkg_resources'],
     noarchive=False,
     optimize=0,
 )